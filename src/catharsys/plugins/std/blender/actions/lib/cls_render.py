@@ -52,7 +52,15 @@ from catharsys.plugins.std.blender.config.cls_settings_render import (
 )
 from catharsys.plugins.std.blender.config.cls_modify_list import CConfigModifyList
 from catharsys.plugins.std.blender.config.cls_generate_list import CConfigGenerateList
+from .cls_render_times import CRenderTimes
 from catharsys.plugins.std.blender.util import camera as cbu_cam
+from catharsys.plugins.std.blender.util import entry_point as cbu_ep
+from catharsys.plugins.std.blender.util import log as cbu_log
+from catharsys.plugins.std.blender.util import profiling as cbu_prof
+from catharsys.plugins.std.blender.util import textures as cbu_tex
+from catharsys.plugins.std.blender.modify import program as modprog
+from catharsys.plugins.std.blender.modify import eval_cache
+from catharsys.plugins.std.blender.modify import objects as modobj
 from catharsys.plugins.std.blender.animate import objects as animobj
 import catharsys.util as cathutil
 import catharsys.util.config as cathcfg
@@ -333,6 +341,22 @@ class CRender:
 
         self.sJobGroupId = self.dicCfg["sJobGroupId"]
 
+        # Modifier state of a previous configuration refers to the objects of the reverted Blender file
+        modprog.Reset()
+        eval_cache.Invalidate()
+        modobj.ResetSkipState()
+        cbu_tex.Reset()
+
+        # Optional log level of modifiers and generators, e.g. "DEBUG" or "WARNING".
+        # Set for every configuration, as all configurations run in the same Blender process.
+        cbu_log.SetLevel(self.dicCfg.get("sLogLevel", cbu_log.GetLevelByEnv()))
+
+        # Optional profiling of modifiers, evaluators and generators.
+        # Set for every configuration, as all configurations run in the same Blender process.
+        cbu_prof.Enable(
+            convert.DictElementToBool(self.dicCfg, "bProfileModifiers", bDefault=cbu_prof.IsEnabledByEnv())
+        )
+
         self.dicData = self.dicCfg["mConfig"]["mData"]
         if self.dicData is None:
             raise CAnyExcept("No configuration data given")
@@ -401,6 +425,11 @@ class CRender:
         self.xCfgModifier = CConfigModifyList(self.lMod)
         self.xCfgGenerator = CConfigGenerateList(self.lGen)
 
+        # Load the modifier, generator and animator functions of all configs once,
+        # so that resolving them per object and per frame is a dictionary lookup.
+        iEntryPointCnt = cbu_ep.PreloadEntryPoints(self.dicData)
+        self.Print("Pre-loaded {} modifier, generator and animator functions".format(iEntryPointCnt))
+
         self.sPathTrgMain = self.dicCfg.get("sPathTrgMain")
         self.iFrameFirst = self.dicCfg.get("iFrameFirst", 0)
         self.iFrameLast = self.dicCfg.get("iFrameLast", 0)
@@ -502,6 +531,8 @@ class CRender:
     # Clean-up after rendering
     @logFunctionCall
     def Finalize(self):
+        self.ReportProfile()
+
         self.Print("\n>>> Memory usage after render finalize:\n")
         bpy.ops.wm.memory_statistics()
 
@@ -512,6 +543,20 @@ class CRender:
 
     # enddef
 
+    ##############################################################
+    # Print the modifier profile and save it in the log folder of the render output.
+    # Only has an effect if profiling is enabled.
+    def ReportProfile(self):
+        sPathLog = None
+        if self.sPathTrgMain is not None:
+            sPathLog = os.path.join(self.sPathTrgMain, CRenderTimes.sFolder)
+        # endif
+
+        cbu_prof.Report(sPathLog, self.sJobGroupId)
+        cbu_prof.Reset()
+
+    # enddef
+
     ##############################################################
     # Activate selected anycam camera
     @logFunctionCall
@@ -879,6 +924,42 @@ class CRender:
 
     # enddef
 
+    ##############################################################
+    # Number of pixels rendered with the current resolution and render border
+    def _GetRenderPixelCount(self) -> int:
+        xRender = self.xScn.render
+        fScale = xRender.resolution_percentage / 100.0
+        iResX = int(xRender.resolution_x * fScale)
+        iResY = int(xRender.resolution_y * fScale)
+        if xRender.use_border is True:
+            iResX = int(round(iResX * (xRender.border_max_x - xRender.border_min_x)))
+            iResY = int(round(iResY * (xRender.border_max_y - xRender.border_min_y)))
+        # endif
+
+        return max(0, iResX) * max(0, iResY)
+
+    # enddef
+
+    ##############################################################
+    # Number of samples per pixel of the current render settings
+    def _GetRenderSampleCount(self) -> int:
+        if self.bApplyAnnotation is True:
+            return 1
+        # endif
+
+        xCycles = getattr(self.xScn, "cycles", None)
+        if xCycles is None:
+            return 1
+        # endif
+
+        if getattr(xCycles, "progressive", None) == "BRANCHED_PATH":
+            return xCycles.aa_samples
+        # endif
+
+        return xCycles.samples
+
+    # enddef
+
     ##############################################################
     # Create dictionary of runtime variables
     def _GetRuntimeVars(self):
@@ -1200,6 +1281,10 @@ class CRender:
         # This is the easiest and most stable way to get back to the
         # original setup.
         bpy.ops.wm.open_mainfile(filepath=self.sFpBlendOrig)
+        modprog.Reset()
+        eval_cache.Invalidate()
+        modobj.ResetSkipState()
+        cbu_tex.Reset()
 
         # explicitly do a garbage collection
         gc.collect()
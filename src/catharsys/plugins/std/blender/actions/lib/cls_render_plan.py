@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \actions\lib\cls_render_plan.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Dry-run render planner.
+# Evaluates the frames, exposures and output files a render job would create,
+# without starting Blender. Uses the render times recorded by previous
+# render runs to estimate the total wall time.
+
+from typing import Optional
+from pathlib import Path
+
+from anybase import assertion, config
+from anybase import time as anytime
+from anybase.cls_any_error import CAnyError, CAnyError_Message
+from catharsys.plugins.std.action_class.manifest.cls_cfg_manifest_job import (
+    CConfigManifestJob,
+)
+from catharsys.plugins.std.blender.config.cls_compositor import CConfigCompositor
+from catharsys.plugins.std.blender.util import path as cbu_path
+
+from .cls_rsexp import CRsExp
+from .cls_render_times import CRenderTimes
+
+
+########################################################################################
+class CRenderPlan:
+
+    ####################################################################################
+    def __init__(self, *, xJobCfg: CConfigManifestJob):
+
+        # Assert init function argument types
+        assertion.FuncArgTypes()
+
+        self.xJobCfg: CConfigManifestJob = xJobCfg
+        self.lPlans: list[dict] = []
+        self.lWarnings: list[str] = []
+
+    # enddef
+
+    ##########################################################################
+    def Process(self, **kwargs):
+
+        lSupportedArgs = [
+            "iFrameFirst",
+            "iFrameLast",
+            "iFrameStep",
+            "iRenderQuality",
+            "bDoOverwrite",
+            "dSceneFps",
+            "iLineCount",
+            "iRenderResX",
+            "iRenderResY",
+            "iMaxRenderCount",
+            "dicCfg",
+        ]
+
+        for sArgKey in kwargs:
+            if sArgKey not in lSupportedArgs:
+                raise CAnyError_Message(
+                    sMsg=(
+                        f"Unsupported argument '{sArgKey}' for function Process()\n"
+                        "Supported arguments are:" + CAnyError.ListToString(lSupportedArgs)
+                    )
+                )
+            # endif
+        # endfor
+
+        sWhere = "plan function arguments"
+        iFrameFirst = config.GetDictValue(kwargs, "iFrameFirst", int, xDefault=0, sWhere=sWhere)
+        iFrameLast = config.GetDictValue(kwargs, "iFrameLast", int, xDefault=0, sWhere=sWhere)
+        iFrameStep = config.GetDictValue(kwargs, "iFrameStep", int, xDefault=1, sWhere=sWhere)
+        iRenderQuality = config.GetDictValue(kwargs, "iRenderQuality", int, xDefault=4, sWhere=sWhere)
+        bDoOverwrite = config.GetDictValue(kwargs, "bDoOverwrite", bool, xDefault=False, sWhere=sWhere)
+        dSceneFps = config.GetDictValue(kwargs, "dSceneFps", float, bOptional=True, sWhere=sWhere)
+        iLineCount = config.GetDictValue(kwargs, "iLineCount", int, bOptional=True, sWhere=sWhere)
+        iRenderResX = config.GetDictValue(kwargs, "iRenderResX", int, bOptional=True, sWhere=sWhere)
+        iRenderResY = config.GetDictValue(kwargs, "iRenderResY", int, bOptional=True, sWhere=sWhere)
+        iMaxRenderCount = config.GetDictValue(kwargs, "iMaxRenderCount", int, xDefault=100000, sWhere=sWhere)
+        dicCfg = config.GetDictValue(kwargs, "dicCfg", dict, bOptional=True, sWhere=sWhere)
+
+        if iFrameStep <= 0:
+            iFrameStep = 1
+        # endif
+
+        if dicCfg is None:
+            lConfigs = self.xJobCfg.lConfigs
+        else:
+            lConfigs = [dicCfg]
+        # endif
+
+        self.lPlans = []
+        self.lWarnings = []
+        lTrgAction = [
+            "/catharsys/action/std/blender/render/std:1",
+            "/catharsys/action/std/blender/render/rs:1",
+        ]
+
+        for dicCfg in lConfigs:
+            sPathTrgMain, iActIdx, sActionDti, sAction = self.xJobCfg._GetActionTrgPath(lTrgAction, dicCfg)
+            if sPathTrgMain is None:
+                continue
+            # endif
+
+            pathTrgMain = Path(sPathTrgMain)
+            bIsRsRender = config.CheckDti(sActionDti, "/catharsys/action/std/blender/render/rs:1")["bOK"]
+
+            dicData = dicCfg.get("mConfig").get("mData")
+            if dicData is None:
+                raise Exception("No configuration data given")
+            # endif
+
+            sRenderTypeList = "blender/render/output-list:1"
+            lRndOutList = config.GetDataBlocksOfType(dicData, sRenderTypeList)
+            if len(lRndOutList) == 0:
+                raise Exception(
+                    "No render output configuration of type compatible to '{0}' given".format(sRenderTypeList)
+                )
+            # endif
+            lRndOut = lRndOutList[0].get("lOutputs", [])
+
+            xTimes = CRenderTimes.LoadFromPath(pathTrgMain)
+
+            dicPlan = {
+                "iCfgIdx": dicCfg.get("iCfgIdx"),
+                "sPathTrgMain": pathTrgMain.as_posix(),
+                "bIsRsRender": bIsRsRender,
+                "lFrames": [],
+                "iRenderCount": 0,
+                "iPixelSampleCount": None,
+                "dTimePerPixelSample": xTimes.GetTimePerPixelSample(),
+                "dTimePerRender": xTimes.GetTimePerRender(),
+                "dEstTime": None,
+            }
+
+            lTrgFrames = list(range(iFrameFirst, iFrameLast + 1, iFrameStep))
+
+            if bIsRsRender is True:
+                self._PlanRollingShutter(
+                    _dicPlan=dicPlan,
+                    _pathTrgMain=pathTrgMain,
+                    _dicData=dicData,
+                    _lRndOut=lRndOut,
+                    _lTrgFrames=lTrgFrames,
+                    _iRenderQuality=iRenderQuality,
+                    _bDoOverwrite=bDoOverwrite,
+                    _dSceneFps=dSceneFps,
+                    _iLineCount=iLineCount,
+                    _iRenderResX=iRenderResX,
+                )
+            else:
+                self._PlanStandard(
+                    _dicPlan=dicPlan,
+                    _pathTrgMain=pathTrgMain,
+                    _lRndOut=lRndOut,
+                    _lTrgFrames=lTrgFrames,
+                    _iRenderQuality=iRenderQuality,
+                    _bDoOverwrite=bDoOverwrite,
+                    _iRenderResX=iRenderResX,
+                    _iRenderResY=iRenderResY,
+                )
+            # endif
+
+            # Estimate the wall time from the render time history
+            if dicPlan["iPixelSampleCount"] is not None and dicPlan["dTimePerPixelSample"] is not None:
+                dicPlan["dEstTime"] = dicPlan["iPixelSampleCount"] * dicPlan["dTimePerPixelSample"]
+            elif dicPlan["dTimePerRender"] is not None:
+                dicPlan["dEstTime"] = dicPlan["iRenderCount"] * dicPlan["dTimePerRender"]
+            # endif
+
+            if dicPlan["iRenderCount"] > iMaxRenderCount:
+                self.lWarnings.append(
+                    "Configuration {} at '{}' needs {} renders, which is more than {}. "
+                    "Check the capture configuration, e.g. 'dFrameTime' and 'dExpPerLine'.".format(
+                        dicPlan["iCfgIdx"], dicPlan["sPathTrgMain"], dicPlan["iRenderCount"], iMaxRenderCount
+                    )
+                )
+            # endif
+
+            self.lPlans.append(dicPlan)
+        # endfor configurations
+
+    # enddef
+
+    ##########################################################################
+    # Get list of (folder, file extension) tuples of the files a render output creates.
+    # Render outputs of unsupported types are reported as warnings and have no folders.
+    def _GetOutputFolders(self, _xPrjCfg, _dicRndOut: dict) -> tuple[str, list[tuple[str, str]]]:
+        dicDti = config.SplitDti(_dicRndOut["sDTI"])
+        sRenderSubType = "/".join(dicDti["lType"][4:])
+
+        lFolders = []
+        if sRenderSubType == "image":
+            dicComp = _dicRndOut.get("mCompositor")
+            config.AssertConfigType(dicComp, "/catharsys/blender/compositor:1")
+            xComp = CConfigCompositor(xPrjCfg=_xPrjCfg, dicData=dicComp)
+            for dicFo in xComp.dicData.get("lFileOut"):
+                lFolders.append((dicFo.get("sFolder"), dicFo.get("sFileExt")))
+            # endfor
+
+        elif sRenderSubType == "image/openGL":
+            lFileOut = _dicRndOut.get("lFileOut", [])
+            if len(lFileOut) > 0:
+                lFolders.append((lFileOut[0].get("sFolder"), ".png"))
+            # endif
+
+        elif sRenderSubType == "anytruth/label":
+            lFolders.append(("AT_Label_Raw", ".exr"))
+
+        elif sRenderSubType == "anytruth/pos3d":
+            lFolders.append(("AT_Pos3d_Raw", ".exr"))
+            lFolders.append(("AT_Flow_Raw", ".exr"))
+
+        elif sRenderSubType not in ["blend", "none"]:
+            sWarning = f"Render output type '{sRenderSubType}' is not supported by the render plan"
+            if sWarning not in self.lWarnings:
+                self.lWarnings.append(sWarning)
+            # endif
+        # endif
+
+        return sRenderSubType, lFolders
+
+    # enddef
+
+    ##########################################################################
+    def _PlanStandard(
+        self,
+        *,
+        _dicPlan: dict,
+        _pathTrgMain: Path,
+        _lRndOut: list,
+        _lTrgFrames: list,
+        _iRenderQuality: int,
+        _bDoOverwrite: bool,
+        _iRenderResX: Optional[int],
+        _iRenderResY: Optional[int],
+    ):
+        iPixelCount: int = None
+        if _iRenderResX is not None and _iRenderResY is not None:
+            iPixelCount = _iRenderResX * _iRenderResY
+        # endif
+
+        iPixelSampleCount = 0
+        dicFrames = {}
+        for iOutIdx, dicRndOut in enumerate(_lRndOut):
+            sRenderSubType, lFolders = self._GetOutputFolders(self.xJobCfg.xPrjCfg, dicRndOut)
+            iSamples = 1 if sRenderSubType.startswith("anytruth") else _iRenderQuality
+
+            dicFolderFiles = {}
+            for sFolder, sFileExt in lFolders:
+                dicFolderFiles[sFolder] = cbu_path.GetFileNames(_pathTrgMain / sFolder)
+            # endfor
+            setRootFiles = cbu_path.GetFileNames(_pathTrgMain)
+
+            for iTrgFrame in _lTrgFrames:
+                lMissing = []
+                if sRenderSubType == "blend":
+                    sFile = "Frame_{0:04d}.blend".format(iTrgFrame)
+                    if sFile not in setRootFiles:
+                        lMissing.append(sFile)
+                    # endif
+                elif sRenderSubType == "none":
+                    lMissing.append(None)
+                elif sRenderSubType == "image/openGL":
+                    for sFolder, sFileExt in lFolders:
+                        sFile = "openGL_{0:04d}{1}".format(iTrgFrame, sFileExt)
+                        if sFile not in dicFolderFiles[sFolder]:
+                            lMissing.append(f"{sFolder}/{sFile}")
+                        # endif
+                    # endfor
+                else:
+                    for sFolder, sFileExt in lFolders:
+                        sFile = "Frame_{0:04d}{1}".format(iTrgFrame, sFileExt)
+                        if sFile not in dicFolderFiles[sFolder]:
+                            lMissing.append(f"{sFolder}/{sFile}")
+                        # endif
+                    # endfor
+                # endif
+
+                if len(lMissing) == 0 and _bDoOverwrite is False:
+                    continue
+                # endif
+
+                dicFrame = dicFrames.get(iTrgFrame)
+                if dicFrame is None:
+                    dicFrame = dicFrames[iTrgFrame] = {"iTrgFrame": iTrgFrame, "lOutputs": []}
+                # endif
+                dicFrame["lOutputs"].append(
+                    {"iOutIdx": iOutIdx, "sType": sRenderSubType, "lMissingFiles": [x for x in lMissing if x]}
+                )
+
+                if sRenderSubType not in ["blend", "none"]:
+                    _dicPlan["iRenderCount"] += 1
+                    if iPixelCount is not None:
+                        iPixelSampleCount += iPixelCount * iSamples
+                    # endif
+                # endif
+            # endfor target frames
+        # endfor render outputs
+
+        _dicPlan["lFrames"] = [dicFrames[x] for x in sorted(dicFrames)]
+        if iPixelCount is not None:
+            _dicPlan["iPixelSampleCount"] = iPixelSampleCount
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def _PlanRollingShutter(
+        self,
+        *,
+        _dicPlan: dict,
+        _pathTrgMain: Path,
+        _dicData: dict,
+        _lRndOut: list,
+        _lTrgFrames: list,
+        _iRenderQuality: int,
+        _bDoOverwrite: bool,
+        _dSceneFps: Optional[float],
+        _iLineCount: Optional[int],
+        _iRenderResX: Optional[int],
+    ):
+        if len(_lRndOut) > 1:
+            raise CAnyError_Message(sMsg="Rolling shutter rendering currently only supports a single render output type")
+        # endif
+
+        lCap = config.GetDataBlocksOfType(_dicData, "capture/rs:1")
+        if len(lCap) == 0:
+            raise CAnyError_Message(sMsg="No rolling shutter capture configuration of type 'capture/rs:1' given")
+        # endif
+        dicCap = lCap[0]
+
+        dicExposure = dicCap.get("mExp")
+        if dicExposure is None:
+            raise CAnyError_Message(sMsg="No exposure data given in image capture config")
+        # endif
+
+        # The scene fps, sensor line count and image resolution are only known within Blender.
+        # If they are not given explicitly, use the values stored by a previous render run.
+        dicRS = {}
+        pathRsCfg = _pathTrgMain / "RsCfg.json"
+        if pathRsCfg.is_file():
+            try:
+                dicRS = config.Load(pathRsCfg, sDTI="rs-config:1")
+            except Exception as xEx:
+                self.lWarnings.append(f"Cannot read rolling shutter config '{pathRsCfg.as_posix()}': {xEx}")
+            # endtry
+        # endif
+        dicRsExp = dicRS.get("mRsExp", {})
+
+        dSceneFps = _dSceneFps if _dSceneFps is not None else dicRsExp.get("dScnFps")
+        iLineCount = _iLineCount if _iLineCount is not None else dicRsExp.get("iLineCount")
+        iRenderResX = _iRenderResX if _iRenderResX is not None else dicRS.get("iRenderResX")
+        iRenderResY = dicRS.get("iRenderResY", iLineCount)
+        iBorderMaxY = dicRS.get("iBorderMaxY", iLineCount)
+
+        if dSceneFps is None or iLineCount is None:
+            raise CAnyError_Message(
+                sMsg=(
+                    "Rolling shutter plan needs the scene fps and the sensor line count. "
+                    "Either specify the arguments 'dSceneFps' and 'iLineCount', "
+                    f"or render at least one exposure, so that the file '{pathRsCfg.as_posix()}' exists."
+                )
+            )
+        # endif
+
+        xRsExp = CRsExp(
+            fFPS=dicCap.get("dFPS"),
+            fFrameTime=dicCap.get("dFrameTime"),
+            iLineCount=iLineCount,
+            fScnFps=dSceneFps,
+            iReadOutsPerRender=dicCap.get("iReadOutsPerRender", 1),
+            dicExp=dicExposure,
+        )
+        _dicPlan["mRsExp"] = xRsExp.GetData()
+
+        dicRndOut = _lRndOut[0]
+        sRenderSubType, lFolders = self._GetOutputFolders(self.xJobCfg.xPrjCfg, dicRndOut)
+        iSamples = 1 if sRenderSubType.startswith("anytruth") else _iRenderQuality
+
+        iPixelSampleCount = 0
+        for iTrgFrame in _lTrgFrames:
+            xRsExp.SetTrgFrame(iTrgFrame)
+            pathFrame = _pathTrgMain / "Frame_{0:04d}".format(iTrgFrame)
+
+            dicFolderFiles = {}
+            for sFolder, sFileExt in lFolders:
+                dicFolderFiles[sFolder] = cbu_path.GetFileNames(pathFrame / sFolder)
+            # endfor
+
+            lSchedule = xRsExp.GetReadOutSchedule()
+            iRoLoopCnt = len(lSchedule)
+            lExposures = []
+            for iSceneFrame, iRowTopOffset, iRowBotOffset in lSchedule:
+                bMissing = _bDoOverwrite
+                for sFolder, sFileExt in lFolders:
+                    if "Exp_{0:07d}{1}".format(iSceneFrame, sFileExt) not in dicFolderFiles[sFolder]:
+                        bMissing = True
+                    # endif
+                # endfor
+
+                if bMissing is False:
+                    continue
+                # endif
+
+                iBorderMin = max(0, iBorderMaxY - iRowBotOffset + 1)
+                iBorderMax = min(iRenderResY, iBorderMaxY - iRowTopOffset)
+                iBorderSize = max(0, iBorderMax - iBorderMin + 1)
+                lExposures.append({"iSceneFrame": iSceneFrame, "iBorderSize": iBorderSize})
+
+                if iRenderResX is not None:
+                    iPixelSampleCount += iRenderResX * iBorderSize * iSamples
+                # endif
+            # endfor read-out schedule
+
+            if len(lExposures) == 0:
+                continue
+            # endif
+
+            _dicPlan["lFrames"].append(
+                {
+                    "iTrgFrame": iTrgFrame,
+                    "iRoLoopCnt": iRoLoopCnt,
+                    "lOutputs": [{"iOutIdx": 0, "sType": sRenderSubType, "lExposures": lExposures}],
+                }
+            )
+            _dicPlan["iRenderCount"] += len(lExposures)
+        # endfor target frames
+
+        if iRenderResX is not None:
+            _dicPlan["iPixelSampleCount"] = iPixelSampleCount
+        # endif
+
+    # enddef
+
+    ##########################################################################
+    def GetPlans(self) -> list[dict]:
+        return self.lPlans
+
+    # enddef
+
+    ##########################################################################
+    def GetTotals(self) -> dict:
+        iRenderCount = sum(x["iRenderCount"] for x in self.lPlans)
+
+        iPixelSampleCount = None
+        lPixelSamples = [x["iPixelSampleCount"] for x in self.lPlans if x["iPixelSampleCount"] is not None]
+        if len(lPixelSamples) > 0:
+            iPixelSampleCount = sum(lPixelSamples)
+        # endif
+
+        dEstTime = None
+        lEstTime = [x["dEstTime"] for x in self.lPlans if x["dEstTime"] is not None]
+        if len(lEstTime) > 0:
+            dEstTime = sum(lEstTime)
+        # endif
+
+        return {
+            "iConfigCount": len(self.lPlans),
+            "iRenderCount": iRenderCount,
+            "iPixelSampleCount": iPixelSampleCount,
+            "dEstTime": dEstTime,
+            "bEstTimeComplete": len(lEstTime) == len(self.lPlans),
+        }
+
+    # enddef
+
+    ##########################################################################
+    def GetText(self) -> str:
+        sT = ""
+        sT += "=======================================================\n"
+        sT += "Render plan\n"
+        sT += "=======================================================\n"
+
+        for dicPlan in self.lPlans:
+            sT += "\n"
+            sT += "Config {0}: {1}\n".format(dicPlan["iCfgIdx"], dicPlan["sPathTrgMain"])
+            sT += "Frames to render: {0}\n".format(len(dicPlan["lFrames"]))
+            if dicPlan["bIsRsRender"] is True:
+                dicRsExp = dicPlan.get("mRsExp", {})
+                sT += "Read-out count: {0}\n".format(dicRsExp.get("iReadOutCount"))
+                sT += "Read-outs per exposure: {0}\n".format(dicRsExp.get("iReadOutsPerExp"))
+                for dicFrame in dicPlan["lFrames"]:
+                    lExp = dicFrame["lOutputs"][0]["lExposures"]
+                    sT += "  Frame {0}: {1} of {2} exposures, border lines {3} - {4}\n".format(
+                        dicFrame["iTrgFrame"],
+                        len(lExp),
+                        dicFrame["iRoLoopCnt"],
+                        min(x["iBorderSize"] for x in lExp),
+                        max(x["iBorderSize"] for x in lExp),
+                    )
+                # endfor
+            # endif
+            sT += "Renders: {0}\n".format(dicPlan["iRenderCount"])
+            if dicPlan["iPixelSampleCount"] is not None:
+                sT += "Pixel-samples: {0:.3e}\n".format(dicPlan["iPixelSampleCount"])
+            # endif
+            if dicPlan["dEstTime"] is not None:
+                sT += "Estimated time: {0}\n".format(anytime.SecondsToHmsStr(dicPlan["dEstTime"]))
+            else:
+                sT += "Estimated time: n/a (no render time history)\n"
+            # endif
+        # endfor
+
+        dicTotals = self.GetTotals()
+        sT += "\n"
+        sT += "-------------------------------------------------------\n"
+        sT += "Total renders: {0}\n".format(dicTotals["iRenderCount"])
+        if dicTotals["iPixelSampleCount"] is not None:
+            sT += "Total pixel-samples: {0:.3e}\n".format(dicTotals["iPixelSampleCount"])
+        # endif
+        if dicTotals["dEstTime"] is not None:
+            sT += "Total estimated time: {0}{1}\n".format(
+                anytime.SecondsToHmsStr(dicTotals["dEstTime"]),
+                "" if dicTotals["bEstTimeComplete"] else " (incomplete)",
+            )
+        # endif
+
+        for sWarning in self.lWarnings:
+            sT += "\nWARNING: {0}\n".format(sWarning)
+        # endfor
+
+        sT += "=======================================================\n"
+        return sT
+
+    # enddef
+
+    ##########################################################################
+    def PrintPlan(self):
+        print(self.GetText())
+
+    # enddef
+
+
+# endclass
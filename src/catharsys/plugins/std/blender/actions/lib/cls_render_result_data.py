@@ -27,7 +27,7 @@
 ###
 
 import re
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 
 from anybase import assertion, config
@@ -37,6 +37,7 @@ from catharsys.plugins.std.action_class.manifest.cls_cfg_manifest_job import (
 )
 from catharsys.plugins.std.resultdata import CImageResultData
 from catharsys.plugins.std.blender.config.cls_compositor import CConfigCompositor
+from .cls_render_result_index import GetRenderResultIndex
 import catharsys.plugins.std.resultdata.util as resultutil
 
 ########################################################################################
@@ -51,6 +52,10 @@ class CRenderResultData(CImageResultData):
         # Initialize parent class
         super().__init__(xJobCfg=xJobCfg)
 
+        # Process-wide file system index, so that repeated calls to ProcessImages()
+        # only re-scan folders that changed in the meantime.
+        self._xIndex = GetRenderResultIndex()
+
     # enddef
 
     ##########################################################################
@@ -109,19 +114,8 @@ class CRenderResultData(CImageResultData):
     # enddef
 
     ##########################################################################
-    def ProcessImages(
-        self,
-        *,
-        lRenderImageTypes: list = ["*"],
-        iFrameFirst: int = 0,
-        iFrameLast: int = -1,
-        iFrameStep: int = 1,
-        bCheckImagesExist: bool = True,
-        dicCfg: Optional[dict] = None,
-    ):
-
-        lSpecialTypes = ["AT_Label_Raw", "AT_Pos3d_Raw", "AT_Flow_Raw"]
-
+    @staticmethod
+    def _GetFrameRange(iFrameFirst: int, iFrameLast: int, iFrameStep: int) -> tuple[int, int, int]:
         if iFrameFirst < 0:
             iStartIdx = 0
         else:
@@ -140,13 +134,25 @@ class CRenderResultData(CImageResultData):
             iStepIdx = iFrameStep
         # endif
 
+        return iStartIdx, iStopIdx, iStepIdx
+
+    # enddef
+
+    ##########################################################################
+    # Iterate over all render outputs of the given configurations,
+    # without accessing the file system. Each element is a dictionary
+    # that describes where the images of a render output type are stored.
+    # The elements can be passed to IterFrames() and GetFramePage().
+    # Render sub types, which are not supported, are returned with 'sType' set to None.
+    def IterOutputs(self, *, lRenderImageTypes: list = ["*"], dicCfg: Optional[dict] = None) -> Iterator[dict]:
+        lSpecialTypes = ["AT_Label_Raw", "AT_Pos3d_Raw", "AT_Flow_Raw"]
+
         if dicCfg is None:
             lConfigs = self.xJobCfg.lConfigs
         else:
             lConfigs = [dicCfg]
         # endif
 
-        self._dicImages = {}
         lTrgAction = [
             "/catharsys/action/std/blender/render/std:1",
             "/catharsys/action/std/blender/render/rs:1",
@@ -154,24 +160,14 @@ class CRenderResultData(CImageResultData):
 
         for dicCfg in lConfigs:
 
-            sPathTrgMain, iActIdx, sActionDti, sAction = self.xJobCfg._GetActionTrgPath(
-                lTrgAction, dicCfg
-            )
+            sPathTrgMain, iActIdx, sActionDti, sAction = self.xJobCfg._GetActionTrgPath(lTrgAction, dicCfg)
             if sPathTrgMain is None:
                 continue
             # endif
 
-            pathTrgMain = Path(sPathTrgMain)
-            bIsRsRender = config.CheckDti(
-                sActionDti, "/catharsys/action/std/blender/render/rs:1"
-            )["bOK"]
-
-            iCfgIdx = dicCfg.get("iCfgIdx")
-            iCfgCnt = dicCfg.get("iCfgCnt")
+            bIsRsAction = config.CheckDti(sActionDti, "/catharsys/action/std/blender/render/rs:1")["bOK"]
 
             dicRelPaths = self.xJobCfg._GetActionRelPaths(sAction, dicCfg)
-            sRelPathTrial = dicRelPaths["sRelPathTrial"]
-            sRelPathCfg = dicRelPaths["sRelPathCfg"]
 
             dicData = dicCfg.get("mConfig").get("mData")
             if dicData is None:
@@ -184,56 +180,38 @@ class CRenderResultData(CImageResultData):
             lRndOutList = config.GetDataBlocksOfType(dicData, sRenderTypeList)
             if len(lRndOutList) == 0:
                 raise Exception(
-                    "No render output configuration of type compatible to '{0}' given".format(
-                        sRenderTypeList
-                    )
+                    "No render output configuration of type compatible to '{0}' given".format(sRenderTypeList)
                 )
             # endif
             dicRndOutList = lRndOutList[0]
             lRndOutList = dicRndOutList.get("lOutputs", [])
             for dicRndOut in lRndOutList:
-                bHasImages = False
-
                 dicDti = config.SplitDti(dicRndOut["sDTI"])
                 sRenderSubType = "/".join(dicDti["lType"][4:])
-                # print("Render sub type: {0}".format(sRenderSubType))
-
-                #########################################################
-                # FIRST image dictionary level references:
-                #       render configuration
-                #########################################################
-                dicImgCfg = self._dicImages.get(sRelPathCfg)
-                if dicImgCfg is None:
-                    dicImgCfg = self._dicImages[sRelPathCfg] = {}
-                # endif
 
-                #########################################################
-                # SECOND image dictionary level references:
-                #       render sub type, e.g. "image" or "anytruth/label"
-                #########################################################
-                dicImgCfgRnd = dicImgCfg[sRenderSubType] = {
-                    "iCfgIdx": iCfgIdx,
-                    "iCfgCnt": iCfgCnt,
-                    "sRelPathCfg": sRelPathCfg,
-                    "sRelPathTrial": sRelPathTrial,
-                    "mOutputType": {},
+                # Only images of rolling shutter renders are stored per exposure in frame folders.
+                # The anytruth label and pos3d outputs are stored like standard render outputs.
+                bIsRsRender = bIsRsAction and sRenderSubType == "image"
+
+                dicOutput = {
+                    "iCfgIdx": dicCfg.get("iCfgIdx"),
+                    "iCfgCnt": dicCfg.get("iCfgCnt"),
+                    "sRelPathCfg": dicRelPaths["sRelPathCfg"],
+                    "sRelPathTrial": dicRelPaths["sRelPathTrial"],
+                    "sRenderSubType": sRenderSubType,
+                    "sPathTrgMain": sPathTrgMain,
+                    "bIsRsRender": bIsRsRender,
                 }
-                #########################################################
-                # THIRD image dictionary level references:
-                #       fixed name 'mOutputType',
-                #       dictionary of output types as defined in compositor,
-                #       or special output names like "AT_Label_Raw"
-                #########################################################
-                dicImgCfgRndOut = dicImgCfgRnd.get("mOutputType")
+
+                # list of tuples (type, folder, file extension)
+                lTypes = []
 
                 # Processing differers by render sub types
                 if sRenderSubType == "image":
                     dicComp = dicRndOut.get("mCompositor")
                     config.AssertConfigType(dicComp, "/catharsys/blender/compositor:1")
 
-                    xComp = CConfigCompositor(
-                        xPrjCfg=self.xJobCfg.xPrjCfg, dicData=dicComp
-                    )
+                    xComp = CConfigCompositor(xPrjCfg=self.xJobCfg.xPrjCfg, dicData=dicComp)
                     dicOutByType = xComp.GetOutputsByType()
                     # Select either the render output types as specified by arguments.
                     # or use all output types as defined in the compositor
@@ -253,182 +231,305 @@ class CRenderResultData(CImageResultData):
                         if lOut is None:
                             print(
                                 "Render output type '{}' not defined in compositor config.\n"
-                                "Available types are: {}".format(
-                                    sType, ", ".join(dicOutByType.keys())
-                                )
+                                "Available types are: {}".format(sType, ", ".join(dicOutByType.keys()))
                             )
                             continue
                         # endif
                         dicOut = lOut[0]
-                        sFolder = dicOut.get("sFolder")
-                        sFileExt = dicOut.get("sFileExt")
-
-                        #########################################################
-                        # FOURTH image dictionary level references:
-                        #       render output type, as defined in compositor
-                        #########################################################
-                        dicImgCfgRndOutType = dicImgCfgRndOut[sType] = {
-                            "sFolder": sFolder,
-                            "sFileExt": sFileExt,
-                            "mFrames": {},
-                        }
-                        #########################################################
-                        # FIFTH image dictionary level references:
-                        #       fixed name 'mFrames' that contains all frames
-                        #########################################################
-                        dicImgFrames = dicImgCfgRndOutType.get("mFrames")
-
-                        ##########################################################
-                        # Test if we are processing ROLLING SHUTTER render results
-                        if bIsRsRender is True:
-                            # pathImages = pathTrgMain / "Frame_{0:04d}".format(iFrame) / sFolder
-                            pathFrames = pathTrgMain
-                            reImageFolder = re.compile(r"Frame_(\d+)")
-                            reImageFile = re.compile(r"Exp_(\d+)\.exr")
-                            for pathImageFolder in pathFrames.iterdir():
-                                if not pathImageFolder.is_dir():
-                                    continue
-                                # endif
-
-                                xMatch = reImageFolder.match(pathImageFolder.name)
-                                if xMatch is None:
-                                    continue
-                                # endif
-                                iFrame = int(xMatch.group(1))
-                                if (
-                                    iFrame < iStartIdx
-                                    or (iStopIdx >= 0 and iFrame > iStopIdx)
-                                    or (iFrame - iStartIdx) % iStepIdx != 0
-                                ):
-                                    continue
-                                # endif
-
-                                pathImages = pathImageFolder / sFolder
-                                lFileExp = []
-                                for pathElement in pathImages.iterdir():
-                                    if (
-                                        pathElement.is_file()
-                                        and reImageFile.match(pathElement.name)
-                                        is not None
-                                    ):
-                                        lFileExp.append(pathElement.as_posix())
-                                    # endif
-                                # endfor
-
-                                if len(lFileExp) > 0:
-                                    bHasImages = True
-                                    dicImgFrames[iFrame] = {
-                                        "iFrameIdx": iFrame,
-                                        "sFpImage": None,
-                                        "lFpSubImages": lFileExp,
-                                    }
-                                else:
-                                    self._lWarnings.append(
-                                        "Rolling shutter exposures for frame '{0}' do not exist".format(
-                                            iFrame
-                                        )
-                                    )
-                                # endif
-                            # endfor frame folder
-
-                        ##########################################################
-                        # else, we are processing STANDARD RENDER results
-                        else:
-                            pathFrames = pathTrgMain / sFolder
-                            bHasImages = resultutil.AddFramesToDictFromPath(
-                                pathFrames=pathFrames,
-                                dicImageFrames=dicImgFrames,
-                                sFileExt=sFileExt,
-                                iFrameFirst=iStartIdx,
-                                iFrameLast=iStopIdx,
-                                iFrameStep=iStepIdx,
-                            )
-                        # endif
-                        # # endfor frame
+                        lTypes.append((sType, dicOut.get("sFolder"), dicOut.get("sFileExt")))
                     # endfor output types
 
                 elif sRenderSubType == "anytruth/label":
                     if "AT_Label_Raw" in lRenderImageTypes or "*" in lRenderImageTypes:
-                        sType = sFolder = "AT_Label_Raw"
-                        sFileExt = ".exr"
-
-                        dicImgCfgRndOutType = dicImgCfgRndOut[sType] = {
-                            "sFolder": sFolder,
-                            "sFileExt": sFileExt,
-                            "mFrames": {},
-                        }
-                        dicImgFrames = dicImgCfgRndOutType.get("mFrames")
-
-                        pathFrames = pathTrgMain / sFolder
-                        bHasImages = resultutil.AddFramesToDictFromPath(
-                            pathFrames=pathFrames,
-                            dicImageFrames=dicImgFrames,
-                            sFileExt=sFileExt,
-                            iFrameFirst=iStartIdx,
-                            iFrameLast=iStopIdx,
-                            iFrameStep=iStepIdx,
-                        )
+                        lTypes.append(("AT_Label_Raw", "AT_Label_Raw", ".exr"))
                     # endif
 
                 elif sRenderSubType == "anytruth/pos3d":
                     if "AT_Pos3d_Raw" in lRenderImageTypes or "*" in lRenderImageTypes:
-                        sType = sFolder = "AT_Pos3d_Raw"
-                        sFileExt = ".exr"
-
-                        dicImgCfgRndOutType = dicImgCfgRndOut[sType] = {
-                            "sFolder": sFolder,
-                            "sFileExt": sFileExt,
-                            "mFrames": {},
-                        }
-                        dicImgFrames = dicImgCfgRndOutType.get("mFrames")
-
-                        pathFrames = pathTrgMain / sFolder
-                        bHasImages = resultutil.AddFramesToDictFromPath(
-                            pathFrames=pathFrames,
-                            dicImageFrames=dicImgFrames,
-                            sFileExt=sFileExt,
-                            iFrameFirst=iStartIdx,
-                            iFrameLast=iStopIdx,
-                            iFrameStep=iStepIdx,
-                        )
+                        lTypes.append(("AT_Pos3d_Raw", "AT_Pos3d_Raw", ".exr"))
                     # endif
 
                     if "AT_Flow_Raw" in lRenderImageTypes or "*" in lRenderImageTypes:
-                        sType = sFolder = "AT_Flow_Raw"
-                        sFileExt = ".exr"
-
-                        dicImgCfgRndOutType = dicImgCfgRndOut[sType] = {
-                            "sFolder": sFolder,
-                            "sFileExt": sFileExt,
-                            "mFrames": {},
-                        }
-                        dicImgFrames = dicImgCfgRndOutType.get("mFrames")
-
-                        pathFrames = pathTrgMain / sFolder
-                        bHasImages = resultutil.AddFramesToDictFromPath(
-                            pathFrames=pathFrames,
-                            dicImageFrames=dicImgFrames,
-                            sFileExt=sFileExt,
-                            iFrameFirst=iStartIdx,
-                            iFrameLast=iStopIdx,
-                            iFrameStep=iStepIdx,
-                        )
+                        lTypes.append(("AT_Flow_Raw", "AT_Flow_Raw", ".exr"))
                     # endif
 
                 else:
-                    print(
-                        "ERROR: Unsupported render output type '{0}'".format(
-                            sRenderSubType
-                        )
-                    )
+                    print("ERROR: Unsupported render output type '{0}'".format(sRenderSubType))
+                    yield dict(dicOutput, sType=None, sFolder=None, sFileExt=None)
+                    continue
                 # endif
 
-                if not bHasImages:
-                    del dicImgCfg[sRenderSubType]
-                # endif
+                for sType, sFolder, sFileExt in lTypes:
+                    yield dict(dicOutput, sType=sType, sFolder=sFolder, sFileExt=sFileExt)
+                # endfor
             # endfor render output types
         # endfor configurations
 
+    # enddef
+
+    ##########################################################################
+    # Get the sorted list of frame indices together with the name
+    # of the frame folder (rolling shutter) or the frame image file (standard),
+    # that exist for the given render output.
+    def _GetFrameKeys(
+        self, _dicOutput: dict, _iStartIdx: int, _iStopIdx: int, _iStepIdx: int
+    ) -> list[tuple[int, str]]:
+        pathTrgMain = Path(_dicOutput["sPathTrgMain"])
+
+        if _dicOutput["bIsRsRender"] is True:
+            dicFrames = self._xIndex.GetFrameFolders(
+                pathTrgMain, iFrameFirst=_iStartIdx, iFrameLast=_iStopIdx, iFrameStep=_iStepIdx
+            )
+            return sorted(dicFrames.items())
+        # endif
+
+        xEntry = self._xIndex.GetFolder(pathTrgMain / _dicOutput["sFolder"])
+        if xEntry is None:
+            return []
+        # endif
+
+        reFile = re.compile(r"Frame_(\d+)" + re.escape(_dicOutput["sFileExt"]))
+        lKeys = []
+        for sFile in xEntry.lFiles:
+            xMatch = reFile.fullmatch(sFile)
+            if xMatch is None:
+                continue
+            # endif
+            iFrame = int(xMatch.group(1))
+            if iFrame < _iStartIdx or (_iStopIdx >= 0 and iFrame > _iStopIdx) or (iFrame - _iStartIdx) % _iStepIdx != 0:
+                continue
+            # endif
+            lKeys.append((iFrame, sFile))
+        # endfor
+
+        return sorted(lKeys)
+
+    # enddef
+
+    ##########################################################################
+    # Create the frame dictionaries for the given frame keys.
+    # Rolling shutter exposure folders are scanned in parallel but are not kept
+    # in the file system index, so that memory usage does not grow with the
+    # number of exposure files. Frames without exposures are skipped.
+    def _GetFrames(self, _dicOutput: dict, _lKeys: list[tuple[int, str]]) -> list[dict]:
+        pathTrgMain = Path(_dicOutput["sPathTrgMain"])
+        sFolder = _dicOutput["sFolder"]
+
+        if _dicOutput["bIsRsRender"] is False:
+            pathImages = pathTrgMain / sFolder
+            return [
+                {"iFrameIdx": iFrame, "sFpImage": (pathImages / sFile).as_posix(), "lFpSubImages": None}
+                for iFrame, sFile in _lKeys
+            ]
+        # endif
+
+        reImageFile = re.compile(r"Exp_(\d+)\.exr")
+        lPaths = [pathTrgMain / sFrameFolder / sFolder for _, sFrameFolder in _lKeys]
+        lEntries = self._xIndex.GetFolders(lPaths)
+
+        lFrames = []
+        for (iFrame, _), pathImages, xEntry in zip(_lKeys, lPaths, lEntries):
+            if xEntry is None:
+                continue
+            # endif
+            lFileExp = [(pathImages / x).as_posix() for x in xEntry.lFiles if reImageFile.match(x) is not None]
+            if len(lFileExp) > 0:
+                lFrames.append({"iFrameIdx": iFrame, "sFpImage": None, "lFpSubImages": lFileExp})
+            # endif
+        # endfor
+
+        return lFrames
+
+    # enddef
+
+    ##########################################################################
+    # Get the number of frames of a render output, as returned by IterOutputs().
+    # For rolling shutter renders, this counts the frame folders,
+    # which may include frames whose exposures have not been rendered yet.
+    def GetFrameCount(self, _dicOutput: dict, *, iFrameFirst: int = 0, iFrameLast: int = -1, iFrameStep: int = 1) -> int:
+        if _dicOutput.get("sType") is None:
+            return 0
+        # endif
+        return len(self._GetFrameKeys(_dicOutput, *self._GetFrameRange(iFrameFirst, iFrameLast, iFrameStep)))
+
+    # enddef
+
+    ##########################################################################
+    # Get a single page of frames of a render output, as returned by IterOutputs().
+    # Pages are formed over the frame keys counted by GetFrameCount(), so a page
+    # of rolling shutter frames may be shorter than 'iPageSize', if some frames
+    # have no exposures.
+    def GetFramePage(
+        self,
+        _dicOutput: dict,
+        *,
+        iPageIdx: int = 0,
+        iPageSize: int = 100,
+        iFrameFirst: int = 0,
+        iFrameLast: int = -1,
+        iFrameStep: int = 1,
+    ) -> list[dict]:
+        if _dicOutput.get("sType") is None or iPageIdx < 0 or iPageSize <= 0:
+            return []
+        # endif
+
+        lKeys = self._GetFrameKeys(_dicOutput, *self._GetFrameRange(iFrameFirst, iFrameLast, iFrameStep))
+        iStart = iPageIdx * iPageSize
+        return self._GetFrames(_dicOutput, lKeys[iStart : iStart + iPageSize])
+
+    # enddef
+
+    ##########################################################################
+    # Iterate over the frames of a render output, as returned by IterOutputs().
+    # The sub-images of rolling shutter frames are read from the file system
+    # in chunks of 'iChunkSize' frames, when they are requested.
+    def IterFrames(
+        self,
+        _dicOutput: dict,
+        *,
+        iFrameFirst: int = 0,
+        iFrameLast: int = -1,
+        iFrameStep: int = 1,
+        iChunkSize: int = 64,
+    ) -> Iterator[dict]:
+        if _dicOutput.get("sType") is None:
+            return
+        # endif
+
+        lKeys = self._GetFrameKeys(_dicOutput, *self._GetFrameRange(iFrameFirst, iFrameLast, iFrameStep))
+        iChunkSize = max(1, iChunkSize)
+        for iStart in range(0, len(lKeys), iChunkSize):
+            yield from self._GetFrames(_dicOutput, lKeys[iStart : iStart + iChunkSize])
+        # endfor
+
+    # enddef
+
+    ##########################################################################
+    def ProcessImages(
+        self,
+        *,
+        lRenderImageTypes: list = ["*"],
+        iFrameFirst: int = 0,
+        iFrameLast: int = -1,
+        iFrameStep: int = 1,
+        bCheckImagesExist: bool = True,
+        dicCfg: Optional[dict] = None,
+    ):
+        iStartIdx, iStopIdx, iStepIdx = self._GetFrameRange(iFrameFirst, iFrameLast, iFrameStep)
+
+        self._dicImages = {}
+        # Set of (configuration, render sub type) tuples that have images
+        setHasImages = set()
+
+        for dicOutput in self.IterOutputs(lRenderImageTypes=lRenderImageTypes, dicCfg=dicCfg):
+            sRelPathCfg = dicOutput["sRelPathCfg"]
+            sRenderSubType = dicOutput["sRenderSubType"]
+            sType = dicOutput["sType"]
+
+            #########################################################
+            # FIRST image dictionary level references:
+            #       render configuration
+            #########################################################
+            dicImgCfg = self._dicImages.get(sRelPathCfg)
+            if dicImgCfg is None:
+                dicImgCfg = self._dicImages[sRelPathCfg] = {}
+            # endif
+
+            #########################################################
+            # SECOND image dictionary level references:
+            #       render sub type, e.g. "image" or "anytruth/label"
+            #########################################################
+            dicImgCfgRnd = dicImgCfg.get(sRenderSubType)
+            if dicImgCfgRnd is None:
+                dicImgCfgRnd = dicImgCfg[sRenderSubType] = {
+                    "iCfgIdx": dicOutput["iCfgIdx"],
+                    "iCfgCnt": dicOutput["iCfgCnt"],
+                    "sRelPathCfg": sRelPathCfg,
+                    "sRelPathTrial": dicOutput["sRelPathTrial"],
+                    "mOutputType": {},
+                }
+            # endif
+
+            if sType is None:
+                continue
+            # endif
+
+            #########################################################
+            # THIRD image dictionary level references:
+            #       fixed name 'mOutputType',
+            #       dictionary of output types as defined in compositor,
+            #       or special output names like "AT_Label_Raw"
+            #########################################################
+            dicImgCfgRndOut = dicImgCfgRnd.get("mOutputType")
+
+            #########################################################
+            # FOURTH image dictionary level references:
+            #       render output type, as defined in compositor
+            #########################################################
+            dicImgCfgRndOutType = dicImgCfgRndOut[sType] = {
+                "sFolder": dicOutput["sFolder"],
+                "sFileExt": dicOutput["sFileExt"],
+                "mFrames": {},
+            }
+            #########################################################
+            # FIFTH image dictionary level references:
+            #       fixed name 'mFrames' that contains all frames
+            #########################################################
+            dicImgFrames = dicImgCfgRndOutType.get("mFrames")
+
+            ##########################################################
+            # Test if we are processing ROLLING SHUTTER render results
+            if dicOutput["bIsRsRender"] is True:
+                # pathImages = pathTrgMain / "Frame_{0:04d}".format(iFrame) / sFolder
+                reImageFile = re.compile(r"Exp_(\d+)\.exr")
+                dicFrameFiles = self._xIndex.GetFrameSubFolderFiles(
+                    Path(dicOutput["sPathTrgMain"]),
+                    dicOutput["sFolder"],
+                    reImageFile,
+                    iFrameFirst=iStartIdx,
+                    iFrameLast=iStopIdx,
+                    iFrameStep=iStepIdx,
+                )
+                for iFrame, lFileExp in dicFrameFiles.items():
+                    if len(lFileExp) > 0:
+                        setHasImages.add((sRelPathCfg, sRenderSubType))
+                        dicImgFrames[iFrame] = {
+                            "iFrameIdx": iFrame,
+                            "sFpImage": None,
+                            "lFpSubImages": lFileExp,
+                        }
+                    else:
+                        self._lWarnings.append("Rolling shutter exposures for frame '{0}' do not exist".format(iFrame))
+                    # endif
+                # endfor frame folder
+
+            ##########################################################
+            # else, we are processing STANDARD RENDER results
+            else:
+                pathFrames = Path(dicOutput["sPathTrgMain"]) / dicOutput["sFolder"]
+                bHasImages = resultutil.AddFramesToDictFromPath(
+                    pathFrames=pathFrames,
+                    dicImageFrames=dicImgFrames,
+                    sFileExt=dicOutput["sFileExt"],
+                    iFrameFirst=iStartIdx,
+                    iFrameLast=iStopIdx,
+                    iFrameStep=iStepIdx,
+                )
+                if bHasImages:
+                    setHasImages.add((sRelPathCfg, sRenderSubType))
+                # endif
+            # endif
+        # endfor render outputs
+
+        # Remove render sub types without images
+        for sRelPathCfg, dicImgCfg in self._dicImages.items():
+            for sRenderSubType in list(dicImgCfg.keys()):
+                if (sRelPathCfg, sRenderSubType) not in setHasImages:
+                    del dicImgCfg[sRenderSubType]
+                # endif
+            # endfor
+        # endfor
+
         # print(self._dicImages)
 
     # enddef
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \actions\lib\cls_render_result_index.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Cached file system index of render results.
+# Each folder is scanned once with os.scandir() and re-scanned only if its
+# modification time changed. Lists of folders are scanned in a thread pool,
+# which speeds up result browsing on network file systems considerably.
+# The number of stored folders is limited, where the least recently used folders
+# are removed first, so that memory usage stays bounded for large result sets.
+
+import os
+import re
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Optional, Union
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+
+@dataclass
+class CFolderEntry:
+    iMTime: int
+    lFiles: list[str]
+    lFolders: list[str]
+
+
+# endclass
+
+
+class CRenderResultIndex:
+    reFrameFolder: re.Pattern = re.compile(r"Frame_(\d+)")
+
+    ###################################################################################
+    def __init__(self, *, iMaxWorkers: Optional[int] = None, iMaxFolderCount: int = 100000):
+        self.iMaxWorkers: Optional[int] = iMaxWorkers
+        self.iMaxFolderCount: int = iMaxFolderCount
+        self._dicFolders: OrderedDict[str, CFolderEntry] = OrderedDict()
+        self._xLock = threading.Lock()
+
+    # enddef
+
+    ###################################################################################
+    # Remove all cached folder entries, or only those below the given path.
+    def Invalidate(self, _xPath: Union[str, Path, None] = None):
+        with self._xLock:
+            if _xPath is None:
+                self._dicFolders = OrderedDict()
+            else:
+                sPath = os.path.normpath(str(_xPath))
+                self._dicFolders = OrderedDict(
+                    (sKey, xEntry)
+                    for sKey, xEntry in self._dicFolders.items()
+                    if sKey != sPath and not sKey.startswith(sPath + os.sep)
+                )
+            # endif
+        # endwith
+
+    # enddef
+
+    ###################################################################################
+    # Get the index entry of a folder. The folder is only scanned, if it has not been
+    # scanned before or if its modification time changed. Returns None if the folder
+    # does not exist.
+    def GetFolder(self, _xPath: Union[str, Path]) -> Optional[CFolderEntry]:
+        sPath = os.path.normpath(str(_xPath))
+
+        try:
+            iMTime = os.stat(sPath).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            with self._xLock:
+                self._dicFolders.pop(sPath, None)
+            # endwith
+            return None
+        # endtry
+
+        with self._xLock:
+            xEntry = self._dicFolders.get(sPath)
+            if xEntry is not None and xEntry.iMTime == iMTime:
+                self._dicFolders.move_to_end(sPath)
+                return xEntry
+            # endif
+        # endwith
+
+        lFiles = []
+        lFolders = []
+        try:
+            with os.scandir(sPath) as xIter:
+                for xDirEntry in xIter:
+                    if xDirEntry.is_dir():
+                        lFolders.append(xDirEntry.name)
+                    elif xDirEntry.is_file():
+                        lFiles.append(xDirEntry.name)
+                    # endif
+                # endfor
+            # endwith
+        except NotADirectoryError:
+            return None
+        # endtry
+
+        lFiles.sort()
+        lFolders.sort()
+        xEntry = CFolderEntry(iMTime, lFiles, lFolders)
+        with self._xLock:
+            self._dicFolders[sPath] = xEntry
+            self._dicFolders.move_to_end(sPath)
+            while len(self._dicFolders) > self.iMaxFolderCount:
+                self._dicFolders.popitem(last=False)
+            # endwhile
+        # endwith
+
+        return xEntry
+
+    # enddef
+
+    ###################################################################################
+    # Get the index entries of a list of folders, scanned in parallel.
+    def GetFolders(self, _lPaths: list[Union[str, Path]]) -> list[Optional[CFolderEntry]]:
+        if len(_lPaths) <= 1:
+            return [self.GetFolder(x) for x in _lPaths]
+        # endif
+
+        with ThreadPoolExecutor(max_workers=self.iMaxWorkers) as xPool:
+            return list(xPool.map(self.GetFolder, _lPaths))
+        # endwith
+
+    # enddef
+
+    ###################################################################################
+    # Get dictionary of frame index to frame folder name of all folders
+    # called 'Frame_[index]' in the given path, that lie in the given frame range.
+    def GetFrameFolders(
+        self, _pathMain: Path, *, iFrameFirst: int = 0, iFrameLast: int = -1, iFrameStep: int = 1
+    ) -> dict[int, str]:
+        xEntry = self.GetFolder(_pathMain)
+        if xEntry is None:
+            return {}
+        # endif
+
+        dicFrames = {}
+        for sFolder in xEntry.lFolders:
+            xMatch = CRenderResultIndex.reFrameFolder.match(sFolder)
+            if xMatch is None:
+                continue
+            # endif
+
+            iFrame = int(xMatch.group(1))
+            if iFrame < iFrameFirst or (iFrameLast >= 0 and iFrame > iFrameLast) or (iFrame - iFrameFirst) % iFrameStep != 0:
+                continue
+            # endif
+            dicFrames[iFrame] = sFolder
+        # endfor
+
+        return dicFrames
+
+    # enddef
+
+    ###################################################################################
+    # Get the files in the sub-folder '_sFolder' of all frame folders in the given path,
+    # whose names match the given regular expression.
+    # Returns a dictionary of frame index to list of absolute file paths.
+    def GetFrameSubFolderFiles(
+        self,
+        _pathMain: Path,
+        _sFolder: str,
+        _reFile: re.Pattern,
+        *,
+        iFrameFirst: int = 0,
+        iFrameLast: int = -1,
+        iFrameStep: int = 1,
+    ) -> dict[int, list[str]]:
+        dicFrameFolders = self.GetFrameFolders(
+            _pathMain, iFrameFirst=iFrameFirst, iFrameLast=iFrameLast, iFrameStep=iFrameStep
+        )
+        lFrames = sorted(dicFrameFolders)
+        lPaths = [_pathMain / dicFrameFolders[iFrame] / _sFolder for iFrame in lFrames]
+        lEntries = self.GetFolders(lPaths)
+
+        dicFiles = {}
+        for iFrame, pathFolder, xEntry in zip(lFrames, lPaths, lEntries):
+            if xEntry is None:
+                dicFiles[iFrame] = []
+                continue
+            # endif
+            dicFiles[iFrame] = [(pathFolder / x).as_posix() for x in xEntry.lFiles if _reFile.match(x) is not None]
+        # endfor
+
+        return dicFiles
+
+    # enddef
+
+
+# endclass
+
+
+# The index is shared by all result data instances in a process
+g_xRenderResultIndex: CRenderResultIndex = CRenderResultIndex()
+
+
+########################################################################################
+def GetRenderResultIndex() -> CRenderResultIndex:
+    return g_xRenderResultIndex
+
+
+# enddef
@@ -38,12 +38,15 @@ from .cls_render import NsConfigDTI
 from .cls_render import NsMainTypesRenderOut, NsSpecificTypesRenderOut
 
 from .cls_rsexp import CRsExp
+from .cls_render_times import CRenderTimes
+from .cls_rsexp_reuse import CRsExpReuse, CRsExpRenderInfo
 from anybase.cls_any_error import CAnyError_Message
 from anybase import time as anytime
 from catharsys.plugins.std.blender.config.cls_modify_list import CConfigModifyList
 from catharsys.util import file as cathfile
 from catharsys.util import path as cathpath
 from catharsys.util import config as cathcfg
+from catharsys.plugins.std.blender.util import path as cbu_path
 
 import anyblend
 import anycam
@@ -93,6 +96,10 @@ class CRenderRollingShutter(CRender):
         # iReadOutStep = self.dicCap.get("iReadOutStep", 1)
         # iReadOutMaxStepCount = self.dicCap.get("iReadOutMaxStepCount", 0)
 
+        # Optionally re-use rendered exposures for scene frames with identical scene state
+        bReuseStaticExposures = self.dicCap.get("bReuseStaticExposures", False)
+        xExpReuse = CRsExpReuse() if bReuseStaticExposures is True else None
+
         dicExposure = self.dicCap.get("mExp")
         if dicExposure is None:
             raise Exception("No exposure data given in image capture config")
@@ -165,7 +172,10 @@ class CRenderRollingShutter(CRender):
             sPathRenderFrame = os.path.join(self.sPathTrgMain, sFrameName)
 
             sFileLog = "log_frame-{0:02d}_offset-{1:02d}.txt".format(iTrgFrame, iSubFrameOffset)
-            sPathLog = os.path.join(sPathRenderFrame, "_log")
+            sPathLog = os.path.join(sPathRenderFrame, CRenderTimes.sFolder)
+            sFileTimes = "offset-{0:02d}".format(iSubFrameOffset)
+            xRenderTimes = CRenderTimes()
+            xRenderTimes.Load(sPathLog, sFileTimes)
             sFpLog = os.path.join(sPathLog, sFileLog)
             cathpath.CreateDir(sPathLog)
 
@@ -227,6 +237,12 @@ class CRenderRollingShutter(CRender):
             self._AnimPointClouds(iTrgFrame)
             ######################################################
 
+            # Point clouds and render output modifiers may change the scene per target frame
+            # in ways the scene state hash does not capture. Only re-use exposures within a frame.
+            if xExpReuse is not None:
+                xExpReuse.Clear()
+            # endif
+
             ######################################################
             xRenderSettings: CRenderSettings = self._GetCfgRenderSettings(self.lRndSettings)
             dicMainSettings = xRenderSettings.mMain
@@ -238,122 +254,125 @@ class CRenderRollingShutter(CRender):
             sLog += "Using render path: {0}\n".format(sPathRenderFrame)
 
             # Loop over all exposures for frame
-            iRoLoopIdx = 0
             # Define every how many loops a log output is generated
             iRoLoopLogStep = 1
             dTimeRenderDelta = 0.0
 
+            # Evaluate the whole exposure schedule of this frame up front and
+            # find the exposures that still need to be rendered, with a single
+            # directory scan per output folder.
+            lSchedule = xRsExp.GetReadOutSchedule(iLoopOffset=iSubFrameOffset, iLoopStep=iSubFrameStep)
+            lRenderIdx = self._GetExposuresToRender(lSchedule)
+            iSkipCnt = len(lSchedule) - len(lRenderIdx)
+            if iSkipCnt > 0:
+                sLog += "Frame {0}: {1} of {2} exposures already exist. Skipping...\n".format(
+                    iTrgFrame, iSkipCnt, len(lSchedule)
+                )
+            # endif
+
             sTimeDelta = "n/a"
             sTimeLeft = "n/a"
             dTimeStart = timer()
-            if xRsExp.StartReadOutLoop(iLoopOffset=iSubFrameOffset, iLoopStep=iSubFrameStep):
-                while True:
-                    # Fast forward to first exposure that has not been rendered
-                    bFinished = False
-                    while True:
-                        iTotalRoLoopIdx = iTrgFrameIdx * iRoLoopCnt + iRoLoopIdx
-                        dRoLoopPart = 100.0 * (iRoLoopIdx / iRoLoopCnt)
-                        dTotalRoLoopPart = 100.0 * (iTotalRoLoopIdx / iTotalRoLoopCnt)
-
-                        self.iSceneFrame = xRsExp.GetExpStartSceneFrame()
-                        lOutputFilenames = self.xCompFileOut.GetOutputFilenames(self.iSceneFrame)
-
-                        bMissing = False
-                        for sFo in lOutputFilenames:
-                            # self.Print("Test for rendered file: {0}".format(sFo))
-                            if not os.path.isfile(sFo):
-                                bMissing = True
-                            elif self.bDoOverwrite:
-                                self.Print("...removing file due to overwrite flag")
-                                os.remove(sFo)
-                            # endif
-                        # endfor
-
-                        if bMissing or self.bDoOverwrite:
-                            break
-                        # endif
+            for iRoLoopIdx in lRenderIdx:
+                iTotalRoLoopIdx = iTrgFrameIdx * iRoLoopCnt + iRoLoopIdx
+                dRoLoopPart = 100.0 * (iRoLoopIdx / iRoLoopCnt)
+                dTotalRoLoopPart = 100.0 * (iTotalRoLoopIdx / iTotalRoLoopCnt)
+
+                self.iSceneFrame, iRowTopOffset, iRowBotOffset = lSchedule[iRoLoopIdx]
+                lOutputFilenames = self.xCompFileOut.GetOutputFilenames(self.iSceneFrame)
+
+                # Calculate render border
+                iRenderBorderMin = iBorderMaxY - iRowBotOffset + 1
+                iRenderBorderMin = max(0, iRenderBorderMin)
+
+                iRenderBorderMax = iBorderMaxY - iRowTopOffset
+                iRenderBorderMax = min(iRenderResY, iRenderBorderMax)
+
+                # sLog += "Render Border: {} -> {}\n".format(iRenderBorderMin, iRenderBorderMax)
+
+                # To ensure that Blender ends up with the same Borders in pixels
+                # need to add 0.25 to the line indices before converting to
+                # image size ratios. In this way, Blender will get the same values
+                # with floor() and round() after multiplying the ratios with
+                # the render resolution integer.
+                self.xScn.render.border_min_y = (iRenderBorderMin - 0.75) / iRenderResY
+                self.xScn.render.border_max_y = (iRenderBorderMax + 0.25) / iRenderResY
+
+                sLog += "{0}: Min = {1}, Max = {2}, Size = {3}\n".format(
+                    self.iSceneFrame,
+                    iRenderBorderMin,
+                    iRenderBorderMax,
+                    iRenderBorderMax - iRenderBorderMin + 1,
+                )
+
+                # sLog += ("{0}: {1} -> {2} -> {3} -> {4}\n"
+                #          .format(self.iSceneFrame,
+                #               iRenderBorderMin,
+                #               self.xScn.render.border_min_y,
+                #               self.xScn.render.border_min_y * iRenderResY,
+                #               math.floor(self.xScn.render.border_min_y * iRenderResY)
+                #               ))
+
+                # sLog += ("{0}: {1} -> {2} -> {3} -> {4}\n\n"
+                #          .format(self.iSceneFrame,
+                #               iRenderBorderMax,
+                #               self.xScn.render.border_max_y,
+                #               self.xScn.render.border_max_y * iRenderResY,
+                #               math.floor(self.xScn.render.border_max_y * iRenderResY)
+                #               ))
+
+                dTimeRenderStart = timer()
+
+                # Perform the rendering
+                if self.bDoRender:
+                    ##############################################################################
+                    # Set the frame to render
+                    self.xScn.frame_set(self.iSceneFrame)
+                    self.xCtx.view_layer.update()
 
-                        sLog += "Frame {0}, exposure {1} already exists. Skipping...\n".format(
-                            iTrgFrame, self.iSceneFrame
+                    ##############################################################################
+                    # Apply only those modifiers that support mode 'FRAME_UPDATE'
+                    self._ApplyCfgModifier(sMode="FRAME_UPDATE")
+
+                    ######################################################
+                    # Export the label data to json
+                    if xRndOutType.sMainType != NsMainTypesRenderOut.none:
+                        self._ExportLabelData(
+                            os.path.dirname(lOutputFilenames[0]),
+                            self.iSceneFrame,
+                            _bUpdateLabelData3d=False,
+                            _sFrameNamePattern="Exp_{0:07d}.json",
                         )
-
-                        iRoLoopIdx += 1
-                        if not xRsExp.StepReadOutLoop():
-                            bFinished = True
-                            break
-                        # endif
-                    # endwhile fast-forward
-
-                    # If we reached the end of the exposure loop during fast-forward, end loop
-                    if bFinished:
-                        break
                     # endif
+                    ######################################################
 
-                    # Calculate render border
-                    iRenderBorderMin = iBorderMaxY - xRsExp.GetExpLineBottomOffset() + 1
-                    iRenderBorderMin = max(0, iRenderBorderMin)
-
-                    iRenderBorderMax = iBorderMaxY - xRsExp.GetExpLineTopOffset()
-                    iRenderBorderMax = min(iRenderResY, iRenderBorderMax)
-
-                    # sLog += "Render Border: {} -> {}\n".format(iRenderBorderMin, iRenderBorderMax)
-
-                    # To ensure that Blender ends up with the same Borders in pixels
-                    # need to add 0.25 to the line indices before converting to
-                    # image size ratios. In this way, Blender will get the same values
-                    # with floor() and round() after multiplying the ratios with
-                    # the render resolution integer.
-                    self.xScn.render.border_min_y = (iRenderBorderMin - 0.75) / iRenderResY
-                    self.xScn.render.border_max_y = (iRenderBorderMax + 0.25) / iRenderResY
-
-                    sLog += "{0}: Min = {1}, Max = {2}, Size = {3}\n".format(
-                        self.iSceneFrame,
-                        iRenderBorderMin,
-                        iRenderBorderMax,
-                        iRenderBorderMax - iRenderBorderMin + 1,
-                    )
-
-                    # sLog += ("{0}: {1} -> {2} -> {3} -> {4}\n"
-                    #          .format(self.iSceneFrame,
-                    #               iRenderBorderMin,
-                    #               self.xScn.render.border_min_y,
-                    #               self.xScn.render.border_min_y * iRenderResY,
-                    #               math.floor(self.xScn.render.border_min_y * iRenderResY)
-                    #               ))
-
-                    # sLog += ("{0}: {1} -> {2} -> {3} -> {4}\n\n"
-                    #          .format(self.iSceneFrame,
-                    #               iRenderBorderMax,
-                    #               self.xScn.render.border_max_y,
-                    #               self.xScn.render.border_max_y * iRenderResY,
-                    #               math.floor(self.xScn.render.border_max_y * iRenderResY)
-                    #               ))
-
-                    dTimeRenderStart = timer()
-
-                    # Perform the rendering
-                    if self.bDoRender:
-                        ##############################################################################
-                        # Set the frame to render
-                        self.xScn.frame_set(self.iSceneFrame)
-                        self.xCtx.view_layer.update()
-
-                        ##############################################################################
-                        # Apply only those modifiers that support mode 'FRAME_UPDATE'
-                        self._ApplyCfgModifier(sMode="FRAME_UPDATE")
-
-                        ######################################################
-                        # Export the label data to json
-                        if xRndOutType.sMainType != NsMainTypesRenderOut.none:
-                            self._ExportLabelData(
-                                os.path.dirname(lOutputFilenames[0]),
-                                self.iSceneFrame,
-                                _bUpdateLabelData3d=False,
-                                _sFrameNamePattern="Exp_{0:07d}.json",
+                    ##############################################################################
+                    # Re-use a previous exposure with identical scene state, if available.
+                    # The log and render times are still written below, so that they stay
+                    # complete if the job is interrupted.
+                    xPrevInfo = None
+                    if xExpReuse is not None:
+                        sStateHash = xExpReuse.GetSceneStateHash(self.xCtx)
+                        xExpInfo = CRsExpRenderInfo(
+                            self.iSceneFrame, iRenderBorderMin, iRenderBorderMax, lOutputFilenames
+                        )
+                        dTimeReuseStart = timer()
+                        xPrevInfo = xExpReuse.TryReuse(sStateHash, xExpInfo)
+                        if xPrevInfo is not None:
+                            sLog += "{0}: Re-used static scene exposure {1}\n".format(
+                                self.iSceneFrame, xPrevInfo.iSceneFrame
+                            )
+                            xRenderTimes.Add(
+                                _iSceneFrame=self.iSceneFrame,
+                                _iPixelCount=iRenderResX * (iRenderBorderMax - iRenderBorderMin + 1),
+                                _iSamples=self._GetRenderSampleCount(),
+                                _dRenderTime=timer() - dTimeReuseStart,
+                                _bReused=True,
                             )
                         # endif
-                        ######################################################
+                    # endif
 
+                    if xPrevInfo is None:
                         ##############################################################################
                         if bTransformSceneToCameraFrame is True:
                             anycam.ops.TransformSceneToCameraFrame(xContext=self.xCtx)
@@ -361,7 +380,14 @@ class CRenderRollingShutter(CRender):
 
                         ##############################################################################
                         # perform rendering
+                        dTimeRenderOnlyStart = timer()
                         bpy.ops.render.render(write_still=False)
+                        xRenderTimes.Add(
+                            _iSceneFrame=self.iSceneFrame,
+                            _iPixelCount=iRenderResX * (iRenderBorderMax - iRenderBorderMin + 1),
+                            _iSamples=self._GetRenderSampleCount(),
+                            _dRenderTime=timer() - dTimeRenderOnlyStart,
+                        )
 
                         ##############################################################################
                         # If pos3d ground truth was rendered, some offset was applied for rendering.
@@ -378,53 +404,50 @@ class CRenderRollingShutter(CRender):
                             anycam.ops.RevertTransformSceneToCameraFrame(xContext=self.xCtx)
                         # endif
                         ##############################################################################
+
+                        if xExpReuse is not None:
+                            xExpReuse.AddRender(sStateHash, xExpInfo)
+                        # endif
                     # endif
+                # endif
 
-                    dTimeRenderDelta += timer() - dTimeRenderStart
+                dTimeRenderDelta += timer() - dTimeRenderStart
 
-                    ##############################################################################
-                    # Save log data at each nth read out step
-                    if iRoLoopIdx % iRoLoopLogStep == 0:
-                        sTimeRenderDelta = anytime.SecondsToHmsStr(dTimeRenderDelta / iRoLoopLogStep)
-
-                        if iRoLoopIdx > 0:
-                            dTimeNow = timer()
-                            dTimeDelta = dTimeNow - dTimeStart
-                            sTimeDelta = anytime.SecondsToHmsStr(dTimeDelta)
-                            dTimeLeft = (iTotalRoLoopCnt / iTotalRoLoopIdx - 1.0) * dTimeDelta
-                            sTimeLeft = anytime.SecondsToHmsStr(dTimeLeft)
-                        # endif
+                ##############################################################################
+                # Save log data at each nth read out step
+                if iRoLoopIdx % iRoLoopLogStep == 0:
+                    sTimeRenderDelta = anytime.SecondsToHmsStr(dTimeRenderDelta / iRoLoopLogStep)
 
-                        sLog += "Time: {0} + {1} | {2:5.1f}% | {3:5.1f}% | Last render time {4}\n".format(
-                            sTimeDelta,
-                            sTimeLeft,
-                            dRoLoopPart,
-                            dTotalRoLoopPart,
-                            sTimeRenderDelta,
-                        )
+                    if iRoLoopIdx > 0:
+                        dTimeNow = timer()
+                        dTimeDelta = dTimeNow - dTimeStart
+                        sTimeDelta = anytime.SecondsToHmsStr(dTimeDelta)
+                        dTimeLeft = (iTotalRoLoopCnt / iTotalRoLoopIdx - 1.0) * dTimeDelta
+                        sTimeLeft = anytime.SecondsToHmsStr(dTimeLeft)
+                    # endif
 
-                        sLogFull = self.CreateLogHead(True, dTimeStart, iRoLoopIdx, iRoLoopCnt) + sLog
+                    sLog += "Time: {0} + {1} | {2:5.1f}% | {3:5.1f}% | Last render time {4}\n".format(
+                        sTimeDelta,
+                        sTimeLeft,
+                        dRoLoopPart,
+                        dTotalRoLoopPart,
+                        sTimeRenderDelta,
+                    )
 
-                        try:
-                            cathfile.SaveText(sFpLog, sLogFull)
-                        except Exception as xEx:
-                            self.Print("Writing log exception: {0}".format(xEx))
-                        # endtry
+                    sLogFull = self.CreateLogHead(True, dTimeStart, iRoLoopIdx, iRoLoopCnt) + sLog
 
-                        dTimeRenderDelta = 0.0
-                    # endif
+                    try:
+                        cathfile.SaveText(sFpLog, sLogFull)
+                        xRenderTimes.Save(sPathLog, sFileTimes)
+                    except Exception as xEx:
+                        self.Print("Writing log exception: {0}".format(xEx))
+                    # endtry
 
-                    iRoLoopIdx += 1
-                    # if iRoLoopIdx > 1:
-                    #     break
-                    # # endif
+                    dTimeRenderDelta = 0.0
+                # endif
 
-                    # Next read out step
-                    if not xRsExp.StepReadOutLoop():
-                        break
-                    # endif
-                # endwhile read-out loop
-            # endif start read-out loop
+            # endfor read-out loop
+            iRoLoopIdx = len(lSchedule)
 
             dTimeNow = timer()
             dTimeDelta = dTimeNow - dTimeStart
@@ -432,11 +455,15 @@ class CRenderRollingShutter(CRender):
 
             sLog += "\n\n"
             sLog += "Total processing time: {0}\n".format(sTimeDelta)
+            if xExpReuse is not None:
+                sLog += "Re-used static scene exposures in frame: {0}\n".format(xExpReuse.iReuseCnt)
+            # endif
 
             sLogFull = self.CreateLogHead(False, dTimeStart, iRoLoopIdx, iRoLoopCnt) + sLog
 
             try:
                 cathfile.SaveText(sFpLog, sLogFull)
+                xRenderTimes.Save(sPathLog, sFileTimes)
             except Exception:
                 self.Print("ERROR: Can not write log to file: {0}".format(sFpLog))
             # endtry
@@ -448,6 +475,50 @@ class CRenderRollingShutter(CRender):
 
     # enddef
 
+    ################################################################################
+    # Get the indices of the read-out schedule entries that need to be rendered.
+    # Each output folder is scanned only once, instead of testing every exposure
+    # file separately. With the overwrite flag set, all existing exposure files
+    # are removed and all exposures are rendered.
+    def _GetExposuresToRender(self, _lSchedule: list) -> list[int]:
+        dicFolderFiles: dict[str, set] = {}
+        lExpFiles: list[list[str]] = []
+        for iSceneFrame, iRowTopOffset, iRowBotOffset in _lSchedule:
+            lOutputFilenames = self.xCompFileOut.GetOutputFilenames(iSceneFrame)
+            lExpFiles.append(lOutputFilenames)
+            for sFo in lOutputFilenames:
+                sFolder = os.path.dirname(sFo)
+                if sFolder not in dicFolderFiles:
+                    dicFolderFiles[sFolder] = cbu_path.GetFileNames(sFolder)
+                # endif
+            # endfor
+        # endfor
+
+        lRenderIdx: list[int] = []
+        iRemoveCnt = 0
+        for iIdx, lOutputFilenames in enumerate(lExpFiles):
+            lExisting = [x for x in lOutputFilenames if os.path.basename(x) in dicFolderFiles[os.path.dirname(x)]]
+
+            if self.bDoOverwrite:
+                for sFo in lExisting:
+                    os.remove(sFo)
+                # endfor
+                iRemoveCnt += len(lExisting)
+                lRenderIdx.append(iIdx)
+
+            elif len(lExisting) < len(lOutputFilenames):
+                lRenderIdx.append(iIdx)
+            # endif
+        # endfor
+
+        if iRemoveCnt > 0:
+            self.Print("...removed {0} files due to overwrite flag".format(iRemoveCnt))
+        # endif
+
+        return lRenderIdx
+
+    # enddef
+
     ################################################################################
     def CreateLogHead(self, _bRunning, _dTimeStart, _iRoLoopIdx, _iRoLoopCnt):
         sT = ""
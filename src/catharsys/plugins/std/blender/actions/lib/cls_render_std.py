@@ -28,10 +28,12 @@
 
 import bpy
 import os
+from timeit import default_timer as timer
 
 from .cls_render import NsConfigDTI
 from .cls_render import CRender, CRenderOutputType
 from .cls_render import NsMainTypesRenderOut, NsSpecificTypesRenderOut
+from .cls_render_times import CRenderTimes
 
 from anybase.cls_any_error import CAnyError_Message
 from catharsys.plugins.std.blender.config.cls_modify_list import CConfigModifyList
@@ -212,6 +214,10 @@ class CRenderStandard(CRender):
             # Apply only those modifiers that suppor mode 'FRAME_UPDATE'
             self._ApplyCfgModifier(sMode="FRAME_UPDATE")
 
+            sPathLog = os.path.join(self.sPathTrgMain, CRenderTimes.sFolder)
+            sFileTimes = "frame-{0:04d}".format(self.iTargetFrame)
+            xRenderTimes = CRenderTimes()
+
             # Loop over all render outputs in config
             for iOutIdx, dicFiles in dicRenderTypes.items():
                 dicRndOut = self.lRndOutTypes[iOutIdx]
@@ -320,7 +326,14 @@ class CRenderStandard(CRender):
                             bpy.ops.render.opengl(write_still=True)
                             self.Print("\n>> Render OpenGL finished\n")
                         else:
+                            dTimeRenderStart = timer()
                             bpy.ops.render.render(write_still=False)
+                            xRenderTimes.Add(
+                                _iSceneFrame=self.iSceneFrame,
+                                _iPixelCount=self._GetRenderPixelCount(),
+                                _iSamples=self._GetRenderSampleCount(),
+                                _dRenderTime=timer() - dTimeRenderStart,
+                            )
                             self.Print("\n>> Render finished\n")
 
                             # Rename Exp files to Frame file for standard exposure
@@ -364,6 +377,15 @@ class CRenderStandard(CRender):
                 # endif
             # endfor dicRndOut
 
+            try:
+                if xRenderTimes.GetRenderCount() > 0:
+                    os.makedirs(sPathLog, exist_ok=True)
+                    xRenderTimes.Save(sPathLog, sFileTimes)
+                # endif
+            except Exception as xEx:
+                self.Print("WARNING: Can not write render times to path: {0}\n{1}".format(sPathLog, xEx))
+            # endtry
+
         # endfor iFrameIdx, dicRenderFramesTypes
 
         return True
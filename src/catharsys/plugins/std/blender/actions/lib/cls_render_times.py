@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \actions\lib\cls_render_times.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Render timing history.
+# Render actions record the time per render together with the number of
+# rendered pixels and samples. The render planner uses this history to
+# estimate the wall time of renders that still have to be done.
+
+from pathlib import Path
+from typing import Optional
+
+from catharsys.util import config as cathcfg
+
+
+class CRenderTimes:
+    sDTI: str = "/catharsys/blender/render/times:1.0"
+    sFolder: str = "_log"
+    sFilePrefix: str = "render-times"
+
+    ###################################################################################
+    def __init__(self):
+        self.lRenders: list[dict] = []
+
+    # enddef
+
+    ###################################################################################
+    # Renders that re-used a previous exposure instead of rendering are flagged with '_bReused'.
+    def Add(
+        self, *, _iSceneFrame: int, _iPixelCount: int, _iSamples: int, _dRenderTime: float, _bReused: bool = False
+    ):
+        dicRender = {
+            "iSceneFrame": _iSceneFrame,
+            "iPixelCount": _iPixelCount,
+            "iSamples": _iSamples,
+            "dRenderTime": _dRenderTime,
+        }
+        if _bReused is True:
+            dicRender["bReused"] = True
+        # endif
+        self.lRenders.append(dicRender)
+
+    # enddef
+
+    ###################################################################################
+    # Get the path of the render times file with the given name
+    @staticmethod
+    def GetFilePath(_sPath: str, _sName: str) -> Path:
+        return Path(_sPath) / f"{CRenderTimes.sFilePrefix}_{_sName}.json"
+
+    # enddef
+
+    ###################################################################################
+    # Load the render times of a previous, possibly interrupted, run,
+    # so that they are not overwritten when saving.
+    def Load(self, _sPath: str, _sName: str):
+        pathFile = CRenderTimes.GetFilePath(_sPath, _sName)
+        if not pathFile.is_file():
+            return
+        # endif
+
+        try:
+            dicData = cathcfg.Load(pathFile, sDTI="/catharsys/blender/render/times:1")
+        except Exception as xEx:
+            print(f"WARNING: Cannot load render times file '{pathFile.as_posix()}': {xEx}")
+            return
+        # endtry
+        self.lRenders.extend(dicData.get("lRenders", []))
+
+    # enddef
+
+    ###################################################################################
+    def Save(self, _sPath: str, _sName: str):
+        if len(self.lRenders) == 0:
+            return
+        # endif
+
+        pathFile = CRenderTimes.GetFilePath(_sPath, _sName)
+        cathcfg.Save((pathFile.parent.as_posix(), pathFile.stem), {"lRenders": self.lRenders}, sDTI=self.sDTI)
+
+    # enddef
+
+    ###################################################################################
+    # Load all render time files from the '_log' folders in the given path
+    # and in all its direct sub-folders.
+    @staticmethod
+    def LoadFromPath(_pathMain: Path) -> "CRenderTimes":
+        xTimes = CRenderTimes()
+        if not _pathMain.is_dir():
+            return xTimes
+        # endif
+
+        sPattern = f"{CRenderTimes.sFilePrefix}_*.json"
+        lFiles = list(_pathMain.glob(f"{CRenderTimes.sFolder}/{sPattern}"))
+        lFiles.extend(_pathMain.glob(f"*/{CRenderTimes.sFolder}/{sPattern}"))
+
+        for pathFile in lFiles:
+            xTimes.Load(pathFile.parent.as_posix(), pathFile.stem[len(CRenderTimes.sFilePrefix) + 1 :])
+        # endfor
+
+        return xTimes
+
+    # enddef
+
+    ###################################################################################
+    def GetRenderCount(self) -> int:
+        return len(self.lRenders)
+
+    # enddef
+
+    ###################################################################################
+    # Iterate over the renders that did not re-use a previous exposure
+    def _IterRendered(self):
+        return (x for x in self.lRenders if x.get("bReused") is not True)
+
+    # enddef
+
+    ###################################################################################
+    # Average render time per render. Re-used exposures are not included.
+    def GetTimePerRender(self) -> Optional[float]:
+        lTimes: list[float] = [x["dRenderTime"] for x in self._IterRendered()]
+        if len(lTimes) == 0:
+            return None
+        # endif
+
+        return sum(lTimes) / len(lTimes)
+
+    # enddef
+
+    ###################################################################################
+    # Average render time per rendered pixel-sample. Re-used exposures are not included.
+    def GetTimePerPixelSample(self) -> Optional[float]:
+        dTime = 0.0
+        iPixelSamples = 0
+        for dicRender in self._IterRendered():
+            iPixelCount = dicRender.get("iPixelCount")
+            iSamples = dicRender.get("iSamples")
+            if not isinstance(iPixelCount, int) or not isinstance(iSamples, int):
+                continue
+            # endif
+            iPixelSamples += iPixelCount * max(1, iSamples)
+            dTime += dicRender["dRenderTime"]
+        # endfor
+
+        if iPixelSamples == 0:
+            return None
+        # endif
+
+        return dTime / iPixelSamples
+
+    # enddef
+
+
+# endclass
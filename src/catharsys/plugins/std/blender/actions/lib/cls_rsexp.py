@@ -353,6 +353,26 @@ class CRsExp:
 
     # enddef
 
+    ###################################################################################
+    # Get the whole read-out loop of the current target frame in one go.
+    # Returns a list of tuples (iExpStartScnFrame, iRowTopOffset, iRowBotOffset),
+    # one for each step of the read-out loop.
+    def GetReadOutSchedule(self, iLoopOffset=0, iLoopStep=1, iLoopCountMax=0):
+
+        lSchedule = []
+        if self.StartReadOutLoop(iLoopOffset=iLoopOffset, iLoopStep=iLoopStep, iLoopCountMax=iLoopCountMax):
+            while True:
+                lSchedule.append((self.iExpStartScnFrame, self.iRowTopOffset, self.iRowBotOffset))
+                if not self.StepReadOutLoop():
+                    break
+                # endif
+            # endwhile
+        # endif
+
+        return lSchedule
+
+    # enddef
+
     ###################################################################################
     def GetExpStartSceneFrame(self):
         return self.iExpStartScnFrame
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \actions\lib\cls_rsexp_reuse.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Re-use of rolling shutter exposures for static scene states.
+# If the scene state at the scene frame of an exposure is identical to the state
+# of a previously rendered exposure, whose render border contains the current
+# render border, the current exposure is cropped from the previous result
+# instead of being rendered again.
+
+import bpy
+
+import os
+import shutil
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+# need to enable OpenExr explicitly
+os.environ["OPENCV_IO_ENABLE_OPENEXR"] = "1"
+import cv2
+
+
+@dataclass
+class CRsExpRenderInfo:
+    iSceneFrame: int
+    iBorderMin: int
+    iBorderMax: int
+    lOutputFilenames: list[str]
+
+
+# endclass
+
+
+class CRsExpReuse:
+    # ID collections whose animated properties are relevant for rendering
+    lAnimDataTypes: list[str] = [
+        "objects",
+        "cameras",
+        "lights",
+        "materials",
+        "node_groups",
+        "worlds",
+        "shape_keys",
+        "meshes",
+        "scenes",
+    ]
+
+    ###################################################################################
+    def __init__(self):
+        self.dicRenders: dict[str, list[CRsExpRenderInfo]] = {}
+        self.iReuseCnt: int = 0
+
+    # enddef
+
+    ###################################################################################
+    # Remove all stored renders and reset the count of re-used exposures
+    def Clear(self):
+        self.dicRenders = {}
+        self.iReuseCnt = 0
+
+    # enddef
+
+    ###################################################################################
+    # Hash the evaluated world transforms of all rendered object instances
+    # and the current values of all animated and driven properties.
+    # This has to be called after the scene frame has been set.
+    def GetSceneStateHash(self, _xCtx: bpy.types.Context) -> str:
+        xHash = hashlib.sha1()
+
+        xDepsGraph = _xCtx.evaluated_depsgraph_get()
+        for xInst in xDepsGraph.object_instances:
+            objX = xInst.object
+            if objX.hide_render is True:
+                continue
+            # endif
+            xHash.update(objX.name.encode("utf-8"))
+            xHash.update(np.array(xInst.matrix_world, dtype=np.float64).tobytes())
+
+            if objX.type == "ARMATURE" and objX.pose is not None:
+                for xBone in objX.pose.bones:
+                    xHash.update(np.array(xBone.matrix, dtype=np.float64).tobytes())
+                # endfor
+            # endif
+        # endfor
+
+        for sType in CRsExpReuse.lAnimDataTypes:
+            for xId in getattr(bpy.data, sType):
+                xAnimData = getattr(xId, "animation_data", None)
+                if xAnimData is None:
+                    continue
+                # endif
+
+                lFCurves = list(xAnimData.drivers)
+                if xAnimData.action is not None:
+                    lFCurves.extend(xAnimData.action.fcurves)
+                # endif
+
+                for xFCurve in lFCurves:
+                    xHash.update(f"{sType}:{xId.name}:{xFCurve.data_path}:{xFCurve.array_index}".encode("utf-8"))
+                    try:
+                        xValue = xId.path_resolve(xFCurve.data_path)
+                        if hasattr(xValue, "__len__") and not isinstance(xValue, str):
+                            xValue = xValue[xFCurve.array_index]
+                        # endif
+                    except Exception:
+                        xValue = None
+                    # endtry
+                    xHash.update(repr(xValue).encode("utf-8"))
+                # endfor
+            # endfor
+        # endfor
+
+        return xHash.hexdigest()
+
+    # enddef
+
+    ###################################################################################
+    def AddRender(self, _sHash: str, _xInfo: CRsExpRenderInfo):
+        lRenders = self.dicRenders.get(_sHash)
+        if lRenders is None:
+            lRenders = self.dicRenders[_sHash] = []
+        # endif
+        lRenders.append(_xInfo)
+
+    # enddef
+
+    ###################################################################################
+    # Try to create the output files of the given exposure from a previous render
+    # with the same scene state. Returns the render info of the re-used exposure,
+    # or None if no matching exposure exists or its files cannot be used.
+    def TryReuse(self, _sHash: str, _xInfo: CRsExpRenderInfo) -> CRsExpRenderInfo:
+        for xPrev in self.dicRenders.get(_sHash, []):
+            if xPrev.iBorderMin > _xInfo.iBorderMin or xPrev.iBorderMax < _xInfo.iBorderMax:
+                continue
+            # endif
+            if len(xPrev.lOutputFilenames) != len(_xInfo.lOutputFilenames):
+                continue
+            # endif
+
+            if self._CopyCropped(xPrev, _xInfo) is True:
+                self.iReuseCnt += 1
+                return xPrev
+            # endif
+        # endfor
+
+        return None
+
+    # enddef
+
+    ###################################################################################
+    def _CopyCropped(self, _xPrev: CRsExpRenderInfo, _xInfo: CRsExpRenderInfo) -> bool:
+        bSameBorder = _xPrev.iBorderMin == _xInfo.iBorderMin and _xPrev.iBorderMax == _xInfo.iBorderMax
+
+        # Images are cropped to the render border. The border line indices count from the
+        # bottom of the image, while image rows count from the top.
+        iRowStart = _xPrev.iBorderMax - _xInfo.iBorderMax
+        iRowEnd = _xPrev.iBorderMax - _xInfo.iBorderMin + 1
+        iPrevRows = _xPrev.iBorderMax - _xPrev.iBorderMin + 1
+
+        lImages = []
+        for sFpPrev in _xPrev.lOutputFilenames:
+            if not os.path.isfile(sFpPrev):
+                return False
+            # endif
+
+            if bSameBorder is True:
+                lImages.append(None)
+                continue
+            # endif
+
+            imgPrev = cv2.imread(sFpPrev, cv2.IMREAD_ANYCOLOR | cv2.IMREAD_ANYDEPTH | cv2.IMREAD_UNCHANGED)
+            if imgPrev is None or imgPrev.shape[0] != iPrevRows:
+                return False
+            # endif
+            lImages.append(imgPrev[iRowStart:iRowEnd])
+        # endfor
+
+        for sFpPrev, sFpOut, imgOut in zip(_xPrev.lOutputFilenames, _xInfo.lOutputFilenames, lImages):
+            os.makedirs(os.path.dirname(sFpOut), exist_ok=True)
+            if imgOut is None:
+                shutil.copyfile(sFpPrev, sFpOut)
+            else:
+                cv2.imwrite(sFpOut, imgOut)
+            # endif
+        # endfor
+
+        return True
+
+    # enddef
+
+
+# endclass
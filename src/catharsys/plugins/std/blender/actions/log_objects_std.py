@@ -75,6 +75,8 @@ def Run(_xCfg: CConfigList):
         xRender.Init()
         if xRender.Process() is True and iCfgIdx + 1 < iCfgCnt:
             xRender.Finalize()
+        else:
+            xRender.ReportProfile()
         # endif
 
     # enddef
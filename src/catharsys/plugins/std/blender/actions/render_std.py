@@ -65,6 +65,17 @@ def ResultData(xJobCfg: CConfigManifestJob):
     return CRenderResultData(xJobCfg=xJobCfg)
 
 
+# enddef
+
+################################################################################
+# Dry-run plan of the renders this action would do for a job,
+# evaluated without starting Blender.
+def Plan(xJobCfg: CConfigManifestJob):
+    from .lib.cls_render_plan import CRenderPlan
+
+    return CRenderPlan(xJobCfg=xJobCfg)
+
+
 # enddef
 
 ################################################################################
@@ -91,6 +102,8 @@ def Run(_xCfg: CConfigList):
         xRender.Init()
         if xRender.Process() is True and iCfgIdx + 1 < iCfgCnt:
             xRender.Finalize()
+        else:
+            xRender.ReportProfile()
         # endif
 
     # enddef
@@ -26,21 +26,18 @@
 # </LICENSE>
 ###
 
-from anybase import plugin, config
+from catharsys.plugins.std.blender.util import entry_point
 
 ############################################################################################
 def GetAnimateHandlerFactory(_sModTypeDti, _sDtiClass):
 
-    if config.CheckDti(_sModTypeDti, _sDtiClass)["bOK"] is False:
+    if entry_point.CheckDti(_sModTypeDti, _sDtiClass) is False:
         raise RuntimeError(
             "Modifier '{}' is not of type '{}'".format(_sModTypeDti, _sDtiClass)
         )
     # endif
 
-    epFunc = plugin.SelectEntryPointFromDti(
-        sGroup="catharsys.blender.animate", sTrgDti=_sModTypeDti, sTypeDesc="Animator"
-    )
-    return epFunc.load()
+    return entry_point.LoadEntryPoint("catharsys.blender.animate", _sModTypeDti, "Animator")
 
 
 # enddef
@@ -29,10 +29,13 @@
 import bpy
 
 from anybase import config
+from anybase import convert
 from anybase.cls_anycml import CAnyCML
 import anyblend
 import ison
 from ..generate import util
+from ..util import library as cbu_lib
+from ..modify import eval_cache
 
 
 class CConfigGenerateList:
@@ -41,6 +44,14 @@ class CConfigGenerateList:
     lData: list = None
     dicGeneratedObjects: dict = {}
 
+    # Generators that load data blocks from Blender files, with the data block type
+    # and the configuration element that contains the data block names.
+    lLibraryLoaders: list[tuple[str, str, str]] = [
+        ("/catharsys/blender/generate/collection/load:*", "collections", "mCollections"),
+        ("/catharsys/blender/generate/material/load:*", "materials", "mMaterials"),
+        ("/catharsys/blender/generate/object/load:*", "objects", "sSrcName"),
+    ]
+
     ############################################################
     # The constructor
     def __init__(self, _lData):
@@ -49,6 +60,60 @@ class CConfigGenerateList:
 
     # enddef
 
+    ############################################################
+    # Register the data blocks all enabled generators load from Blender files
+    # with the library broker, so that each Blender file is only opened once.
+    def _RequestLibraryData(self, _lData):
+        for dicCfgGen in _lData:
+            if not isinstance(dicCfgGen, dict):
+                continue
+            # endif
+
+            # Data blocks appended from the same file in a single load operation share their
+            # dependencies, e.g. a loaded material may also be used by the meshes of a loaded
+            # collection. Therefore, this is only done if the configuration allows it.
+            if convert.DictElementToBool(dicCfgGen, "bShareLibraryData", bDefault=False) is False:
+                continue
+            # endif
+
+            lGens = dicCfgGen.get("lGenerators")
+            if not isinstance(lGens, list):
+                continue
+            # endif
+
+            for dicGen in lGens:
+                if not isinstance(dicGen, dict):
+                    continue
+                # endif
+
+                sGenDti = dicGen.get("sDTI")
+                sBlenderFilename = dicGen.get("sBlenderFilename")
+                if not isinstance(sGenDti, str) or not isinstance(sBlenderFilename, str):
+                    continue
+                # endif
+
+                if convert.DictElementToBool(dicGen, "bEnabled", bDefault=True) is False:
+                    continue
+                # endif
+
+                # Linked data blocks are not appended
+                if str(dicGen.get("sImportMode", "APPEND")).upper() == "LINK":
+                    continue
+                # endif
+
+                for sLoaderDti, sDataType, sElement in self.lLibraryLoaders:
+                    if config.IsDti(sGenDti, sLoaderDti):
+                        xNames = dicGen.get(sElement)
+                        lNames = list(xNames.keys()) if isinstance(xNames, dict) else [xNames]
+                        cbu_lib.Request(sBlenderFilename, sDataType, lNames)
+                        break
+                    # endif
+                # endfor
+            # endfor
+        # endfor
+
+    # enddef
+
     ############################################################
     def Apply(self, dicConstVars=None, dicRefVars=None):
 
@@ -73,50 +138,62 @@ class CConfigGenerateList:
         # endif
 
         self.dicGeneratedObjects = {}
-        for dicCfgGen in lActData:
-            config.AssertConfigType(dicCfgGen, "/catharsys/blender/generate:1")
-
-            sCfgId = dicCfgGen.get("sId")
-            lGens: list[dict] = dicCfgGen.get("lGenerators")
-            if lGens is None:
-                raise RuntimeError(
-                    f"Config '{sCfgId}': Element 'lGenerators' missing in generator configuration"
-                )
-            # endif
-            if not isinstance(lGens, list):
-                raise RuntimeError(
-                    f"Config '{sCfgId}': Element 'lGenerators' is not of type 'list'"
-                )
-            # endif
 
-            for dicGen in lGens:
-                if not isinstance(dicGen, dict):
+        # Load the data blocks of all generators from Blender files, opening each file only once
+        self._RequestLibraryData(lActData)
+        cbu_lib.LoadRequested()
+
+        try:
+            for dicCfgGen in lActData:
+                config.AssertConfigType(dicCfgGen, "/catharsys/blender/generate:1")
+
+                sCfgId = dicCfgGen.get("sId")
+                lGens: list[dict] = dicCfgGen.get("lGenerators")
+                if lGens is None:
                     raise RuntimeError(
-                        f"Config '{sCfgId}': Element of 'lGenerators' list is not a dictionary: '{dicGen}'"
+                        f"Config '{sCfgId}': Element 'lGenerators' missing in generator configuration"
                     )
                 # endif
-
-                # copy locals and globals from dicData to modifier groups
-                # so that they are available when parsing the modifiers with previously
-                # incomplete references
-                ison.util.data.AddLocalGlobalVars(
-                    dicGen, dicCfgGen, bThrowOnDisallow=False
-                )
-
-                sGenDti = dicGen.get("sDTI")
-                if sGenDti is None:
+                if not isinstance(lGens, list):
                     raise RuntimeError(
-                        f"Config '{sCfgId}': Element 'sDTI' missing in generator configuration"
+                        f"Config '{sCfgId}': Element 'lGenerators' is not of type 'list'"
                     )
                 # endif
 
-                funcGenCls = util.GetGenerateClassFunc(
-                    sGenDti, "/catharsys/blender/generate/*:*"
-                )
-                self.UpdateGeneratedDict(funcGenCls(dicGen, dicVars=dicVars))
+                for dicGen in lGens:
+                    if not isinstance(dicGen, dict):
+                        raise RuntimeError(
+                            f"Config '{sCfgId}': Element of 'lGenerators' list is not a dictionary: '{dicGen}'"
+                        )
+                    # endif
+
+                    # copy locals and globals from dicData to modifier groups
+                    # so that they are available when parsing the modifiers with previously
+                    # incomplete references
+                    ison.util.data.AddLocalGlobalVars(
+                        dicGen, dicCfgGen, bThrowOnDisallow=False
+                    )
 
-            # endfor generator process functions
-        # endfor generation configs
+                    sGenDti = dicGen.get("sDTI")
+                    if sGenDti is None:
+                        raise RuntimeError(
+                            f"Config '{sCfgId}': Element 'sDTI' missing in generator configuration"
+                        )
+                    # endif
+
+                    funcGenCls = util.GetGenerateClassFunc(
+                        sGenDti, "/catharsys/blender/generate/*:*"
+                    )
+                    self.UpdateGeneratedDict(funcGenCls(dicGen, dicVars=dicVars))
+
+                # endfor generator process functions
+            # endfor generation configs
+        finally:
+            # Remove data blocks that were loaded, but not used by a generator
+            cbu_lib.ReleaseUnused()
+            # Generators create, replace and move objects referenced by cached evaluator results
+            eval_cache.Invalidate()
+        # endtry
 
     # enddef
 
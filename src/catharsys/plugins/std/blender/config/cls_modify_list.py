@@ -27,6 +27,9 @@
 ###
 
 import sys
+import copy
+from typing import Callable, Optional
+from dataclasses import dataclass, field
 
 from ..modify import nodegroups
 from ..modify import materials
@@ -34,6 +37,8 @@ from ..modify import objects
 from ..modify import collections
 from ..modify import scenes
 from ..modify import program
+from ..modify import util as modutil
+from ..util import viewlayer as cbu_vl
 
 from anybase import config
 from anybase.cls_anycml import CAnyCML
@@ -42,8 +47,39 @@ import anyblend
 import ison
 
 
+############################################################
+# A single modify configuration block of the compiled execution plan
+@dataclass
+class CModifyBlock:
+    # The raw configuration data
+    dicData: dict
+    # The modifier groups present in the block, with their handler and mode filter functions
+    lGroups: list[tuple[str, Callable, Callable]]
+    # True if the block references variables and has to be parsed for every call
+    bDynamic: bool
+    # The parsed data of a block without variable references
+    dicStatic: Optional[dict] = None
+    # Dictionary of apply mode to list of (handler, modifier group) tuples,
+    # where the modifier groups only contain the modifiers active in that mode.
+    # Only used for blocks without variable references.
+    dicModeGroups: dict = field(default_factory=dict)
+
+
+# endclass
+
+
 class CConfigModifyList:
 
+    # Modifier groups with their handler and mode filter functions, in the order they are applied
+    lModFuncs: list[tuple[str, Callable, Callable]] = [
+        ("mNodeGroups", nodegroups.ModifyNodeGroups, modutil.FilterModifierTargets),
+        ("mMaterials", materials.ModifyMaterials, modutil.FilterModifierTargets),
+        ("mObjects", objects.ModifyObjects, modutil.FilterModifierTargets),
+        ("mCollections", collections.ModifyCollections, modutil.FilterModifierTargets),
+        ("mScenes", scenes.ModifyScenes, modutil.FilterModifierTargets),
+        ("mProgram", program.Execute, modutil.FilterProgram),
+    ]
+
     # The configuration data
     lData: list = None
 
@@ -52,6 +88,48 @@ class CConfigModifyList:
     def __init__(self, _lData):
 
         self.lData = _lData
+        self.lPlan: Optional[list[CModifyBlock]] = None
+
+    # enddef
+
+    ############################################################
+    # Check the configuration blocks and determine, which modifier groups they contain
+    # and whether they need to be parsed with the runtime variables for every call.
+    def _Compile(self):
+        self.lPlan = []
+        for dicData in self.lData:
+            config.AssertConfigType(dicData, "/catharsys/blender/modify:1")
+
+            lGroups = [tMod for tMod in self.lModFuncs if tMod[0] in dicData]
+            self.lPlan.append(CModifyBlock(dicData=dicData, lGroups=lGroups, bDynamic=modutil.HasVarRefs(dicData)))
+        # endfor
+
+    # enddef
+
+    ############################################################
+    # Get the list of (handler, modifier group) tuples of a block, where each
+    # modifier group only contains the modifiers that are active in the given mode.
+    # In this way, the handlers only visit the modifiers they actually apply.
+    def _GetModeGroups(self, _xBlock: CModifyBlock, _dicData: dict, _sMode: str) -> list[tuple[Callable, dict]]:
+        lModeGroups = []
+        for sModName, funcHandler, funcFilter in _xBlock.lGroups:
+            dicMod = _dicData.get(sModName)
+            if dicMod is None:
+                continue
+            # endif
+
+            # copy locals and globals from dicData to modifier groups
+            # so that they are available when parsing the modifiers with previously
+            # incomplete references
+            ison.util.data.AddLocalGlobalVars(dicMod, _dicData, bThrowOnDisallow=False)
+
+            dicModeMod = funcFilter(dicMod, _sMode)
+            if dicModeMod is not None:
+                lModeGroups.append((funcHandler, dicModeMod))
+            # endif
+        # endfor
+
+        return lModeGroups
 
     # enddef
 
@@ -62,13 +140,52 @@ class CConfigModifyList:
             raise Exception("No modify configuration list given.")
         # endif
 
-        lActData = self.lData
+        if self.lPlan is None:
+            self._Compile()
+        # endif
+
         # sys.stderr.write(f"\ndicConstVars: {dicConstVars}\n")
-        # sys.stderr.write(f"\nlActData: {lActData}\n")
 
-        if dicConstVars is not None or dicRefVars is not None:
-            xParser = CAnyCML(dicConstVars=dicConstVars, dicRefVars=dicRefVars)
-            lActData = xParser.Process(self.lData)
+        # Only parse the blocks that reference variables, or that have not been parsed before.
+        # Blocks without variable references always parse to the same data, so their first
+        # parse result is reused. Of the other blocks only the globals are parsed again,
+        # so that they can still be referenced in the blocks that follow.
+        bParse = dicConstVars is not None or dicRefVars is not None
+        lActData = [xBlock.dicData for xBlock in self.lPlan]
+        if bParse is True:
+            # Index of the block for each parsed element, or None for the globals of a parsed block
+            lParseIdx: list[Optional[int]] = []
+            lParseData: list[dict] = []
+            for iIdx, xBlock in enumerate(self.lPlan):
+                if xBlock.bDynamic is True or xBlock.dicStatic is None:
+                    lParseIdx.append(iIdx)
+                    lParseData.append(xBlock.dicData)
+                elif "__globals__" in xBlock.dicData:
+                    lParseIdx.append(None)
+                    lParseData.append({"__globals__": xBlock.dicData["__globals__"]})
+                # endif
+            # endfor
+
+            if any(iIdx is not None for iIdx in lParseIdx):
+                xParser = CAnyCML(dicConstVars=dicConstVars, dicRefVars=dicRefVars)
+                lParsed = xParser.Process(lParseData)
+                for iIdx, dicParsed in zip(lParseIdx, lParsed):
+                    if iIdx is None:
+                        continue
+                    # endif
+                    xBlock = self.lPlan[iIdx]
+                    if xBlock.bDynamic is False:
+                        xBlock.dicStatic = dicParsed
+                    # endif
+                    lActData[iIdx] = dicParsed
+                # endfor
+            # endif
+
+            for iIdx, xBlock in enumerate(self.lPlan):
+                if xBlock.dicStatic is not None:
+                    lActData[iIdx] = xBlock.dicStatic
+                # endif
+            # endfor
         # endif
         # sys.stderr.write(f"\nlActData: {lActData}\n")
         # sys.stderr.flush()
@@ -82,34 +199,32 @@ class CConfigModifyList:
             dicVars.update(dicRefVars)
         # endif
 
-        lModFuncs = [
-            ("mNodeGroups", nodegroups.ModifyNodeGroups),
-            ("mMaterials", materials.ModifyMaterials),
-            ("mObjects", objects.ModifyObjects),
-            ("mCollections", collections.ModifyCollections),
-            ("mScenes", scenes.ModifyScenes),
-            ("mProgram", program.Execute),
-        ]
-
-        for dicData in lActData:
-            config.AssertConfigType(dicData, "/catharsys/blender/modify:1")
-
-            for sModName, funcHandler in lModFuncs:
-                dicMod = dicData.get(sModName)
-                if dicMod is None:
-                    continue
+        # View layer updates requested by the modifiers are performed once,
+        # after all modifiers have been applied.
+        with cbu_vl.DeferredUpdates():
+            for xBlock, dicData in zip(self.lPlan, lActData):
+                if xBlock.bDynamic is False and dicData is xBlock.dicStatic:
+                    lModeGroups = xBlock.dicModeGroups.get(sMode)
+                    if lModeGroups is None:
+                        lModeGroups = xBlock.dicModeGroups[sMode] = self._GetModeGroups(xBlock, dicData, sMode)
+                    # endif
+                    # The handlers get a copy, so that they cannot change the cached modifier groups.
+                    # Programs copy the data of each element themselves when they are executed.
+                    lModeGroups = [
+                        (funcHandler, dicMod if funcHandler is program.Execute else copy.deepcopy(dicMod))
+                        for funcHandler, dicMod in lModeGroups
+                    ]
+                else:
+                    lModeGroups = self._GetModeGroups(xBlock, dicData, sMode)
                 # endif
 
-                # copy locals and globals from dicData to modifier groups
-                # so that they are available when parsing the modifiers with previously
-                # incomplete references
-                ison.util.data.AddLocalGlobalVars(dicMod, dicData, bThrowOnDisallow=False)
-
-                # Execute the modify handler
-                # funcHandler may return a single revert function or a list of functions
-                funcHandler(dicMod, sMode=sMode, dicVars=dicVars)
+                for funcHandler, dicMod in lModeGroups:
+                    # Execute the modify handler
+                    # funcHandler may return a single revert function or a list of functions
+                    funcHandler(dicMod, sMode=sMode, dicVars=dicVars)
+                # endfor
             # endfor
-        # endfor
+        # endwith
 
         # After applying modifiers, which may object properties,
         # all drivers should be updated, so that follow up calls
@@ -30,6 +30,7 @@ import bpy
 
 import copy
 import re
+import json
 from collections import defaultdict
 from pathlib import Path
 from typing import Optional
@@ -52,6 +53,9 @@ from .object_std import _DoImportObjectAny
 from anyblend import tools as anytools
 from anyblend import viewlayer as anyvl
 from anyblend import object as anyobj
+from catharsys.plugins.std.blender.util import library as cbu_lib
+from catharsys.plugins.std.blender.util import folder_walk as cbu_fw
+from catharsys.plugins.std.blender.util import log as cbu_log
 
 
 ############################################################################################
@@ -97,6 +101,141 @@ def CreateCollections(_dicGenCln, **kwargs):
 # enddef
 
 
+############################################################################################
+# Get the parent collection for a target collection hierarchy, creating it if necessary
+def _GetTargetParentCollection(_lTrgClnTree: list[str]) -> bpy.types.Collection:
+    if len(_lTrgClnTree) > 1:
+        anyblend.collection.CreateCollectionHierarchy(bpy.context, _lTrgClnTree[0:-1])
+        return anyblend.collection.GetActiveCollection(bpy.context)
+    # endif
+
+    return anyblend.collection.GetRootCollection(bpy.context)
+
+
+# enddef
+
+
+############################################################################################
+# Get the collection of the current Blender file with the given name.
+# Linked collections with the same name, e.g. the linked source collection, are ignored.
+def _GetLocalCollection(_sName: str) -> Optional[bpy.types.Collection]:
+    for clnX in bpy.data.collections:
+        if clnX.name == _sName and clnX.library is None:
+            return clnX
+        # endif
+    # endfor
+
+    return None
+
+
+# enddef
+
+
+############################################################################################
+# Link collections from a Blender file, instead of appending them.
+# The mesh, material and image data stays in the library file and is shared by all configurations.
+# Collections that set 'bOverride' to true, get a library override, so that
+# their objects can be modified. By default, this is the case for collections with modifiers.
+# All other collections are instanced by an empty. The import scale is applied to the
+# instancing empty, or to an empty that becomes the parent of all top-level objects of
+# an overridden collection, so that the mesh data is not changed.
+def _LinkCollections(_sBlenderFilename: str, _mCollections: dict, _fImportScale: float, _dicVars: dict) -> dict:
+    dicClnObj = defaultdict(list)
+
+    with bpy.data.libraries.load(_sBlenderFilename, link=True) as (data_from, data_to):
+        lLinkClnNames = [x for x in _mCollections.keys() if x in data_from.collections]
+        data_to.collections = lLinkClnNames
+    # endwith
+
+    for clnLinked, sSrcClnName in zip(data_to.collections, lLinkClnNames):
+        if clnLinked is None:
+            continue
+        # endif
+
+        print(f"Linking collection '{sSrcClnName}'")
+        dicTrgClnCfg = _mCollections[sSrcClnName]
+        lTrgClnTree = dicTrgClnCfg.get("lCollectionHierarchy")
+        if lTrgClnTree is None:
+            raise RuntimeError("No target collection hierarchy given for source collection '{0}'".format(sSrcClnName))
+        # endif
+        sTrgClnName = ".".join(lTrgClnTree)
+        clnTrgParent = _GetTargetParentCollection(lTrgClnTree)
+
+        lMods = dicTrgClnCfg.get("lModifiers")
+        bOverride = convert.DictElementToBool(dicTrgClnCfg, "bOverride", bDefault=lMods is not None)
+
+        if bOverride is False:
+            if lMods is not None:
+                raise RuntimeError(
+                    f"Modifiers of linked collection '{sSrcClnName}' need a library override. "
+                    "Set 'bOverride' to true."
+                )
+            # endif
+
+            clnTrg = _GetLocalCollection(sTrgClnName)
+            if clnTrg is None:
+                clnTrg = bpy.data.collections.new(sTrgClnName)
+                clnTrgParent.children.link(clnTrg)
+            # endif
+
+            objInst = bpy.data.objects.new(f"{sTrgClnName}.instance", None)
+            objInst.instance_type = "COLLECTION"
+            objInst.instance_collection = clnLinked
+            objInst.scale = (_fImportScale, _fImportScale, _fImportScale)
+            clnTrg.objects.link(objInst)
+
+            dicClnObj[clnTrg.name] = ["*"]
+            continue
+        # endif
+
+        # The override collection itself becomes the target collection. Its objects cannot be moved
+        # into an existing collection, as it is done when appending, so a name clash is an error.
+        if _GetLocalCollection(sTrgClnName) is not None:
+            raise RuntimeError(
+                f"Cannot create library override of collection '{sSrcClnName}' as '{sTrgClnName}', "
+                "as a collection with this name already exists. Use another target collection hierarchy, "
+                "or set 'bOverride' to false to instance the collection in the existing one."
+            )
+        # endif
+
+        clnTrg: bpy.types.Collection = clnLinked.override_hierarchy_create(
+            bpy.context.scene, bpy.context.view_layer, do_fully_editable=True
+        )
+
+        # The override is linked to the scene collection by default
+        if clnTrg.name in bpy.context.scene.collection.children:
+            bpy.context.scene.collection.children.unlink(clnTrg)
+        # endif
+
+        clnTrg.name = sTrgClnName
+        clnTrgParent.children.link(clnTrg)
+
+        if _fImportScale != 1.0:
+            objScale = bpy.data.objects.new(f"{clnTrg.name}.scale", None)
+            objScale.scale = (_fImportScale, _fImportScale, _fImportScale)
+            clnTrgParent.objects.link(objScale)
+
+            for objX in clnTrg.all_objects:
+                if objX.parent is None:
+                    objX.parent = objScale
+                # endif
+            # endfor
+            dicClnObj[clnTrgParent.name].append(objScale.name)
+        # endif
+
+        if lMods is not None:
+            modcln.ModifyCollection(clnTrg, lMods, dicVars=_dicVars)
+        # endif
+
+        dicClnObj[clnTrg.name] = ["*"]
+    # endfor
+
+    return dicClnObj
+
+
+# enddef
+
+
 ############################################################################################
 def LoadCollections(_dicCln, **kwargs):
     dicClnObj = defaultdict(list)
@@ -117,6 +256,13 @@ def LoadCollections(_dicCln, **kwargs):
     fImportScale = fExtUnitScale / fLocalUnitScale
     print(f"Scales: ext = {fExtUnitScale}, local = {fLocalUnitScale}, eff = {fImportScale}")
 
+    sImportMode: str = convert.DictElementToString(_dicCln, "sImportMode", sDefault="APPEND").upper()
+    if sImportMode == "LINK":
+        return _LinkCollections(sBlenderFilename, mCollections, fImportScale, dicVars)
+    elif sImportMode != "APPEND":
+        raise RuntimeError(f"Unsupported import mode '{sImportMode}' in load collection configuration")
+    # endif
+
     # ### IMPORTANT ###
     # Loading the scene linked and then deleting it has
     # some unforseeable consequence, where the parenting of objects
@@ -145,24 +291,20 @@ def LoadCollections(_dicCln, **kwargs):
     # bpy.data.scenes.remove(xTo.scenes[0])
 
     # Now we load everything we actually need.
-    lImportClnNames = []
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        for sSrcClnName in mCollections.keys():
-            if sSrcClnName in data_from.collections:
-                data_to.collections.append(sSrcClnName)
-                lImportClnNames.append(sSrcClnName)
-            # endif
-        # endfor
-    # endwith
+    # The collections may already have been loaded together with other data blocks from the same file.
+    lSrcClnNames = list(mCollections.keys())
+    lLoadedCln = cbu_lib.Load(sBlenderFilename, "collections", lSrcClnNames)
+    lImportClnNames = [sName for sName, clnX in zip(lSrcClnNames, lLoadedCln) if clnX is not None]
+    lImportCln = [clnX for clnX in lLoadedCln if clnX is not None]
 
     # Rename imported collections to dummy names,
     # to avoid potential name clash problems later on
     lNewImportClnNames = [f"_cathy_import_{x}" for x in lImportClnNames]
-    for clnImport, sNewImportClnName in zip(data_to.collections, lNewImportClnNames):
+    for clnImport, sNewImportClnName in zip(lImportCln, lNewImportClnNames):
         clnImport.name = sNewImportClnName
     # endfor
 
-    for clnImport, sImportClnName in zip(data_to.collections, lImportClnNames):
+    for clnImport, sImportClnName in zip(lImportCln, lImportClnNames):
         print(f"Importing collection '{sImportClnName}'")
         dicTrgClnCfg = mCollections[sImportClnName]
         lTrgClnTree = dicTrgClnCfg.get("lCollectionHierarchy")
@@ -387,7 +529,21 @@ def _CreatePerFolderHandler(
 
 
 ############################################################################################
-def ImportFolderTypeHierarchy(_dicCln, **kwargs):
+def _LoadJsonIfExists(_pathFile: Path) -> Optional[dict]:
+    try:
+        with _pathFile.open("r") as xFile:
+            return json.load(xFile)
+        # endwith
+    except Exception:
+        return None
+    # endtry
+
+
+# enddef
+
+
+############################################################################################
+def _GetFolderTypeTopPath(_dicCln: dict) -> Path:
     sPath: str = convert.DictElementToString(_dicCln, "sPath")
     pathTop: Path = anypath.MakeNormPath(Path(sPath).absolute())
 
@@ -399,11 +555,16 @@ def ImportFolderTypeHierarchy(_dicCln, **kwargs):
         raise RuntimeError(f"Path does not reference a directory: {(pathTop.as_posix())}")
     # endif
 
-    lClnTree = _dicCln.get("lCollectionHierarchy")
-    if lClnTree is None:
-        raise RuntimeError("Key 'lCollectionHierarchy' missing in create collection configuration")
-    # endif
+    return pathTop
+
+
+# enddef
+
 
+############################################################################################
+# Walk the folder hierarchy of a folder type hierarchy import.
+# Returns the type dictionary, the object file paths per type and the per-folder configurations.
+def _GetFolderTypeHierarchy(_dicCln: dict, _pathTop: Path) -> tuple[dict, dict[str, list[Path]], dict[str, dict]]:
     sPerFolderConfigFilename: str = convert.DictElementToString(_dicCln, "sPerFolderConfigFilename", bDoRaise=False)
     lIncludeFileSuffix: list[str] = convert.DictElementToStringList(
         _dicCln, "lIncludeFileSuffix", lDefault=[".obj", ".fbx", ".glb", ".gltf"]
@@ -412,8 +573,121 @@ def ImportFolderTypeHierarchy(_dicCln, **kwargs):
     lRePathInclude: list[str] = convert.DictElementToStringList(_dicCln, "lRePathInclude", lDefault=[".+"])
     lRePathExclude: list[str] = convert.DictElementToStringList(_dicCln, "lRePathExclude", bDoRaise=False)
 
-    bJoinObjectGroups: bool = convert.DictElementToBool(_dicCln, "bJoinObjectGroups", bDefault=True)
-    _dicCln["bJoinObjectGroups"] = bJoinObjectGroups
+    # Use the stored walk result, if the folder hierarchy did not change since it was stored
+    pathCache: Optional[Path] = cbu_fw.GetCachePath(_dicCln)
+    if pathCache is not None:
+        sCacheKey: str = cbu_fw.GetKey(
+            _pathTop,
+            {
+                "sPerFolderConfigFilename": sPerFolderConfigFilename,
+                "lIncludeFileSuffix": lIncludeFileSuffix,
+                "lRePathInclude": lRePathInclude,
+                "lRePathExclude": lRePathExclude,
+            },
+        )
+        dicState: dict = cbu_fw.GetState(_pathTop, sPerFolderConfigFilename)
+        dicResult: Optional[dict] = cbu_fw.Load(pathCache, sCacheKey, dicState)
+        if dicResult is not None:
+            dicTypePathList = {
+                sType: [Path(x) for x in lPaths] for sType, lPaths in dicResult["mTypePathList"].items()
+            }
+            return dicResult["mTypeCfg"], dicTypePathList, dicResult["mFolderCfg"]
+        # endif
+    # endif
+
+    dicTypePathList = {}
+    dicFolderCfg = {}
+
+    dicTypeCfg = atu.GetTypeDictFromFolderHierarchy(
+        _pathTop,
+        _CreatePerFolderHandler(
+            _pathTop,
+            dicTypePathList,
+            dicFolderCfg,
+            sPerFolderConfigFilename,
+            lRePathInclude,
+            lRePathExclude,
+            lIncludeFileSuffix,
+        ),
+    )
+
+    # Only write the type file if it changed, so that the folder modification time stays the same
+    pathTypes = _pathTop / "anytruth-types.json"
+    if _LoadJsonIfExists(pathTypes) != dicTypeCfg:
+        anyfile.SaveJson(pathTypes, dicTypeCfg, iIndent=4)
+    # endif
+
+    if pathCache is not None:
+        # Capture the folder state after writing the type file, as this changes the top folder
+        dicState = cbu_fw.GetState(_pathTop, sPerFolderConfigFilename)
+        try:
+            cbu_fw.Save(
+                pathCache,
+                sCacheKey,
+                dicState,
+                {
+                    "mTypeCfg": dicTypeCfg,
+                    "mTypePathList": {
+                        sType: [x.as_posix() for x in lPaths] for sType, lPaths in dicTypePathList.items()
+                    },
+                    "mFolderCfg": dicFolderCfg,
+                },
+            )
+        except Exception as xEx:
+            cbu_log.Warn("Cannot store folder walk result in cache '{}': {}", pathCache.as_posix(), str(xEx))
+        # endtry
+    # endif
+
+    return dicTypeCfg, dicTypePathList, dicFolderCfg
+
+
+# enddef
+
+
+############################################################################################
+# Get the import configuration of an object file of a type, as used by ImportFolderTypeHierarchy().
+def _GetFolderTypeImportConfig(_dicCln: dict, _lObjPaths: list[Path], _dicFolderCfg: dict[str, dict]) -> dict:
+    dicCfg = copy.deepcopy(_dicCln)
+    dicCfg["bJoinObjectGroups"] = convert.DictElementToBool(_dicCln, "bJoinObjectGroups", bDefault=True)
+
+    dicObjCfg = _dicFolderCfg.get(_lObjPaths[0].parent.as_posix())
+    if dicObjCfg is not None:
+        anyutil.DictRecursiveUpdate(dicCfg, dicObjCfg)
+    # endif
+
+    return dicCfg
+
+
+# enddef
+
+
+############################################################################################
+# Get all object files that ImportFolderTypeHierarchy() imports for the given configuration,
+# together with the import configuration of each file. Nothing is imported.
+def GetFolderTypeHierarchyImports(_dicCln: dict) -> list[tuple[Path, dict]]:
+    pathTop: Path = _GetFolderTypeTopPath(_dicCln)
+    dicTypeCfg, dicTypePathList, dicFolderCfg = _GetFolderTypeHierarchy(_dicCln, pathTop)
+
+    lImports: list[tuple[Path, dict]] = []
+    for sType, lObjPaths in dicTypePathList.items():
+        dicCfg = _GetFolderTypeImportConfig(_dicCln, lObjPaths, dicFolderCfg)
+        lImports.extend((pathObj, dicCfg) for pathObj in lObjPaths)
+    # endfor
+
+    return lImports
+
+
+# enddef
+
+
+############################################################################################
+def ImportFolderTypeHierarchy(_dicCln, **kwargs):
+    pathTop: Path = _GetFolderTypeTopPath(_dicCln)
+
+    lClnTree = _dicCln.get("lCollectionHierarchy")
+    if lClnTree is None:
+        raise RuntimeError("Key 'lCollectionHierarchy' missing in create collection configuration")
+    # endif
 
     bDoSpreadObjects: bool = False
     dicSO: dict = _dicCln.get("mSpreadObjects")
@@ -452,28 +726,13 @@ def ImportFolderTypeHierarchy(_dicCln, **kwargs):
     bIsExcluded = collection.IsExcluded(bpy.context, clnTrg.name)
     collection.ExcludeCollection(bpy.context, clnTrg.name, False)
 
-    dicTypePathList = {}
-    dicFolderCfg = {}
-
-    dicTypeCfg = atu.GetTypeDictFromFolderHierarchy(
-        pathTop,
-        _CreatePerFolderHandler(
-            pathTop,
-            dicTypePathList,
-            dicFolderCfg,
-            sPerFolderConfigFilename,
-            lRePathInclude,
-            lRePathExclude,
-            lIncludeFileSuffix,
-        ),
-    )
+    dicTypeCfg, dicTypePathList, dicFolderCfg = _GetFolderTypeHierarchy(_dicCln, pathTop)
 
     # for sType in dicTypePathList:
     #    print(f"{sType}: {(dicTypePathList[sType])}")
     # # endfor
 
     pathTypes = pathTop / "anytruth-types.json"
-    anyfile.SaveJson(pathTypes, dicTypeCfg, iIndent=4)
     atops.ImportLabelTypes(bpy.context, pathTypes.as_posix())
 
     dicClnCreated: dict[str, list[str]] = {}
@@ -488,11 +747,7 @@ def ImportFolderTypeHierarchy(_dicCln, **kwargs):
         lObjCreated = dicClnCreated[sClnName] = []
         lObjPaths: list[Path] = dicTypePathList[sType]
 
-        dicCfg = copy.deepcopy(_dicCln)
-        dicObjCfg = dicFolderCfg.get(lObjPaths[0].parent.as_posix())
-        if dicObjCfg is not None:
-            anyutil.DictRecursiveUpdate(dicCfg, dicObjCfg)
-        # endif
+        dicCfg = _GetFolderTypeImportConfig(_dicCln, lObjPaths, dicFolderCfg)
 
         # sNewObj: str
         for pathObj in lObjPaths:
@@ -31,6 +31,7 @@ import bpy
 from collections import defaultdict
 # import ison
 from ...modify import materials as modmat
+from catharsys.plugins.std.blender.util import library as cbu_lib
 
 ############################################################################################
 def LoadMaterials(_dicMat, **kwargs):
@@ -48,18 +49,16 @@ def LoadMaterials(_dicMat, **kwargs):
     # endif
 
     # Now we load everything we actually need.
-    lImportMatNames = []
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        for sSrcMatName in mMaterials.keys():
-            if sSrcMatName in data_from.materials:
-                data_to.materials.append(sSrcMatName)
-                lImportMatNames.append(sSrcMatName)
-            # endif
-        # endfor
-    # endwith
+    # The materials may already have been loaded together with other data blocks from the same file.
+    lSrcMatNames = list(mMaterials.keys())
+    lLoadedMat = cbu_lib.Load(sBlenderFilename, "materials", lSrcMatNames)
 
-    for matImport in data_to.materials:
-        dicTrgMatCfg = mMaterials[matImport.name]
+    for sSrcMatName, matImport in zip(lSrcMatNames, lLoadedMat):
+        if matImport is None:
+            continue
+        # endif
+
+        dicTrgMatCfg = mMaterials[sSrcMatName]
         sTrgMatName = dicTrgMatCfg.get("sName", matImport.name)
         matImport.name = sTrgMatName
         matImport.use_fake_user = True
@@ -31,6 +31,7 @@ import mathutils
 
 from collections import defaultdict
 from pathlib import Path
+from typing import Optional
 
 from anybase import convert
 from anybase import path as anypath
@@ -38,6 +39,10 @@ from anybase import path as anypath
 from anyblend import collection
 from anyblend import object as anyobj
 
+from catharsys.plugins.std.blender.util import library as cbu_lib
+from catharsys.plugins.std.blender.util import asset_cache as cbu_ac
+from catharsys.plugins.std.blender.util import log as cbu_log
+
 
 ############################################################################################
 def GenerateBlenderObject(_args, **kwargs):
@@ -99,18 +104,10 @@ def LoadObject(_dicObj, **kwargs):
 
     sDestObjName = _dicObj.get("sDestName", sSrcObjName)
 
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        if sSrcObjName in data_from.objects:
-            data_to.objects.append(sSrcObjName)
-        else:
-            raise RuntimeError("Object of name {} not found in {}".format(sSrcObjName, sBlenderFilename))
-        # endif
-    # endwith
-
-    if len(data_to.objects) != 1:
-        raise RuntimeError("Object of name {} could not be loaded from {}".format(sSrcObjName, sBlenderFilename))
-
-    xObject = data_to.objects[0]
+    xObject = cbu_lib.Load(sBlenderFilename, "objects", [sSrcObjName])[0]
+    if xObject is None:
+        raise RuntimeError("Object of name {} not found in {}".format(sSrcObjName, sBlenderFilename))
+    # endif
 
     bObjectRenamed = xObject.name != sSrcObjName
     if bObjectRenamed:
@@ -125,7 +122,7 @@ def LoadObject(_dicObj, **kwargs):
 
 
 ############################################################################################
-def _DoImportObjectAny(_pathFile: Path, _dicObj: dict, *, _sObjectName: str = None) -> list[str]:
+def _GetImportParams(_dicObj: dict) -> dict:
     fScaleFactor: float = convert.DictElementToFloat(_dicObj, "fScaleFactor", bDoRaise=False)
     lLocation: list[float] = convert.DictElementToFloatList(_dicObj, "lLocation", iLen=3, lDefault=[0.0, 0.0, 0.0])
     lRotationEuler_deg: list[float] = convert.DictElementToFloatList(
@@ -153,21 +150,38 @@ def _DoImportObjectAny(_pathFile: Path, _dicObj: dict, *, _sObjectName: str = No
         fSmoothSurfaceVoxelSize = None
     # endif
 
-    ############################################################################################################
-    # Process
+    return {
+        "fScaleFactor": fScaleFactor,
+        "lLocation": lLocation,
+        "lRotationEuler_deg": lRotationEuler_deg,
+        "bJoinObjectGroups": bJoinObjectGroups,
+        "bDoSetOrigin": bDoSetOrigin,
+        "sSetOriginType": sSetOriginType,
+        "sSetOriginCenter": sSetOriginCenter,
+        "bDoSmoothSurface": bDoSmoothSurface,
+        "fSmoothSurfaceVoxelSize": fSmoothSurfaceVoxelSize,
+    }
+
+
+# enddef
+
+
+############################################################################################
+def _ImportAndProcess(_pathFile: Path, _dicPars: dict, _sObjectName: Optional[str]) -> list[str]:
     lObjIn = anyobj.ImportObjectAny(
         _pathFile=_pathFile,
         _sNewName=_sObjectName,
-        _fScaleFactor=fScaleFactor,
-        _bDoSetOrigin=bDoSetOrigin,
-        _sSetOriginType=sSetOriginType,
-        _sSetOriginCenter=sSetOriginCenter,
-        _lLocation=lLocation,
-        _lRotationEuler_deg=lRotationEuler_deg,
-        _bDoJoinObjects=bJoinObjectGroups,
+        _fScaleFactor=_dicPars["fScaleFactor"],
+        _bDoSetOrigin=_dicPars["bDoSetOrigin"],
+        _sSetOriginType=_dicPars["sSetOriginType"],
+        _sSetOriginCenter=_dicPars["sSetOriginCenter"],
+        _lLocation=_dicPars["lLocation"],
+        _lRotationEuler_deg=_dicPars["lRotationEuler_deg"],
+        _bDoJoinObjects=_dicPars["bJoinObjectGroups"],
     )
 
-    if bDoSmoothSurface is True:
+    if _dicPars["bDoSmoothSurface"] is True:
+        fSmoothSurfaceVoxelSize: float = _dicPars["fSmoothSurfaceVoxelSize"]
         for sObjIn in lObjIn:
             objIn = bpy.data.objects[sObjIn]
             if objIn.type == "EMPTY":
@@ -190,6 +204,71 @@ def _DoImportObjectAny(_pathFile: Path, _dicObj: dict, *, _sObjectName: str = No
 # enddef
 
 
+############################################################################################
+def _DoImportObjectAny(_pathFile: Path, _dicObj: dict, *, _sObjectName: str = None) -> list[str]:
+    dicPars: dict = _GetImportParams(_dicObj)
+
+    # Use the processed objects from the asset cache, if available
+    pathCache: Optional[Path] = cbu_ac.GetCachePath(_dicObj)
+    if pathCache is not None:
+        sCacheKey: str = cbu_ac.GetKey(_pathFile, dict(dicPars, sObjectName=_sObjectName))
+        lObjIn = cbu_ac.Load(pathCache, sCacheKey)
+        if lObjIn is not None:
+            return lObjIn
+        # endif
+    # endif
+
+    lObjIn = _ImportAndProcess(_pathFile, dicPars, _sObjectName)
+
+    if pathCache is not None:
+        try:
+            cbu_ac.Save(pathCache, sCacheKey, lObjIn, _sSource=_pathFile.as_posix())
+        except Exception as xEx:
+            cbu_log.Warn("Cannot store asset in cache '{}': {}", pathCache.as_posix(), str(xEx))
+        # endtry
+    # endif
+
+    return lObjIn
+
+
+# enddef
+
+
+############################################################################################
+# Import and process an object file and store the result in the asset cache given
+# by the import configuration, without keeping the imported objects.
+# Returns False if the asset cache already contains the processed objects.
+def ConvertToAssetCache(_pathFile: Path, _dicObj: dict, *, _sObjectName: str = None) -> bool:
+    pathCache: Optional[Path] = cbu_ac.GetCachePath(_dicObj)
+    if pathCache is None:
+        raise RuntimeError("No asset cache path given in 'sAssetCachePath' or environment variable")
+    # endif
+
+    dicPars: dict = _GetImportParams(_dicObj)
+    sCacheKey: str = cbu_ac.GetKey(_pathFile, dict(dicPars, sObjectName=_sObjectName))
+    if cbu_ac.Exists(pathCache, sCacheKey):
+        return False
+    # endif
+
+    collection.MakeRootLayerCollectionActive(bpy.context)
+    lObjIn = _ImportAndProcess(_pathFile, dicPars, _sObjectName)
+    cbu_ac.Save(pathCache, sCacheKey, lObjIn, _sSource=_pathFile.as_posix())
+
+    # Remove the imported objects, so that the memory usage does not grow when converting many files
+    lObjects = [bpy.data.objects[x] for x in lObjIn]
+    setRemove: set = set(lObjects)
+    for objX in lObjects:
+        setRemove.update(objX.children_recursive)
+    # endfor
+    bpy.data.batch_remove(setRemove)
+    bpy.data.orphans_purge(do_recursive=True)
+
+    return True
+
+
+# enddef
+
+
 ############################################################################################
 def ImportObjectAny(_dicObj, **kwargs) -> list[str]:
     xCtx = bpy.context
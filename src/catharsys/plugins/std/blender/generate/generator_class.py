@@ -33,6 +33,8 @@ from anybase.cls_any_error import CAnyError_Message
 from anybase.util import DictRecursiveUpdate
 from anybase import convert
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
 from collections import defaultdict
 from typing import Union
 from . import util
@@ -40,12 +42,6 @@ from . import util
 from ..modify import objects as modobj
 
 
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
-
-
 ############################################################################################
 def GenerateInProgram(_dicData: dict, *, sMode: str = "INIT", dicVars: dict = {}) -> dict[str, str]:
     dicResult = {}
@@ -86,10 +82,10 @@ def GenerateInProgram(_dicData: dict, *, sMode: str = "INIT", dicVars: dict = {}
 
             lApplyModes = dicGen.get("lApplyModes", ["INIT"])
             if "*" not in lApplyModes and sMode not in lApplyModes:
-                print(f"> {sMode}: NOT applying generator '{sGenDti}'")
+                log.Debug("> {}: NOT applying generator '{}'", sMode, sGenDti)
                 continue
             # endif
-            print(f"> {sMode}: Applying generator '{sGenDti}'")
+            log.Debug("> {}: Applying generator '{}'", sMode, sGenDti)
 
             funcGenCls = util.GetGenerateClassFunc(sGenDti, "/catharsys/blender/generate/*:*")
 
@@ -126,13 +122,15 @@ def GenerateObject(_dicObj, dicVars=None) -> dict[str, str]:
             sDti = _dicObj.get("sDTI")
             funcGenerate = util.GetGenerateFunction(sDti, "/catharsys/blender/generate/object/*:*")
 
-            _Print(f"Applying object generator: {sDti}")
+            log.Debug("Applying object generator: {}", sDti)
 
             if funcGenerate is None:
                 raise Exception("No generator function available for type '{0}'".format(sDti))
             # endif funcGenerate
 
-            xObjects: Union[bpy.types.Object, list[str]] = funcGenerate(_dicObj, dicVars=dicVars)
+            with profiling.CMeasure("generate-object", sDti, "*"):
+                xObjects: Union[bpy.types.Object, list[str]] = funcGenerate(_dicObj, dicVars=dicVars)
+            # endwith
 
             # General parameter that all generate object configs share
             lCollectionHierarchy = _dicObj.get("lCollectionHierarchy", ["GeneratedObjects"])
@@ -213,13 +211,15 @@ def GenerateCollection(_dicCln, dicVars=None) -> dict[str, str]:
             sDti = None
             sDti = _dicCln.get("sDTI")
             funcGenerate = util.GetGenerateFunction(sDti, "/catharsys/blender/generate/collection/*:*")
-            _Print(f"Applying collection generator: {sDti}")
+            log.Debug("Applying collection generator: {}", sDti)
 
             if funcGenerate is None:
                 raise Exception("No generator function available for type '{0}'".format(sDti))
             # endif funcGenerate
 
-            dicClnObj = funcGenerate(_dicCln, dicVars=dicVars)
+            with profiling.CMeasure("generate-collection", sDti, "*"):
+                dicClnObj = funcGenerate(_dicCln, dicVars=dicVars)
+            # endwith
 
         except Exception as xEx:
             sMsg = f"Error executing collection generator '{sDti}'"
@@ -253,13 +253,15 @@ def GenerateMaterial(_dicMat, dicVars=None) -> dict[str, str]:
             sDti = None
             sDti = _dicMat.get("sDTI")
             funcGenerate = util.GetGenerateFunction(sDti, "/catharsys/blender/generate/material/*:*")
-            _Print(f"Applying material generator: {sDti}")
+            log.Debug("Applying material generator: {}", sDti)
 
             if funcGenerate is None:
                 raise Exception("No generator function available for type '{0}'".format(sDti))
             # endif funcGenerate
 
-            dicMatObj = funcGenerate(_dicMat, dicVars=dicVars)
+            with profiling.CMeasure("generate-material", sDti, "*"):
+                dicMatObj = funcGenerate(_dicMat, dicVars=dicVars)
+            # endwith
 
         except Exception as xEx:
             sMsg = f"Error executing material generator '{sDti}'"
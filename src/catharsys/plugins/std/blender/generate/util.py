@@ -27,22 +27,17 @@
 ###
 
 
-from anybase import plugin, config
+from catharsys.plugins.std.blender.util import entry_point
 
 
 ############################################################################################
 def GetGenerateClassFunc(_sModTypeDti, _sDtiClass):
 
-    if config.CheckDti(_sModTypeDti, _sDtiClass)["bOK"] is False:
+    if entry_point.CheckDti(_sModTypeDti, _sDtiClass) is False:
         raise RuntimeError("Generator '{}' is not of type '{}'".format(_sModTypeDti, _sDtiClass))
     # endif
 
-    epFunc = plugin.SelectEntryPointFromDti(
-        sGroup="catharsys.blender.generate_class",
-        sTrgDti=_sModTypeDti,
-        sTypeDesc="Generator class",
-    )
-    return epFunc.load()
+    return entry_point.LoadEntryPoint("catharsys.blender.generate_class", _sModTypeDti, "Generator class")
 
 
 # enddef
@@ -51,14 +46,11 @@ def GetGenerateClassFunc(_sModTypeDti, _sDtiClass):
 ############################################################################################
 def GetGenerateFunction(_sModTypeDti, _sDtiClass):
 
-    if config.CheckDti(_sModTypeDti, _sDtiClass)["bOK"] is False:
+    if entry_point.CheckDti(_sModTypeDti, _sDtiClass) is False:
         raise RuntimeError("Modifier '{}' is not of type '{}'".format(_sModTypeDti, _sDtiClass))
     # endif
 
-    epFunc = plugin.SelectEntryPointFromDti(
-        sGroup="catharsys.blender.generate", sTrgDti=_sModTypeDti, sTypeDesc="Generator"
-    )
-    return epFunc.load()
+    return entry_point.LoadEntryPoint("catharsys.blender.generate", _sModTypeDti, "Generator")
 
 
 # enddef
@@ -32,24 +32,20 @@ from anybase import convert
 from anybase.cls_any_error import CAnyError_Message
 import ison
 from . import util
+from . import eval_cache
 
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
 
 
-# concentrate print functionality for further generic logging concept
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
-# enddef
-
 
 ############################################################################################
 @logFunctionCall
 def ModifyCollection(_clnX, _lMods, sMode="INIT", dicVars=None):
 
     if len(_lMods) > 0:
-        _Print(f"\nApplying modifiers to collection: {_clnX.name}")
+        log.Debug("\nApplying modifiers to collection: {}", _clnX.name)
     # endif
 
     for dicMod in _lMods:
@@ -65,10 +61,10 @@ def ModifyCollection(_clnX, _lMods, sMode="INIT", dicVars=None):
 
         lApplyModes = dicMod.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            _Print(f"-- {sMode}: NOT applying modifier '{sModType}'")
+            log.Debug("-- {}: NOT applying modifier '{}'", sMode, sModType)
             continue
         # endif
-        _Print(f">> {sMode}: Applying modifier '{sModType}'")
+        log.Debug(">> {}: Applying modifier '{}'", sMode, sModType)
 
         funcModify = util.GetModifyFunction(sModType, "/catharsys/blender/modify/collection/*:*")
         if funcModify is None:
@@ -76,13 +72,16 @@ def ModifyCollection(_clnX, _lMods, sMode="INIT", dicVars=None):
         # endif
 
         try:
-            funcModify(_clnX, dicMod, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("collection", sModType, sMode):
+                funcModify(_clnX, dicMod, sMode=sMode, dicVars=dicVars)
+            # endwith
+            eval_cache.Invalidate()
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing modifier '{sModType}'", xChildEx=xEx)
         # endtry
 
     # endfor lMods
-    _Print("")
+    log.Debug("")
 
 
 # enddef
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \modify\eval_cache.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Result cache of pure evaluators.
+# Evaluators like 'ObjectInfo' are often called with the same arguments several times
+# within a scene frame, from different programs and render output modifiers.
+# Evaluators that only depend on their arguments, the scene frame and
+# the referenced objects, can declare this with the @PureEvaluator decorator.
+# Their results are cached for the current scene frame, until a modifier
+# changes one of the referenced objects.
+
+import bpy
+import copy
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class CPureEvaluatorInfo:
+    # The evaluator arguments that contain names of referenced objects
+    lObjectIdArgs: list[str] = field(default_factory=list)
+
+
+# endclass
+
+
+@dataclass
+class CCacheEntry:
+    xResult: Any
+    setObjects: set[str]
+
+
+# endclass
+
+
+g_iFrame: Optional[int] = None
+g_dicCache: dict[tuple[str, str], CCacheEntry] = {}
+
+
+############################################################################################
+# Decorator that declares an evaluator function as pure.
+# 'lObjectIdArgs' lists the arguments, which reference objects the result depends on.
+def PureEvaluator(*, lObjectIdArgs: Optional[list[str]] = None) -> Callable:
+    def Decorator(_funcEval: Callable) -> Callable:
+        _funcEval.xPureEvaluatorInfo = CPureEvaluatorInfo(lObjectIdArgs=list(lObjectIdArgs or []))
+        return _funcEval
+
+    # enddef
+
+    return Decorator
+
+
+# enddef
+
+
+############################################################################################
+# Remove the cached results of evaluators, which depend on the given object or its children.
+def InvalidateObject(_objX: bpy.types.Object):
+    if len(g_dicCache) == 0:
+        return
+    # endif
+
+    setNames = {_objX.name}
+    setNames.update(x.name for x in _objX.children_recursive)
+
+    for tKey in [tKey for tKey, xEntry in g_dicCache.items() if not setNames.isdisjoint(xEntry.setObjects)]:
+        del g_dicCache[tKey]
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+# Remove all cached evaluator results.
+def Invalidate():
+    g_dicCache.clear()
+
+
+# enddef
+
+
+############################################################################################
+# Call an evaluator function, using the cached result if the evaluator is pure
+# and has been called with the same arguments in the current scene frame.
+def Evaluate(_funcEval: Callable, _sDti: str, _dicEval: dict, **kwargs) -> Any:
+    global g_iFrame
+
+    xInfo: Optional[CPureEvaluatorInfo] = getattr(_funcEval, "xPureEvaluatorInfo", None)
+    if xInfo is None:
+        return _funcEval(_dicEval, **kwargs)
+    # endif
+
+    iFrame = bpy.context.scene.frame_current
+    if iFrame != g_iFrame:
+        g_dicCache.clear()
+        g_iFrame = iFrame
+    # endif
+
+    try:
+        sArgs = json.dumps({k: v for k, v in _dicEval.items() if not k.startswith("__")}, sort_keys=True)
+    except (TypeError, ValueError):
+        # Arguments that cannot be serialized are not cached
+        return _funcEval(_dicEval, **kwargs)
+    # endtry
+
+    tKey = (_sDti, sArgs)
+    xEntry = g_dicCache.get(tKey)
+    if xEntry is None:
+        setObjects = set(_dicEval.get(x) for x in xInfo.lObjectIdArgs if isinstance(_dicEval.get(x), str))
+        xEntry = g_dicCache[tKey] = CCacheEntry(xResult=_funcEval(_dicEval, **kwargs), setObjects=setObjects)
+    # endif
+
+    # Callers may modify the result
+    return copy.deepcopy(xEntry.xResult)
+
+
+# enddef
@@ -30,6 +30,9 @@ from anybase import convert
 from anybase.cls_any_error import CAnyError_Message
 import ison
 from . import util
+from . import eval_cache
+from ..util import log
+from ..util import profiling
 
 
 ############################################################################################
@@ -55,10 +58,10 @@ def Evaluate(_dicData, sMode="INIT", dicVars={}):
 
         lApplyModes = dicEval.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            print(f"> {sMode}: NOT applying evaluator '{sEvalType}'")
+            log.Debug("> {}: NOT applying evaluator '{}'", sMode, sEvalType)
             continue
         # endif
-        print(f"> {sMode}: Applying evaluator '{sEvalType}'")
+        log.Debug("> {}: Applying evaluator '{}'", sMode, sEvalType)
 
         funcEval = util.GetModifyFunction(sEvalType, "/catharsys/blender/modify/evaluate/*:*")
         if funcEval is None:
@@ -68,7 +71,9 @@ def Evaluate(_dicData, sMode="INIT", dicVars={}):
         ison.util.data.AddLocalGlobalVars(dicEval, _dicData, bThrowOnDisallow=False)
 
         try:
-            dicResult[sVarId] = funcEval(dicEval, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("evaluator", sEvalType, sMode):
+                dicResult[sVarId] = eval_cache.Evaluate(funcEval, sEvalType, dicEval, sMode=sMode, dicVars=dicVars)
+            # endwith
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing evaluator '{sEvalType}'", xChildEx=xEx)
         # endtry
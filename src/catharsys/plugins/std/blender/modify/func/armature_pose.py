@@ -30,6 +30,7 @@ from typing import Any
 import bpy
 import re
 from anybase import convert
+from catharsys.plugins.std.blender.util import library as cbu_lib
 
 
 ############################################################################################
@@ -37,17 +38,12 @@ def ApplyPoseFromFile(
     armature_dst, sBlenderFilename, sPosename, lBones=[".*"], fWeight=1.0, bMirror=False
 ):
 
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        if sPosename in data_from.objects:
-            data_to.objects.append(sPosename)
-        else:
-            raise RuntimeError(
-                "Object of name {} not found in {}".format(sPosename, sBlenderFilename)
-            )
-        # endif
-    # endwith
-
-    armature_src = data_to.objects[0]
+    armature_src = cbu_lib.Load(sBlenderFilename, "objects", [sPosename])[0]
+    if armature_src is None:
+        raise RuntimeError(
+            "Object of name {} not found in {}".format(sPosename, sBlenderFilename)
+        )
+    # endif
 
     # print("posing from {}".format(sBlenderFilename))
 
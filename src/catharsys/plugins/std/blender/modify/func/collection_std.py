@@ -57,9 +57,9 @@ if g_bInBlenderContext is True:
     from anyblend import points
     from anyblend.cls_instances import CInstances, _CInstance
     from anycam import ops as camops
+    from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
 # endif
 
-from anybase.cls_anycml import CAnyCML
 from anybase.cls_any_error import CAnyError, CAnyError_Message
 from anybase import convert
 from anybase import assertion
@@ -69,6 +69,7 @@ import ison
 from catharsys.decs.decorator_log import logFunctionCall
 
 from .. import objects
+from .. import util as modutil
 
 
 ################################################################################
@@ -139,6 +140,9 @@ def ForEachObject(_clnX, _dicMod, **kwargs):
         reObj = re.compile(sObjNamePattern)
     # endif
 
+    # Only the modifiers that reference variables are parsed per object
+    xModTemplate = modutil.CModifierTemplate(_dicMod)
+
     iIdx = 0
 
     # create a list of objects to process since
@@ -159,9 +163,7 @@ def ForEachObject(_clnX, _dicMod, **kwargs):
         dicIter = {"for-each-object": {"idx": iIdx, "name": objX.name}}
 
         try:
-            xParser = CAnyCML(dicConstVars=dicIter)
-            ldicActMod = xParser.Process(_dicMod, lProcessPaths=["lModifiers"])
-            lActMod = ldicActMod[0]["lModifiers"]
+            lActMod = xModTemplate.Instantiate(dicIter)
             dicIter.update(dicVars)
 
             logFunctionCall.PrintLog(f"try to apply modifier to {objX.name} mode:'{sMode}'")
@@ -328,6 +330,9 @@ def RndPlaceObjOnSurf(_clnX, _dicMod, **kwargs):
 
     assertion.IsTrue(g_bInBlenderContext)
 
+    # Object world matrices and bounding boxes must be up to date
+    cbu_vl.Flush()
+
     try:
         # Get required elements
         lTrgObjNames = []
@@ -592,6 +597,8 @@ def RndPlaceObjOnSurf(_clnX, _dicMod, **kwargs):
         if fMinHorizViewAngleSep_deg > 0.0 or bUseCameraFov is True:
             dicCamera = camops.GetAnyCam(bpy.context, bpy.context.scene.camera.name)
             lCamFov_deg = camops.GetAnyCamFov_deg(dicCamera["objCam"], dicCamera["dicAnyCam"])
+            # The camera may have been moved by a modifier with a deferred view layer update
+            cbu_vl.Flush()
             matCamWorld = dicCamera["objCam"].matrix_world
         else:
             matCamWorld = None
@@ -677,7 +684,7 @@ def RndPlaceObjOnSurf(_clnX, _dicMod, **kwargs):
             # endif
         # endfor
 
-        viewlayer.Update()
+        cbu_vl.Update()
     except Exception as xEx:
         import traceback
 
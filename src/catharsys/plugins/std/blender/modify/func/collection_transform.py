@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \modify\func\collection_transform.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+import math
+import re
+import numpy as np
+from typing import Optional
+
+from anybase import convert
+
+from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
+
+
+# Object properties that can be set by 'TransformObjects', with the configuration element,
+# the default value and whether a delta is added to or multiplied with the current value.
+g_lTransformProps: list[tuple[str, str, float, bool]] = [
+    ("location", "mLocation", 0.0, False),
+    ("rotation_euler", "mRotationEuler", 0.0, False),
+    ("scale", "mScale", 1.0, True),
+]
+
+
+############################################################################################
+def _GetLengthScale(_sUnit: str) -> float:
+    dicMeterPerUnit = {"m": 1.0, "mm": 1e-3, "um": 1e-6, "km": 1e3}
+    dMeterPerUnit = dicMeterPerUnit.get(_sUnit)
+    if dMeterPerUnit is None:
+        raise RuntimeError("Unknown unit '{}'".format(_sUnit))
+    # endif
+
+    return dMeterPerUnit / bpy.context.scene.unit_settings.scale_length
+
+
+# enddef
+
+
+############################################################################################
+# Get the indices of the objects in the collection, that pass the object type and name filters.
+def _GetObjectIndices(
+    _clnX, _lObjectTypes: Optional[list[str]], _sObjNamePattern: Optional[str]
+) -> Optional[np.ndarray]:
+    if _lObjectTypes is None and _sObjNamePattern is None:
+        return None
+    # endif
+
+    reObj = re.compile(_sObjNamePattern) if _sObjNamePattern is not None else None
+
+    lIdx = []
+    for iIdx, objX in enumerate(_clnX.all_objects):
+        if _lObjectTypes is not None and objX.type not in _lObjectTypes:
+            continue
+        # endif
+        if reObj is not None and reObj.match(objX.name) is None:
+            continue
+        # endif
+        lIdx.append(iIdx)
+    # endfor
+
+    return np.array(lIdx, dtype=np.int64)
+
+
+# enddef
+
+
+############################################################################################
+# Evaluate the values of a transform property for all objects.
+# Random values of all objects are drawn with a single call from the generator.
+def _GetPropValues(
+    _dicProp: dict, _sElement: str, _dDefault: float, _dScale: float, _iCnt: int, _xRng: np.random.Generator
+) -> np.ndarray:
+    lValue = convert.DictElementToFloatList(_dicProp, "lValue", iLen=3, lDefault=[_dDefault] * 3)
+    aValues = np.tile(np.array(lValue, dtype=np.float64) * _dScale, (_iCnt, 1))
+
+    bHasRndMin = "lRndMin" in _dicProp
+    bHasRndMax = "lRndMax" in _dicProp
+    if bHasRndMin != bHasRndMax:
+        raise RuntimeError(f"Elements 'lRndMin' and 'lRndMax' of '{_sElement}' must be given together")
+    # endif
+
+    if bHasRndMin is True:
+        lRndMin = convert.DictElementToFloatList(_dicProp, "lRndMin", iLen=3)
+        lRndMax = convert.DictElementToFloatList(_dicProp, "lRndMax", iLen=3)
+        aValues += _xRng.uniform(np.array(lRndMin) * _dScale, np.array(lRndMax) * _dScale, size=(_iCnt, 3))
+    # endif
+
+    return aValues
+
+
+# enddef
+
+
+############################################################################################
+@cbu_vl.WritesOnly
+@logFunctionCall
+def TransformObjects(_clnX, _dicMod, **kwargs):
+    """Set the location, rotation and scale of all objects in a collection
+    and its child collections at once. The properties of all objects are read
+    and written in bulk, which is much faster than applying the object modifiers
+    to each object with 'for-each-object', if there are many objects.
+
+    Args:
+        _clnX (bpy.types.Collection): The collection.
+        _dicMod (dict): Configuration dictionary (see below).
+
+    Raises:
+        RuntimeError: if the configuration is invalid.
+
+    Configuration Args:
+        mLocation (dict, optional): The location of the objects.
+        mRotationEuler (dict, optional): The euler rotation angles of the objects.
+        mScale (dict, optional): The scale of the objects.
+        sUnit (string, optional): The unit of the location values. One of 'm', 'mm' (default), 'um', 'km'.
+        sAngleUnit (string, optional): The unit of the rotation angles. One of 'rad' (default), 'deg'.
+        iSeed (int, optional): The seed of the random generator. If not given, the random values
+                               differ for each call.
+        lObjectTypes (list(string), optional): list of objects types that are to be taken into account.
+                                                By default all object types are allowed.
+        sObjectNamePattern (string, optional): Only objects with names that match this regular expression
+                                                are taken into account. By default this is not applied.
+
+    Property Args (mLocation, mRotationEuler, mScale):
+        lValue (list(float), optional): The value for all objects.
+                                        Defaults to zero for location and rotation and one for scale.
+        lRndMin, lRndMax (list(float), optional): The range of a uniformly distributed random value,
+                                                  which is drawn per object and added to 'lValue'.
+        bDelta (bool, optional): If true, the value is added to the current location and rotation,
+                                 or multiplied with the current scale. Default is false.
+    """
+    lObjectTypes = _dicMod.get("lObjectTypes")
+    sObjNamePattern = _dicMod.get("sObjectNamePattern")
+
+    dicScale = {
+        "location": _GetLengthScale(_dicMod.get("sUnit", "mm")),
+        "rotation_euler": math.radians(1.0) if _dicMod.get("sAngleUnit", "rad") == "deg" else 1.0,
+        "scale": 1.0,
+    }
+
+    xObjects = _clnX.all_objects
+    iObjCnt = len(xObjects)
+    if iObjCnt == 0:
+        return
+    # endif
+
+    aIdx = _GetObjectIndices(_clnX, lObjectTypes, sObjNamePattern)
+    iCnt = iObjCnt if aIdx is None else len(aIdx)
+    if iCnt == 0:
+        return
+    # endif
+
+    iSeed = _dicMod.get("iSeed")
+    xRng = np.random.default_rng(None if iSeed is None else convert.ToInt(iSeed))
+
+    for sProp, sElement, dDefault, bMultiply in g_lTransformProps:
+        dicProp = _dicMod.get(sElement)
+        if dicProp is None:
+            continue
+        # endif
+        if not isinstance(dicProp, dict):
+            raise RuntimeError(f"Element '{sElement}' of modifier 'transform-objects' must be a dictionary")
+        # endif
+
+        aValues = _GetPropValues(dicProp, sElement, dDefault, dicScale[sProp], iCnt, xRng)
+        bDelta = convert.DictElementToBool(dicProp, "bDelta", bDefault=False)
+
+        # Only read the current values, if they are needed
+        if bDelta is True or aIdx is not None:
+            aAll = np.empty(iObjCnt * 3, dtype=np.float32)
+            xObjects.foreach_get(sProp, aAll)
+            aAll = aAll.reshape(iObjCnt, 3)
+        else:
+            aAll = np.empty((iObjCnt, 3), dtype=np.float32)
+        # endif
+
+        aTarget = aAll if aIdx is None else aAll[aIdx]
+        if bDelta is True:
+            aTarget = aTarget * aValues if bMultiply is True else aTarget + aValues
+        else:
+            aTarget = aValues
+        # endif
+
+        if aIdx is None:
+            aAll[:] = aTarget
+        else:
+            aAll[aIdx] = aTarget
+        # endif
+
+        xObjects.foreach_set(sProp, aAll.ravel())
+    # endfor
+
+    cbu_vl.Update()
+
+
+# enddef
@@ -30,14 +30,20 @@ import math
 import bpy
 import mathutils
 
-import runpy
+import os
+import builtins
+from types import CodeType
+from typing import Callable
 
 from pathlib import Path
 from anybase.cls_any_error import CAnyError_Message
 import anybase.util
 from anybase import convert
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
+from catharsys.plugins.std.blender.modify.eval_cache import PureEvaluator
 
 ################################################################################################
+@PureEvaluator(lObjectIdArgs=["sObjectId"])
 def ObjectInfo(_dicEval, **kwargs):
 
     sObjectId = _dicEval.get("sObjectId")
@@ -52,6 +58,9 @@ def ObjectInfo(_dicEval, **kwargs):
         raise RuntimeError("Object with id '{}' not found in blender file".format(sObjectId))
     # endif
 
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
+
     lBoundBox = [objX.matrix_world @ mathutils.Vector(x) for x in objX.bound_box]
     vCenter = mathutils.Vector((0, 0, 0))
     for vX in lBoundBox:
@@ -76,6 +85,7 @@ def ObjectInfo(_dicEval, **kwargs):
 
 
 ################################################################################################
+@PureEvaluator()
 def LookAtRotZ(_dicEval, **kwargs):
 
     # print("=================================================")
@@ -124,6 +134,84 @@ def LookAtRotZ(_dicEval, **kwargs):
 # enddef
 
 
+# Compiled evaluator scripts by script path, as tuples (modification time, size, code object)
+g_dicScriptCode: dict[str, tuple[int, int, CodeType]] = {}
+
+# Globals of evaluator scripts executed in persistent mode by script path,
+# as tuples (modification time, size, globals dictionary)
+g_dicScriptModules: dict[str, tuple[int, int, dict]] = {}
+
+
+################################################################################################
+# Get the compiled code of a python script. The script is only read and compiled again,
+# if its modification time or size changed.
+def _GetScriptCode(_sFpScript: str) -> CodeType:
+    xStat = os.stat(_sFpScript)
+    tEntry = g_dicScriptCode.get(_sFpScript)
+    if tEntry is not None and tEntry[0] == xStat.st_mtime_ns and tEntry[1] == xStat.st_size:
+        return tEntry[2]
+    # endif
+
+    with open(_sFpScript, "rb") as xFile:
+        xCode = compile(xFile.read(), _sFpScript, "exec")
+    # endwith
+
+    g_dicScriptCode[_sFpScript] = (xStat.st_mtime_ns, xStat.st_size, xCode)
+    return xCode
+
+
+# enddef
+
+
+################################################################################################
+# Execute a python script in a new globals dictionary, like runpy.run_path() does.
+def _ExecScript(_sFpScript: str, _dicInitGlobals: dict) -> dict:
+    xCode = _GetScriptCode(_sFpScript)
+
+    dicGlobals = dict(_dicInitGlobals)
+    dicGlobals.update(
+        {
+            "__name__": "catharsys.evaluator",
+            "__file__": _sFpScript,
+            "__cached__": None,
+            "__doc__": None,
+            "__loader__": None,
+            "__package__": None,
+            "__spec__": None,
+            "__builtins__": builtins,
+        }
+    )
+    exec(xCode, dicGlobals)
+    return dicGlobals
+
+
+# enddef
+
+
+################################################################################################
+# Get the function '_sFunction' of a script in persistent mode.
+# The script is executed only once, or again when it changed on disk.
+def _GetPersistentScriptFunction(_sFpScript: str, _sFunction: str, _dicInitGlobals: dict) -> Callable:
+    xStat = os.stat(_sFpScript)
+    tEntry = g_dicScriptModules.get(_sFpScript)
+    if tEntry is not None and tEntry[0] == xStat.st_mtime_ns and tEntry[1] == xStat.st_size:
+        dicModule = tEntry[2]
+    else:
+        dicModule = _ExecScript(_sFpScript, _dicInitGlobals)
+        g_dicScriptModules[_sFpScript] = (xStat.st_mtime_ns, xStat.st_size, dicModule)
+    # endif
+
+    funcEval = dicModule.get(_sFunction)
+    if not callable(funcEval):
+        raise RuntimeError("Function '{}' not defined in persistent evaluator script".format(_sFunction))
+    # endif
+
+    return funcEval
+
+
+# enddef
+
+
 ################################################################################################
 def RunPyScript(_dicEval, **kwargs):
 
@@ -167,12 +255,20 @@ def RunPyScript(_dicEval, **kwargs):
     anybase.util.DictRecursiveUpdate(dicGlobals, dicVars)
     anybase.util.DictRecursiveUpdate(dicGlobals, dicUserGlobals)
 
+    # In persistent mode, the script is only executed once and has to define a function
+    # that is called with the globals dictionary for each evaluation, and that returns
+    # the result dictionary. Otherwise, the script is executed for each evaluation
+    # and has to store its results in the global variable 'dicResult'.
+    bPersistent = convert.DictElementToBool(_dicEval, "bPersistent", bDefault=False)
+    sFunction = convert.DictElementToString(_dicEval, "sFunction", sDefault="Evaluate")
+
     try:
-        dicResultGlobals = runpy.run_path(
-            pathScript.as_posix(),
-            init_globals=dicGlobals,
-            run_name="catharsys.evaluator",
-        )
+        if bPersistent is True:
+            funcEval = _GetPersistentScriptFunction(pathScript.as_posix(), sFunction, dicGlobals)
+            dicResultGlobals = {"dicResult": funcEval(dicGlobals)}
+        else:
+            dicResultGlobals = _ExecScript(pathScript.as_posix(), dicGlobals)
+        # endif
     except Exception as xEx:
         raise CAnyError_Message(
             sMsg="Error executing evaluator python script '{}' at path: {}".format(
@@ -33,6 +33,7 @@ try:
     from anyblend import util
     from . import ngrp_nodes
     from .. import materials
+    from ...util import textures as cbu_tex
 
     g_bInBlenderContext = True
 except Exception:
@@ -42,26 +43,6 @@ import ison
 from anybase import path, assertion, convert
 
 
-##################################################################################
-def _DoSetTexture(_xNode, _sImgId, _sRemoveImgId):
-
-    # Set the texture image
-    if _sImgId is None:
-        _xNode.image = None
-    elif _sImgId in bpy.data.images:
-        _xNode.image = bpy.data.images[_sImgId]
-    else:
-        raise Exception("Image '{0}' not available in blender file".format(_sImgId))
-    # endif
-
-    if _sRemoveImgId is not None and _sRemoveImgId in bpy.data.images and bpy.data.images[_sRemoveImgId].users == 0:
-        bpy.data.images.remove(bpy.data.images[_sRemoveImgId])
-    # endif
-
-
-# enddef
-
-
 ##################################################################################
 def _DoSetMaterial(_objectX, _slotId, _destMaterial):
     _objectX.material_slots[_slotId].material = _destMaterial
@@ -129,25 +110,22 @@ def SetTexturesFromFolder(_matX, _dicMod, **kwargs):
             raise Exception("Node '{0}' of material '{1}' is not an image texture node".format(sNode, _matX.name))
         # endif
 
-        # See if image is already available in blend file
-        imgTex = bpy.data.images.get(sFileTex)
-        if imgTex is None:
-            try:
-                imgTex = bpy.data.images.load(filepath=sFpTex)
-            except Exception as xEx:
-                raise Exception(
-                    "Error loading texture for node '{0}' from path '{1}':\n{2}".format(sNode, sFpTex, str(xEx))
-                )
-            # endtry
+        # Use the image of the texture file, if it is already available in the blend file.
+        # Images in the blend file with the texture file name are only used, if the file does not exist.
+        try:
+            imgTex = cbu_tex.Get(sFpTex, _sFallbackName=sFileTex)
+        except Exception as xEx:
+            raise Exception(
+                "Error loading texture for node '{0}' from path '{1}':\n{2}".format(sNode, sFpTex, str(xEx))
+            )
+        # endtry
+
+        # Remove the previous texture, if it is not used anymore
+        imgOrig = xNode.image
+        xNode.image = imgTex
+        if imgOrig != imgTex:
+            cbu_tex.Release(imgOrig)
         # endif
-
-        # if xNode.image is None:
-        #     sFileOrigTex = None
-        # else:
-        #     sFileOrigTex = xNode.image.name
-        # # endif
-
-        _DoSetTexture(xNode, sFileTex, None)
     # endfor
 
 
@@ -31,6 +31,7 @@ from anyblend.util import node
 from anyblend import collection as anycln
 from anyblend import object as anyobj
 from anybase import convert
+from ...util import textures as cbu_tex
 
 
 ################################################################################
@@ -331,7 +332,7 @@ def SetNodeValues(_ngX, _dicMod, **kwargs):
 
         if sType == "LOAD":
             try:
-                imgX = bpy.data.images.load(filepath=sName)
+                imgX = cbu_tex.Get(sName)
             except Exception as xEx:
                 raise Exception(
                     "Error loading image for node '{0}' from path '{1}':\n{2}".format(
@@ -340,7 +341,11 @@ def SetNodeValues(_ngX, _dicMod, **kwargs):
                 )
             # endtry
 
+            imgOrig = ndX.image
             ndX.image = imgX
+            if imgOrig != imgX:
+                cbu_tex.Release(imgOrig)
+            # endif
 
         elif sType == "SELECT":
             lImgNames = [x.name for x in bpy.data.images]
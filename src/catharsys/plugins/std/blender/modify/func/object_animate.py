@@ -31,6 +31,7 @@ import mathutils
 
 from anybase import convert
 from anyblend import viewlayer as anyvl
+from catharsys.plugins.std.blender.util import library as cbu_lib
 
 
 ############################################################################################
@@ -80,25 +81,10 @@ def ApplyActionFromFile(_objX, sBlenderFilename, sActionname, fOffset=0, fOffset
 
     """
 
-    def isInt(s):
-        try:
-            int(s)
-            return True
-        except Exception:
-            return False
-        # endtry
-
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        if sActionname in data_from.actions:
-            data_to.actions.append(sActionname)
-        elif len(data_from.actions) > 0 and isInt(sActionname):
-            data_to.actions.append(data_from.actions[int(sActionname)])
-        else:
-            raise RuntimeError("Action of name {} not found in {}".format(sActionname, sBlenderFilename))
-        # endif
-    # endwith
-
-    action_src = data_to.actions[0]
+    action_src = cbu_lib.Load(sBlenderFilename, "actions", [sActionname], _bAllowIndex=True)[0]
+    if action_src is None:
+        raise RuntimeError("Action of name {} not found in {}".format(sActionname, sBlenderFilename))
+    # endif
 
     _objX.animation_data_clear()
     _objX.animation_data_create()
@@ -219,32 +205,15 @@ def ApplyActionFromFile2(
             Default is that the action is run exactly once.
     """
 
-    def isInt(xValue):
-        try:
-            int(xValue)
-            return True
-        except Exception:
-            return False
-        # endtry
-
-    # enddef
-
     # print("Load animation:")
     # print(f"| sBlenderFilename: {sBlenderFilename}")
     # print(f"| fStartRelative: {fStartRelative}")
     # print("")
 
-    with bpy.data.libraries.load(sBlenderFilename, link=False) as (data_from, data_to):
-        if sActionName in data_from.actions:
-            data_to.actions.append(sActionName)
-        elif len(data_from.actions) > 0 and isInt(sActionName):
-            data_to.actions.append(data_from.actions[int(sActionName)])
-        else:
-            raise RuntimeError("Action of name {} not found in {}".format(sActionName, sBlenderFilename))
-        # endif
-    # endwith
-
-    actX = data_to.actions[0]
+    actX = cbu_lib.Load(sBlenderFilename, "actions", [sActionName], _bAllowIndex=True)[0]
+    if actX is None:
+        raise RuntimeError("Action of name {} not found in {}".format(sActionName, sBlenderFilename))
+    # endif
 
     _objX.animation_data_clear()
     _objX.animation_data_create()
@@ -42,6 +42,7 @@ try:
     # from anycam import ops as camops
     # from anybase import config, convert, path
     from .. import materials
+    from .. import util as modutil
 
     g_bInBlenderContext = True
 except Exception:
@@ -51,7 +52,6 @@ from anybase import assertion, convert
 from anybase.cls_any_error import CAnyError_Message
 
 import ison
-from anybase.cls_anycml import CAnyCML
 
 
 
@@ -98,6 +98,9 @@ def ForEachMaterial(_objX: bpy.types.Object, _dicMod, **kwargs):
         reMat = re.compile(sMatNamePattern)
     # endif
 
+    # Only the modifiers that reference variables are parsed per material
+    xModTemplate = modutil.CModifierTemplate(_dicMod)
+
     iIdx = 0
 
     matX: bpy.types.Material
@@ -115,9 +118,7 @@ def ForEachMaterial(_objX: bpy.types.Object, _dicMod, **kwargs):
 
         # apply modifiers to material
         try:
-            xParser = CAnyCML(dicConstVars=dicIter)
-            ldicActMod = xParser.Process(_dicMod, lProcessPaths=["lModifiers"])
-            lActMod = ldicActMod[0]["lModifiers"]
+            lActMod = xModTemplate.Instantiate(dicIter)
             dicIter.update(dicVars)
 
             materials.ModifyMaterial(matX, lActMod, sMode=sMode, dicVars=dicIter)
@@ -32,7 +32,6 @@ import mathutils
 import math
 from anyblend import object as anyobj
 from anyblend import ops_object as anyops
-from anyblend import viewlayer as anyvl
 
 from anycam import ops as camops
 
@@ -42,6 +41,7 @@ from anybase.dec.cls_paramclass import paramclass, CParamFields
 
 
 from catharsys.decs.decorator_ep import EntryPoint
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
 from catharsys.util.cls_entrypoint_information import CEntrypointInformation
 
 
@@ -74,9 +74,11 @@ def SetOrigin(_objX, _dicMod, **kwargs):
     # -- from dict to paramclass
     # -- assertions on OPTIONS are be done inside paramclass
     paramMod = CSetOriginParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     anyops.SetOriginByType(_objX, _sOriginType=paramMod.sOriginType, _sCenter=paramMod.sCenter)
-    anyvl.Update()
+    cbu_vl.Update()
 
     return None
 
@@ -141,6 +143,8 @@ def DeltaRotationEuler(_objX, _dicMod, **kwargs):
     # -- from dict to paramclass
     # -- assertions on OPTIONS are be done inside paramclass
     paramMod = CDeltaRotationEulerParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     if _objX.type == "CAMERA":
         objX = camops.GetAnyCamTopObject(_objX.name)
@@ -153,7 +157,7 @@ def DeltaRotationEuler(_objX, _dicMod, **kwargs):
     # applied to delta rotation variable.
     objX.matrix_world = paramMod.getMatrixWorld(_objX)
 
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -184,6 +188,7 @@ class CRotationEulerParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CRotationEulerParams,
@@ -206,7 +211,7 @@ def RotationEuler(_objX, _dicMod, **kwargs):
     # endif
 
     objX.rotation_euler = mathutils.Euler(mathutils.Vector(paramMod.lRotAngles))
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -253,6 +258,7 @@ class CDeltaLocationParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CDeltaLocationParams,
@@ -275,7 +281,7 @@ def DeltaLocation(_objX, _dicMod, **kwargs):
     # endif
 
     objX.location += mathutils.Vector(lLoc_bu)
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -352,6 +358,8 @@ def DeltaTransformProxy(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CDeltaTransformProxyParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     if _objX.type == "CAMERA":
         objX = camops.GetAnyCamTopObject(_objX.name)
@@ -460,7 +468,7 @@ def DeltaTransformProxy(_objX, _dicMod, **kwargs):
     #     objX.matrix_world = matTrans @ matRot @ matScale @ objX.matrix_world
     # # endif
     
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -498,6 +506,8 @@ def MoveTo(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CMoveToParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     if _objX.type == "CAMERA":
         objX = camops.GetAnyCamTopObject(_objX.name)
@@ -520,7 +530,7 @@ def MoveTo(_objX, _dicMod, **kwargs):
     objX.matrix_world = matTarget @ matObject.inverted() @ mathutils.Matrix.Diagonal(vOScale).to_4x4()
 
     
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -558,6 +568,8 @@ def MoveFrom(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CMoveFromParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     if _objX.type == "CAMERA":
         objX = camops.GetAnyCamTopObject(_objX.name)
@@ -586,7 +598,7 @@ def MoveFrom(_objX, _dicMod, **kwargs):
 
     objX.matrix_world = matObject @ matTarget.inverted() @ objX.matrix_world
     
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -609,6 +621,7 @@ class CLocationParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CLocationParams,
@@ -631,7 +644,7 @@ def Location(_objX, _dicMod, **kwargs):
     # endif
 
     objX.location = mathutils.Vector(lLoc_bu)
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -658,6 +671,7 @@ class CScaleParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CScaleParams,
@@ -676,7 +690,7 @@ def Scale(_objX, _dicMod, **kwargs):
 
     # Set scale of object
     objX.scale = mathutils.Vector(paramMod.lScale)
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -713,6 +727,7 @@ class CDeltaScaleParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CDeltaScaleParams,
@@ -731,7 +746,7 @@ def DeltaScale(_objX, _dicMod, **kwargs):
 
     # update scale of object
     objX.scale *= mathutils.Vector(paramMod.lScale)
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -762,6 +777,7 @@ class CScaleToSceneParams:
 
 
 # -------------------------------------------------------------------------------------------
+@cbu_vl.WritesOnly
 @EntryPoint(
     CEntrypointInformation.EEntryType.MODIFIER,
     clsInterfaceDoc=CScaleToSceneParams,
@@ -793,7 +809,7 @@ def ScaleToSceneUnit(_objX, _dicMod, **kwargs):
         )
     # endif
 
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -836,6 +852,8 @@ def InterpolatePoseLinear(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CPoseInterpolateLinearParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     objStart = bpy.data.objects.get(paramMod.sStartEmpty)
     if objStart is None:
@@ -875,7 +893,7 @@ def InterpolatePoseLinear(_objX, _dicMod, **kwargs):
         objX.matrix_basis = matPos
     # endif
 
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -954,6 +972,8 @@ def SnapObjToSurf(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CSnapObjToSurfParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     objTrg = bpy.data.objects.get(paramMod.sTargetObject)
     if objTrg is None:
@@ -969,7 +989,7 @@ def SnapObjToSurf(_objX, _dicMod, **kwargs):
     vDelta = anyobj.GetObjectDeltaToMesh(objTrg=objTrg, objX=objX, vDir=paramMod.lSnapDir, sMode=paramMod.sSnapMode)
     objX.location += vDelta + paramMod.lOffset
     # Need to call update, so that world matrix of object is also updated
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -1013,6 +1033,8 @@ def ApplyTransforms(_objX, _dicMod, **kwargs):
     """
 
     paramMod = CApplyTransformsParams(_dicMod)
+    # Object world matrices must be up to date
+    cbu_vl.Flush()
 
     anyops.ApplyTransforms(
         _objX,
@@ -1022,7 +1044,7 @@ def ApplyTransforms(_objX, _dicMod, **kwargs):
         _bProperties=paramMod.bProperties,
     )
 
-    anyvl.Update()
+    cbu_vl.Update()
 
 
 # enddef
@@ -29,7 +29,71 @@
 import bpy
 import math
 from anyblend.util import node
+from anybase import convert
 from .. import nodegroups
+from ...util import textures as cbu_tex
+
+# Dictionary of source world name to the name of its working copy, which is modified in INIT mode
+g_dicWorldCopies: dict[str, str] = {}
+
+# Custom property of a world copy, that stores the name of its source world
+g_sPropSourceWorld: str = "catharsys_source_world"
+
+# Pool of the unused HDR images, that are kept for reuse
+g_sHdrImagePool: str = "hdri"
+
+
+############################################################################################
+# Reset the node values and images of a copied node tree to the ones of its source.
+# The replaced images are added to '_lReplacedImages'. They are not released here,
+# as the same images may be set again by the modifier.
+def _ResetNodeTree(_ntSrc, _ntTrg, _lReplacedImages: list):
+    for ndSrc in _ntSrc.nodes:
+        ndTrg = _ntTrg.nodes.get(ndSrc.name)
+        if ndTrg is None:
+            continue
+        # endif
+
+        for sockSrc, sockTrg in zip(ndSrc.inputs, ndTrg.inputs):
+            if hasattr(sockSrc, "default_value") and not sockTrg.is_linked:
+                sockTrg.default_value = sockSrc.default_value
+            # endif
+        # endfor
+
+        if hasattr(ndSrc, "image") and ndTrg.image != ndSrc.image:
+            _lReplacedImages.append(ndTrg.image)
+            ndTrg.image = ndSrc.image
+        # endif
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+# Get the working copy of a world. Instead of copying the world for every modification,
+# a single copy per source world is created and reset to the source values when reused.
+# The copy is tagged with the name of its source world, so that a world with the same name
+# of another Blender file, e.g. after the file was reloaded, is not mistaken for the copy.
+def _GetWorldCopy(_xWorld, _lReplacedImages: list):
+    sWorldCopy = g_dicWorldCopies.get(_xWorld.name)
+    xWorldCopy = bpy.data.worlds.get(sWorldCopy) if sWorldCopy is not None else None
+    if xWorldCopy is not None and xWorldCopy.get(g_sPropSourceWorld) != _xWorld.name:
+        xWorldCopy = None
+    # endif
+
+    if xWorldCopy is None:
+        xWorldCopy = _xWorld.copy()
+        xWorldCopy[g_sPropSourceWorld] = _xWorld.name
+        g_dicWorldCopies[_xWorld.name] = xWorldCopy.name
+    else:
+        _ResetNodeTree(_xWorld.node_tree, xWorldCopy.node_tree, _lReplacedImages)
+    # endif
+
+    return xWorldCopy
+
+
+# enddef
 
 ############################################################################################
 def SetHdriWorld(_scnX, _dicMod, **kwargs):
@@ -42,6 +106,13 @@ def SetHdriWorld(_scnX, _dicMod, **kwargs):
     lLocation = _dicMod.get("lLocation")
     lModifyNodes = _dicMod.get("lModifyNodes")
 
+    # Number of unused HDR images that are kept in memory for reuse
+    iHdrCacheSize = convert.DictElementToInt(_dicMod, "iHdrCacheSize", iDefault=0)
+    # Maximal width and height of the HDR images, e.g. for fast preview renders
+    iHdrMaxSize = convert.DictElementToInt(_dicMod, "iHdrMaxSize", bDoRaise=False)
+    # Folder to store the downscaled HDR images in. Default is the folder of the HDR image.
+    sHdrDownscalePath = convert.DictElementToString(_dicMod, "sHdrDownscalePath", bDoRaise=False)
+
     if sWorldId is None:
         raise Exception("No element 'sId' given for world settings")
     # endif
@@ -53,12 +124,14 @@ def SetHdriWorld(_scnX, _dicMod, **kwargs):
 
     xModWorld = None
     lHdrImages = []
+    # Images replaced by resetting the world copy, which are released after the new images are set
+    lReplacedImages = []
 
     if lRot_deg is not None or lNodeHdrImageMap is not None or lModifyNodes is not None:
 
         # Copy the original world to modify it
         if sMode == "INIT":
-            xModWorld = xWorld.copy()
+            xModWorld = _GetWorldCopy(xWorld, lReplacedImages)
         else:
             xModWorld = xWorld
         # endif
@@ -81,7 +154,10 @@ def SetHdriWorld(_scnX, _dicMod, **kwargs):
             # endif
 
             try:
-                imgHdr = bpy.data.images.load(filepath=sFpHdr)
+                if iHdrMaxSize is not None:
+                    sFpHdr = cbu_tex.GetDownscaledFile(sFpHdr, iHdrMaxSize, _sPathTrg=sHdrDownscalePath)
+                # endif
+                imgHdr = cbu_tex.Get(sFpHdr)
             except Exception as xEx:
                 raise Exception(
                     "Error loading environment texture for node '{0}' from path '{1}':\n{2}".format(
@@ -90,11 +166,19 @@ def SetHdriWorld(_scnX, _dicMod, **kwargs):
                 )
             # endtry
 
+            imgOrig = xNode.image
             xNode.image = imgHdr
+            if imgOrig != imgHdr:
+                cbu_tex.Release(imgOrig, _iKeepUnusedCount=iHdrCacheSize, _sPool=g_sHdrImagePool)
+            # endif
             lHdrImages.append(imgHdr.name)
 
         # endfor Node HDR image map
 
+        for imgOrig in lReplacedImages:
+            cbu_tex.Release(imgOrig, _iKeepUnusedCount=iHdrCacheSize, _sPool=g_sHdrImagePool)
+        # endfor
+
         if lRot_deg is not None:
             xNode = node.GetByIdOrLabel(xModWorld.node_tree, "Mapping")
             if xNode is None:
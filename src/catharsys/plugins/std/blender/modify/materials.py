@@ -34,26 +34,23 @@ from anybase.cls_any_error import CAnyError_Message
 from anybase import convert
 
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
 
 
-# concentrate print functionality for further generic logging concept
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
-
 
 ############################################################################################
 @logFunctionCall
 def ModifyMaterial(_matX, _lMods, sMode="INIT", dicVars=None):
     if _lMods is None:
-        return
+        return 0
     # endif
 
     if len(_lMods) > 0:
-        _Print(f"\nApplying modifiers to material: {_matX.name}")
+        log.Debug("\nApplying modifiers to material: {}", _matX.name)
     # endif
 
+    iApplyCnt = 0
     for iModIdx, dicMod in enumerate(_lMods):
         if not isinstance(dicMod, dict):
             continue
@@ -66,16 +63,16 @@ def ModifyMaterial(_matX, _lMods, sMode="INIT", dicVars=None):
 
         bEnabled = convert.DictElementToBool(dicMod, "bEnabled", bDefault=True)
         if bEnabled is False:
-            _Print(f"-- DISABLED: NOT applying modifier '{sModType}'")
+            log.Debug("-- DISABLED: NOT applying modifier '{}'", sModType)
             continue
         # endif
 
         lApplyModes = dicMod.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            _Print(f"-- {sMode}: NOT applying modifier '{sModType}'")
+            log.Debug("-- {}: NOT applying modifier '{}'", sMode, sModType)
             continue
         # endif
-        _Print(f">> {sMode}: Applying modifier '{sModType}' to material: {_matX.name}")
+        log.Debug(">> {}: Applying modifier '{}' to material: {}", sMode, sModType, _matX.name)
 
         funcModify = util.GetModifyFunction(sModType, "/catharsys/blender/modify/material/*:*")
         if funcModify is None:
@@ -83,12 +80,19 @@ def ModifyMaterial(_matX, _lMods, sMode="INIT", dicVars=None):
         # endif
 
         try:
-            funcModify(_matX, dicMod, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("material", sModType, sMode):
+                funcModify(_matX, dicMod, sMode=sMode, dicVars=dicVars)
+            # endwith
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing modifier '{sModType}'", xChildEx=xEx)
         # endtry
+        iApplyCnt += 1
     # endfor
-#enddef
+
+    return iApplyCnt
+
+
+# enddef
 
 ############################################################################################
 def ModifyMaterials(_dicModifyMaterials, sMode="INIT", dicVars=None):
@@ -102,42 +106,45 @@ def ModifyMaterials(_dicModifyMaterials, sMode="INIT", dicVars=None):
         sFilePath = dicLocals.get("filepath")
     # endif
 
-    for sMaterialId, lModifiers in _dicModifyMaterials.items():
-        if sMaterialId.startswith("__"):
-            continue
-        # endif
-
-        try:
-            matX = bpy.data.materials.get(sMaterialId)
-            if matX is None:
-                raise Exception("Material with id '{0}' not found".format(sMaterialId))
+    with log.CLogSummary(sMode, "material modifiers", "materials") as xSummary:
+        for sMaterialId, lModifiers in _dicModifyMaterials.items():
+            if sMaterialId.startswith("__"):
+                continue
             # endif
 
-            if not isinstance(lModifiers, list):
-                raise CAnyError_Message(sMsg=f"Expect modifier list for material '{sMaterialId}'")
-            # endif
+            try:
+                matX = bpy.data.materials.get(sMaterialId)
+                if matX is None:
+                    raise Exception("Material with id '{0}' not found".format(sMaterialId))
+                # endif
 
-            if len(lModifiers) > 0:
-                _Print(f"Applying modifiers to material: {sMaterialId}")
-            # endif
+                if not isinstance(lModifiers, list):
+                    raise CAnyError_Message(sMsg=f"Expect modifier list for material '{sMaterialId}'")
+                # endif
 
-            for dicMod in lModifiers:
-                if isinstance(dicMod, dict):
-                    ison.util.data.AddLocalGlobalVars(dicMod, _dicModifyMaterials, bThrowOnDisallow=False)
+                if len(lModifiers) > 0:
+                    log.Debug("Applying modifiers to material: {}", sMaterialId)
+                # endif
 
-            # endfor mod
+                for dicMod in lModifiers:
+                    if isinstance(dicMod, dict):
+                        ison.util.data.AddLocalGlobalVars(dicMod, _dicModifyMaterials, bThrowOnDisallow=False)
 
-            ModifyMaterial(matX, lModifiers, sMode=sMode, dicVars=dicVars)
+                # endfor mod
 
-        except Exception as xEx:
-            sMsg = f"Error executing modifiers for material '{sMaterialId}' in mode '{sMode}'"
-            if isinstance(sFilePath, str):
-                sMsg += f"\n> See file: {sFilePath}"
-            # endif
-            raise CAnyError_Message(sMsg=sMsg, xChildEx=xEx)
-        # endtry
+                iApplyCnt = ModifyMaterial(matX, lModifiers, sMode=sMode, dicVars=dicVars)
+                xSummary.AddTarget(iApplied=iApplyCnt, iTotal=len(lModifiers))
+
+            except Exception as xEx:
+                sMsg = f"Error executing modifiers for material '{sMaterialId}' in mode '{sMode}'"
+                if isinstance(sFilePath, str):
+                    sMsg += f"\n> See file: {sFilePath}"
+                # endif
+                raise CAnyError_Message(sMsg=sMsg, xChildEx=xEx)
+            # endtry
 
-    # endfor material
+        # endfor material
+    # endwith
 
 
 # enddef
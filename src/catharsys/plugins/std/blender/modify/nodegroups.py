@@ -31,14 +31,18 @@ import bpy
 from anybase.cls_any_error import CAnyError_Message
 from anybase import convert
 from . import util
+from . import eval_cache
 
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
 
-# concentrate print functionality for further generic logging concept
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
+# Dictionary of source node group name to the name of its working copy
+g_dicNodeGroupCopies: dict[str, str] = {}
+
+# Custom property of a working copy that stores the name of its source node group
+g_sPropSourceNodeGroup: str = "catharsys_source_node_group"
 
 
 ############################################################################################
@@ -53,16 +57,16 @@ def ModifyNodeTree(_ngX, _lMods, sMode="INIT", dicVars=None):
         
         bEnabled = convert.DictElementToBool(dicMod, "bEnabled", bDefault=True)
         if bEnabled is False:
-            _Print(f"-- DISABLED: NOT applying modifier '{sModType}'")
+            log.Debug("-- DISABLED: NOT applying modifier '{}'", sModType)
             continue
         # endif
 
         lApplyModes = dicMod.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            _Print(f"-- {sMode}: NOT applying modifier '{sModType}'")
+            log.Debug("-- {}: NOT applying modifier '{}'", sMode, sModType)
             continue
         # endif
-        _Print(f">> {sMode}: Applying modifier '{sModType}'")
+        log.Debug(">> {}: Applying modifier '{}'", sMode, sModType)
 
         funcModify = util.GetModifyFunction(sModType, "/catharsys/blender/modify/nodegroup/*:*")
         if funcModify is None:
@@ -70,7 +74,10 @@ def ModifyNodeTree(_ngX, _lMods, sMode="INIT", dicVars=None):
         # endif
 
         try:
-            funcModify(_ngX, dicMod, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("nodegroup", sModType, sMode):
+                funcModify(_ngX, dicMod, sMode=sMode, dicVars=dicVars)
+            # endwith
+            eval_cache.Invalidate()
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing modifier '{sModType}'", xChildEx=xEx)
         # endtry
@@ -82,26 +89,49 @@ def ModifyNodeTree(_ngX, _lMods, sMode="INIT", dicVars=None):
 
 
 ############################################################################################
-@logFunctionCall
-def ModifyNodeGroup(_ngX, _lMods, sMode="INIT", dicVars=None):
-
-    if _lMods is None:
-        return
+# Get the working copy of a node group, which is modified instead of the original.
+# The copy is only created on the first modification, and modified in place afterwards.
+def _GetNodeGroupCopy(_ngX):
+    sNgCopy = g_dicNodeGroupCopies.get(_ngX.name)
+    if sNgCopy is not None:
+        ngMod = bpy.data.node_groups.get(sNgCopy)
+        # The Blender file may have been reloaded since the copy was created
+        if ngMod is not None and ngMod.get(g_sPropSourceNodeGroup) == _ngX.name:
+            return ngMod
+        # endif
     # endif
 
     # Make a copy of the node group which is modified,
     # to be able to revert back to the original later.
     ngMod = _ngX.copy()
+    ngMod[g_sPropSourceNodeGroup] = _ngX.name
+    g_dicNodeGroupCopies[_ngX.name] = ngMod.name
     # Ensure that original is not deleted by Blender
     _ngX.use_fake_user = True
     # Replace all references to the original node group in blend file
     # by the new modified node group.
     _ngX.user_remap(ngMod)
     # Update the view layer
-    bpy.context.view_layer.update()
+    cbu_vl.Update()
+
+    return ngMod
+
+
+# enddef
+
+
+############################################################################################
+@logFunctionCall
+def ModifyNodeGroup(_ngX, _lMods, sMode="INIT", dicVars=None):
+
+    if _lMods is None:
+        return
+    # endif
+
+    ngMod = _GetNodeGroupCopy(_ngX)
 
     if len(_lMods) > 0:
-        _Print(f"Applying modifiers to nodegroup: {_ngX.name}")
+        log.Debug("Applying modifiers to nodegroup: {}", _ngX.name)
     # endif
 
     ModifyNodeTree(ngMod, _lMods, sMode=sMode, dicVars=dicVars)
@@ -27,34 +27,103 @@
 ###
 
 import bpy
+import json
 import mathutils
+from typing import Optional
 
 from anybase.cls_any_error import CAnyError, CAnyError_Message
 from anybase import convert
 import ison
 from . import util
+from . import eval_cache
 
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
 
 
-# concentrate print functionality for further generic logging concept
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
+
+# Dictionary of (object name, apply mode, modifier index) to the tuple of
+# (resolved modifier arguments, object state) after the last application
+# of modifiers that set 'bSkipUnchanged' to true.
+g_dicLastApplied: dict[tuple[str, str, int], tuple[str, tuple]] = {}
+
+
+############################################################################################
+# Forget the last applications of all modifiers. This has to be called when a new
+# configuration starts, as the Blender file is reverted between configurations.
+def ResetSkipState():
+    g_dicLastApplied.clear()
+
+
+# enddef
+
+
+############################################################################################
+# Get a string representation of the resolved modifier arguments,
+# or None if they cannot be serialized.
+def _GetModifierArgs(_dicMod: dict) -> Optional[str]:
+    try:
+        return json.dumps({k: v for k, v in _dicMod.items() if not k.startswith("__")}, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    # endtry
+
+
+# enddef
+
+
+############################################################################################
+# Get the state of an object and its parents, which object modifiers typically change.
+# Returns None if the object or one of its parents is animated or driven,
+# since their state then also depends on the scene frame.
+def _GetObjectState(_objX) -> Optional[tuple]:
+    lState = []
+    objX = _objX
+    while objX is not None:
+        xAnim = objX.animation_data
+        if xAnim is not None and (xAnim.action is not None or len(xAnim.drivers) > 0):
+            return None
+        # endif
+
+        lState.append(
+            (
+                objX.name,
+                tuple(tuple(x) for x in objX.matrix_basis),
+                objX.hide_render,
+                objX.hide_viewport,
+                objX.data.name if objX.data is not None else None,
+                tuple(x.material.name if x.material is not None else None for x in objX.material_slots),
+            )
+        )
+        objX = objX.parent
+    # endwhile
+
+    return tuple(lState)
+
+
+# enddef
 
 
 ############################################################################################
+# Apply a list of modifiers to an object.
+# A modifier that sets 'bSkipUnchanged' to true is not applied again in the same mode,
+# if its resolved arguments are the same as for its last application, and the object
+# has not been changed since then, by animation or other modifiers.
+# Use this only for modifiers that only depend on their arguments,
+# and do not accumulate changes, like setting a location.
 @logFunctionCall
 def ModifyObject(_objX, _lMods, sMode="INIT", dicVars=None):
     if _lMods is None:
-        return
+        return 0
     # endif
 
     if len(_lMods) > 0:
-        _Print(f"\nApplying modifiers to object: {_objX.name}")
+        log.Debug("\nApplying modifiers to object: {}", _objX.name)
     # endif
 
+    iApplyCnt = 0
     for iModIdx, dicMod in enumerate(_lMods):
         if not isinstance(dicMod, dict):
             continue
@@ -73,16 +142,30 @@ def ModifyObject(_objX, _lMods, sMode="INIT", dicVars=None):
 
         bEnabled = convert.DictElementToBool(dicMod, "bEnabled", bDefault=True)
         if bEnabled is False:
-            _Print(f"-- DISABLED: NOT applying modifier '{sModType}' to object: {_objX.name}")
+            log.Debug("-- DISABLED: NOT applying modifier '{}' to object: {}", sModType, _objX.name)
             continue
         # endif
 
         lApplyModes = dicMod.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            _Print(f"-- {sMode}: NOT applying modifier '{sModType}' to object: {_objX.name}")
+            log.Debug("-- {}: NOT applying modifier '{}' to object: {}", sMode, sModType, _objX.name)
             continue
         # endif
-        _Print(f">> {sMode}: Applying modifier '{sModType}' to object: {_objX.name}")
+
+        tSkipKey = None
+        if convert.DictElementToBool(dicMod, "bSkipUnchanged", bDefault=False) is True:
+            sArgs = _GetModifierArgs(dicMod)
+            tState = _GetObjectState(_objX)
+            if sArgs is not None and tState is not None:
+                tSkipKey = (_objX.name, sMode, iModIdx)
+                if g_dicLastApplied.get(tSkipKey) == (sArgs, tState):
+                    log.Debug("-- {}: Skipping unchanged modifier '{}' for object: {}", sMode, sModType, _objX.name)
+                    continue
+                # endif
+            # endif
+        # endif
+
+        log.Debug(">> {}: Applying modifier '{}' to object: {}", sMode, sModType, _objX.name)
 
         funcModify = util.GetModifyFunction(sModType, "/catharsys/blender/modify/object/*:*")
         if funcModify is None:
@@ -90,13 +173,28 @@ def ModifyObject(_objX, _lMods, sMode="INIT", dicVars=None):
         # endif
 
         try:
-            funcModify(_objX, dicMod, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("object", sModType, sMode):
+                funcModify(_objX, dicMod, sMode=sMode, dicVars=dicVars)
+            # endwith
+            eval_cache.InvalidateObject(_objX)
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing modifier '{sModType}'", xChildEx=xEx)
         # endtry
+        iApplyCnt += 1
+
+        if tSkipKey is not None:
+            tState = _GetObjectState(_objX)
+            if tState is not None:
+                g_dicLastApplied[tSkipKey] = (sArgs, tState)
+            else:
+                g_dicLastApplied.pop(tSkipKey, None)
+            # endif
+        # endif
 
     # endfor lMods
 
+    return iApplyCnt
+
 
 # enddef
 
@@ -116,40 +214,44 @@ def ModifyObjects(_dicModifyObjects, sMode="INIT", dicVars=None):
         sFilePath = dicLocals.get("filepath")
     # endif
 
-    for sObjId in _dicModifyObjects:
-        if sObjId.startswith("__"):
-            continue
-        # endif
-
-        try:
-            objX = dicObj.get(sObjId)
-            if objX is None:
-                raise Exception("Object with id '{0}' not found".format(sObjId))
+    # Coalesce the view layer updates of all object modifiers into a single update
+    with cbu_vl.DeferredUpdates(), log.CLogSummary(sMode, "object modifiers", "objects") as xSummary:
+        for sObjId in _dicModifyObjects:
+            if sObjId.startswith("__"):
+                continue
             # endif
 
-            lMods = _dicModifyObjects.get(sObjId)
-            if not isinstance(lMods, list):
-                raise CAnyError_Message(sMsg=f"Expect modifier list for object '{sObjId}'")
-            # endif
+            try:
+                objX = dicObj.get(sObjId)
+                if objX is None:
+                    raise Exception("Object with id '{0}' not found".format(sObjId))
+                # endif
 
-            for dicMod in lMods:
-                if isinstance(dicMod, dict):
-                    ison.util.data.AddLocalGlobalVars(dicMod, _dicModifyObjects, bThrowOnDisallow=False)
-                # else:
-                    # raise CAnyError_Message(sMsg=f"Expect modifier list for object '{sObjId}' to contain dictionaries")
+                lMods = _dicModifyObjects.get(sObjId)
+                if not isinstance(lMods, list):
+                    raise CAnyError_Message(sMsg=f"Expect modifier list for object '{sObjId}'")
                 # endif
-            # endfor
 
-            ModifyObject(objX, lMods, sMode=sMode, dicVars=dicVars)
+                for dicMod in lMods:
+                    if isinstance(dicMod, dict):
+                        ison.util.data.AddLocalGlobalVars(dicMod, _dicModifyObjects, bThrowOnDisallow=False)
+                    # else:
+                        # raise CAnyError_Message(sMsg=f"Expect modifier list for object '{sObjId}' to contain dictionaries")
+                    # endif
+                # endfor
 
-        except Exception as xEx:
-            sMsg = f"Error executing modifiers for object '{sObjId}' in mode '{sMode}'"
-            if isinstance(sFilePath, str):
-                sMsg += f"\n> See file: {sFilePath}"
-            # endif
-            raise CAnyError_Message(sMsg=sMsg, xChildEx=xEx)
-        # endtry
-    # endfor objects
+                iApplyCnt = ModifyObject(objX, lMods, sMode=sMode, dicVars=dicVars)
+                xSummary.AddTarget(iApplied=iApplyCnt, iTotal=len(lMods))
+
+            except Exception as xEx:
+                sMsg = f"Error executing modifiers for object '{sObjId}' in mode '{sMode}'"
+                if isinstance(sFilePath, str):
+                    sMsg += f"\n> See file: {sFilePath}"
+                # endif
+                raise CAnyError_Message(sMsg=sMsg, xChildEx=xEx)
+            # endtry
+        # endfor objects
+    # endwith
 
 
 # enddef
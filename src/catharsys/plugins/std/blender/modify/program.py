@@ -27,6 +27,8 @@
 ###
 
 import copy
+import json
+import hashlib
 import ison
 import anybase
 import anybase.config
@@ -34,9 +36,15 @@ from anybase import convert
 from anybase.cls_anycml import CAnyCML
 from anybase.cls_any_error import CAnyError_Message
 from . import util as modutil
+from . import eval_cache
 from ..generate import util as genutil
+from ..util import log
+from ..util import profiling
 
 import enum
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 
 class EModifierType(enum.Enum):
@@ -50,31 +58,242 @@ class EModifierType(enum.Enum):
 
 
 ############################################################################################
+# A single compiled program element
+@dataclass
+class CProgramElement:
+    iModIdx: int
+    sDTI: Optional[str] = None
+    eModType: EModifierType = EModifierType.NONE
+    funcHandler: Optional[Callable] = None
+    # The element data with local and global variables added
+    dicData: Optional[dict] = None
+    # True, if the element data references variables and has to be parsed with the evaluator results
+    bHasVarRefs: bool = False
+    # Names of the variables an evaluator returns. None if they are not known in advance.
+    setOutputs: Optional[set[str]] = None
+    # Indices of the evaluators and generators whose results this element depends on
+    lDependIdx: list[int] = field(default_factory=list)
+    # Error raised when compiling the element. It is raised when the element is executed.
+    xError: Optional[Exception] = None
+    # Results of an evaluator or generator from its last call, per apply mode
+    dicLastResult: dict[str, Any] = field(default_factory=dict)
+    # Apply modes the element has been executed in
+    setApplied: set[str] = field(default_factory=set)
+
+
+# endclass
+
+
+############################################################################################
+# A compiled program
+@dataclass
+class CProgram:
+    # Deep copy of the program configuration
+    dicProgram: dict
+    lElements: Optional[list[CProgramElement]]
+
+
+# endclass
+
+
+# Compiled programs by hash of the program configuration.
+# The modify lists pass a new dictionary on every call, so the programs are identified
+# by their content. Variable references to evaluator results are still unresolved at
+# this point, so the content of a program only changes if its configuration changes.
+g_dicPrograms: OrderedDict[str, CProgram] = OrderedDict()
+g_iMaxProgramCnt: int = 64
+
+
+############################################################################################
+# Remove all compiled programs. This has to be called when a new configuration starts,
+# as the state of skipped modifiers refers to the objects of the previous configuration.
+def Reset():
+    g_dicPrograms.clear()
+
+
+# enddef
+
+
+############################################################################################
+def _GetStringsWithVarRefs(_xData, _lStrings: list[str]):
+    if isinstance(_xData, str):
+        if "$" in _xData:
+            _lStrings.append(_xData)
+        # endif
+    elif isinstance(_xData, dict):
+        for sKey, xValue in _xData.items():
+            _GetStringsWithVarRefs(sKey, _lStrings)
+            _GetStringsWithVarRefs(xValue, _lStrings)
+        # endfor
+    elif isinstance(_xData, list):
+        for xValue in _xData:
+            _GetStringsWithVarRefs(xValue, _lStrings)
+        # endfor
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+def _CompileElement(_iModIdx: int, _dicMod: dict, _dicProgram: dict) -> CProgramElement:
+    xElement = CProgramElement(iModIdx=_iModIdx)
+
+    try:
+        sDTI = _dicMod.get("sDTI")
+        if not isinstance(sDTI, str):
+            raise RuntimeError("Element 'sDTI' not given for modifier {} in program".format(_iModIdx))
+        # endif
+
+        dicData = _dicMod.get("mData")
+        if not isinstance(dicData, dict):
+            raise RuntimeError("Element 'mData' not given for modifier {} in program".format(_iModIdx))
+        # endif
+
+        sElTypeName: str = None
+        eModType = EModifierType.NONE
+        if anybase.config.IsDti(sDTI, "/catharsys/blender/modify/evaluate:*"):
+            eModType = EModifierType.EVALUATOR
+            sElTypeName = "Evaluator"
+        elif anybase.config.IsDti(sDTI, "/catharsys/blender/modify/?:*"):
+            eModType = EModifierType.MODIFIER
+            sElTypeName = "Modifier"
+        elif anybase.config.IsDti(sDTI, "/catharsys/blender/generate/?:*"):
+            eModType = EModifierType.GENERATOR
+            sElTypeName = "Generator"
+        else:
+            raise RuntimeError("Type '{}' not supported in modifier program element {}".format(sDTI, _iModIdx))
+        # endif
+
+        if eModType in [EModifierType.EVALUATOR, EModifierType.MODIFIER]:
+            funcHandler = modutil.GetModifyFunction(sDTI, "/catharsys/blender/modify/?:*")
+        elif eModType == EModifierType.GENERATOR:
+            funcHandler = genutil.GetGenerateClassFunc(sDTI, "/catharsys/blender/generate/?:*")
+        # endif
+
+        if funcHandler is None:
+            raise RuntimeError(f"{sElTypeName} type '{sDTI}' not supported in modifier program element {_iModIdx}")
+        # endif
+
+        ison.util.data.AddLocalGlobalVars(dicData, _dicProgram, bThrowOnDisallow=False)
+        ison.util.data.AddLocalGlobalVars(dicData, _dicMod, bThrowOnDisallow=False)
+
+        xElement.sDTI = sDTI
+        xElement.eModType = eModType
+        xElement.funcHandler = funcHandler
+        xElement.dicData = dicData
+        xElement.bHasVarRefs = modutil.HasVarRefs(dicData)
+
+        if eModType == EModifierType.EVALUATOR:
+            # Evaluators return one result per variable id
+            xElement.setOutputs = set(x for x in dicData if not x.startswith("__"))
+        # endif
+
+    except Exception as xEx:
+        xElement.xError = xEx
+    # endtry
+
+    return xElement
+
+
+# enddef
+
+
+############################################################################################
+def _GetProgramKey(_dicProgram: dict) -> str:
+    sData = json.dumps(_dicProgram, sort_keys=True, default=str)
+    return hashlib.sha256(sData.encode("utf-8")).hexdigest()
+
+
+# enddef
+
+
+############################################################################################
+# Get the compiled program for the given program configuration.
+# The program is compiled once per configuration content.
+def _GetProgram(_dicProgram: dict) -> CProgram:
+    sKey = _GetProgramKey(_dicProgram)
+    xProgram = g_dicPrograms.get(sKey)
+    if xProgram is not None:
+        g_dicPrograms.move_to_end(sKey)
+        return xProgram
+    # endif
+
+    dicProgram = copy.deepcopy(_dicProgram)
+    lMods = dicProgram.get("lModifier")
+
+    lElements = None
+    if lMods is not None:
+        lElements = []
+        for iModIdx, dicMod in enumerate(lMods):
+            xElement = _CompileElement(iModIdx, dicMod, dicProgram)
+
+            # Find the evaluators and generators this element depends on
+            if xElement.bHasVarRefs is True:
+                lStrings = []
+                _GetStringsWithVarRefs(xElement.dicData, lStrings)
+                for xProducer in lElements:
+                    if xProducer.eModType not in [EModifierType.EVALUATOR, EModifierType.GENERATOR]:
+                        continue
+                    # endif
+                    if xProducer.setOutputs is None or any(
+                        sVarId in sText for sVarId in xProducer.setOutputs for sText in lStrings
+                    ):
+                        xElement.lDependIdx.append(xProducer.iModIdx)
+                    # endif
+                # endfor
+            # endif
+
+            lElements.append(xElement)
+        # endfor
+    # endif
+
+    xProgram = CProgram(dicProgram=dicProgram, lElements=lElements)
+    g_dicPrograms[sKey] = xProgram
+    while len(g_dicPrograms) > g_iMaxProgramCnt:
+        g_dicPrograms.popitem(last=False)
+    # endwhile
+
+    return xProgram
+
+
+# enddef
+
+
+############################################################################################
+# Execute a modifier program.
+# The program is compiled once, so that the element types and functions are only resolved once,
+# and only elements that reference variables are parsed with the evaluator results.
+# If the program sets 'bSkipUnchanged' to true, a modifier element is only applied again in the
+# same mode, if the results of the evaluators and generators it depends on have changed.
+# Use this only for modifiers that do not accumulate changes, like setting a location.
 def Execute(_dicProgram, sMode="INIT", dicVars=None):
     if _dicProgram is None:
         return
     # endif
 
-    dicProgram = copy.deepcopy(_dicProgram)
+    xProgram = _GetProgram(_dicProgram)
+    dicProgram = xProgram.dicProgram
 
-    lMods = dicProgram.get("lModifier")
-    if lMods is None:
-        print("WARNING: No modifiers specified in program")
+    if xProgram.lElements is None:
+        log.LogLimited("program-no-modifiers", log.ELogLevel.WARNING, "WARNING: No modifiers specified in program")
         return
     # endif
 
     bEnabled = convert.DictElementToBool(dicProgram, "bEnabled", bDefault=True)
     if bEnabled is False:
-        print("-- DISABLED: NOT applying modifier program to object")
+        log.Debug("-- DISABLED: NOT applying modifier program to object")
         return
     # endif
 
     lApplyModes = dicProgram.get("lApplyModes", ["INIT", "FRAME_UPDATE"])
     if "*" not in lApplyModes and sMode not in lApplyModes:
-        print(f"-- {sMode}: NOT applying program modifier. Specified modes are: {lApplyModes}")
+        log.Debug("-- {}: NOT applying program modifier. Specified modes are: {}", sMode, lApplyModes)
         return
     # endif
-    print(f">> {sMode}: Applying program modifier")
+    log.Debug(">> {}: Applying program modifier", sMode)
+
+    bSkipUnchanged = convert.DictElementToBool(dicProgram, "bSkipUnchanged", bDefault=False)
 
     sFilePath = None
     dicLocals = dicProgram.get("__locals__")
@@ -83,67 +302,61 @@ def Execute(_dicProgram, sMode="INIT", dicVars=None):
     # endif
 
     dicEvalVars = {}
+    # Indices of evaluators and generators whose results changed since their last call in this mode
+    setChanged = set()
 
-    for iModIdx, dicMod in enumerate(lMods):
+    for xElement in xProgram.lElements:
+        iModIdx = xElement.iModIdx
         try:
-            sDTI = dicMod.get("sDTI")
-            if not isinstance(sDTI, str):
-                raise RuntimeError("Element 'sDTI' not given for modifier {} in program".format(iModIdx))
+            if xElement.xError is not None:
+                raise xElement.xError
             # endif
 
-            dicData = dicMod.get("mData")
-            if not isinstance(dicData, dict):
-                raise RuntimeError("Element 'mData' not given for modifier {} in program".format(iModIdx))
-            # endif
+            eModType = xElement.eModType
+            funcHandler = xElement.funcHandler
+            sDTI = xElement.sDTI
 
-            sElTypeName: str = None
-            eModType = EModifierType.NONE
-            if anybase.config.IsDti(sDTI, "/catharsys/blender/modify/evaluate:*"):
-                eModType = EModifierType.EVALUATOR
-                sElTypeName = "Evaluator"
-            elif anybase.config.IsDti(sDTI, "/catharsys/blender/modify/?:*"):
-                eModType = EModifierType.MODIFIER
-                sElTypeName = "Modifier"
-            elif anybase.config.IsDti(sDTI, "/catharsys/blender/generate/?:*"):
-                eModType = EModifierType.GENERATOR
-                sElTypeName = "Generator"
-            else:
-                raise RuntimeError("Type '{}' not supported in modifier program element {}".format(sDTI, iModIdx))
+            if (
+                bSkipUnchanged is True
+                and eModType == EModifierType.MODIFIER
+                and sMode in xElement.setApplied
+                and not any(iIdx in setChanged for iIdx in xElement.lDependIdx)
+            ):
+                log.Debug("-- {}: Skipping unchanged program modifier {} of type '{}'", sMode, iModIdx, sDTI)
+                continue
             # endif
 
-            if eModType in [EModifierType.EVALUATOR, EModifierType.MODIFIER]:
-                funcHandler = modutil.GetModifyFunction(sDTI, "/catharsys/blender/modify/?:*")
-            elif eModType == EModifierType.GENERATOR:
-                funcHandler = genutil.GetGenerateClassFunc(sDTI, "/catharsys/blender/generate/?:*")
-            # endif
-
-            if funcHandler is None:
-                raise RuntimeError(f"{sElTypeName} type '{sDTI}' not supported in modifier program element {iModIdx}")
-            # endif
-
-            ison.util.data.AddLocalGlobalVars(dicData, dicProgram, bThrowOnDisallow=False)
-            ison.util.data.AddLocalGlobalVars(dicData, dicMod, bThrowOnDisallow=False)
-
-            if len(dicEvalVars) > 0:
+            if xElement.bHasVarRefs is True and len(dicEvalVars) > 0:
                 xParser = CAnyCML(dicConstVars=dicEvalVars)
-                dicData = xParser.Process(dicData)
+                dicData = xParser.Process(xElement.dicData)
+            else:
+                # The handlers get a copy, so that they cannot change the compiled program
+                dicData = copy.deepcopy(xElement.dicData)
             # endif
 
             try:
-                if eModType == EModifierType.EVALUATOR:
-                    dicResultVars = funcHandler(dicData, sMode=sMode, dicVars=dicVars)
-                    if len(dicResultVars) > 0:
-                        dicEvalVars.update(dicResultVars)
+                if eModType in [EModifierType.EVALUATOR, EModifierType.GENERATOR]:
+                    with profiling.CMeasure("program", sDTI, sMode):
+                        dicResultVars = funcHandler(dicData, sMode=sMode, dicVars=dicVars)
+                    # endwith
+                    if eModType == EModifierType.GENERATOR:
+                        # Generators may replace objects referenced by cached evaluator results
+                        eval_cache.Invalidate()
                     # endif
-                    # print(dicEvalVars)
-                elif eModType == EModifierType.GENERATOR:
-                    dicResultVars = funcHandler(dicData, sMode=sMode, dicVars=dicVars)
                     if len(dicResultVars) > 0:
                         dicEvalVars.update(dicResultVars)
                     # endif
+                    if bSkipUnchanged is True and xElement.dicLastResult.get(sMode) != dicResultVars:
+                        setChanged.add(iModIdx)
+                        xElement.dicLastResult[sMode] = dicResultVars
+                    # endif
+                    # print(dicEvalVars)
                 else:
-                    funcHandler(dicData, sMode=sMode, dicVars=dicVars)
+                    with profiling.CMeasure("program", sDTI, sMode):
+                        funcHandler(dicData, sMode=sMode, dicVars=dicVars)
+                    # endwith
                 # endif
+                xElement.setApplied.add(sMode)
             except Exception as xEx:
                 raise CAnyError_Message(
                     sMsg="Error executing program modifier {} of type '{}'".format(iModIdx, sDTI),
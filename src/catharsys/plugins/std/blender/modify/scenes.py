@@ -32,16 +32,13 @@ import ison
 from anybase import convert
 from anybase.cls_any_error import CAnyError_Message
 from . import util
+from . import eval_cache
 
 from catharsys.decs.decorator_log import logFunctionCall
+from catharsys.plugins.std.blender.util import log
+from catharsys.plugins.std.blender.util import profiling
 
 
-# concentrate print functionality for further generic logging concept
-def _Print(_sMsg: str):
-    print(_sMsg)
-    logFunctionCall.PrintLog(_sMsg)
-    pass
-
 
 # enddef
 
@@ -54,7 +51,7 @@ def ModifyScene(_scnX, _lMods, sMode="INIT", dicVars=None):
     # endif
 
     if len(_lMods) > 0:
-        _Print(f"Applying modifiers to scene: {_scnX.name}")
+        log.Debug("Applying modifiers to scene: {}", _scnX.name)
     # endif
 
     for dicMod in _lMods:
@@ -65,16 +62,16 @@ def ModifyScene(_scnX, _lMods, sMode="INIT", dicVars=None):
 
         bEnabled = convert.DictElementToBool(dicMod, "bEnabled", bDefault=True)
         if bEnabled is False:
-            _Print(f"-- DISABLED: NOT applying modifier '{sModType}'")
+            log.Debug("-- DISABLED: NOT applying modifier '{}'", sModType)
             continue
         # endif
 
         lApplyModes = dicMod.get("lApplyModes", ["INIT"])
         if "*" not in lApplyModes and sMode not in lApplyModes:
-            _Print(f"-- {sMode}: NOT applying modifier '{sModType}'")
+            log.Debug("-- {}: NOT applying modifier '{}'", sMode, sModType)
             continue
         # endif
-        _Print(f">> {sMode}: Applying modifier '{sModType}'")
+        log.Debug(">> {}: Applying modifier '{}'", sMode, sModType)
 
         funcModify = util.GetModifyFunction(sModType, "/catharsys/blender/modify/scene/*:*")
         if funcModify is None:
@@ -82,7 +79,10 @@ def ModifyScene(_scnX, _lMods, sMode="INIT", dicVars=None):
         # endif
 
         try:
-            funcModify(_scnX, dicMod, sMode=sMode, dicVars=dicVars)
+            with profiling.CMeasure("scene", sModType, sMode):
+                funcModify(_scnX, dicMod, sMode=sMode, dicVars=dicVars)
+            # endwith
+            eval_cache.Invalidate()
         except Exception as xEx:
             raise CAnyError_Message(sMsg=f"Error executing modifier '{sModType}'", xChildEx=xEx)
         # endtry
@@ -26,22 +26,162 @@
 # </LICENSE>
 ###
 
-from anybase import plugin, config
+from typing import Optional
+
+from anybase.cls_anycml import CAnyCML
+from catharsys.plugins.std.blender.util import entry_point
+from catharsys.plugins.std.blender.util import viewlayer as cbu_vl
 
 
 ############################################################################################
 def GetModifyFunction(_sModTypeDti, _sDtiClass):
 
-    if config.CheckDti(_sModTypeDti, _sDtiClass)["bOK"] is False:
+    if entry_point.CheckDti(_sModTypeDti, _sDtiClass) is False:
         raise RuntimeError(
             "Modifier '{}' is not of type '{}'".format(_sModTypeDti, _sDtiClass)
         )
     # endif
 
-    epModifier = plugin.SelectEntryPointFromDti(
-        sGroup="catharsys.blender.modify", sTrgDti=_sModTypeDti, sTypeDesc="Modifier"
-    )
-    return epModifier.load()
+    # Pending view layer updates are performed before calling modifiers that may read world matrices
+    return cbu_vl.GetFlushingFunction(entry_point.LoadEntryPoint("catharsys.blender.modify", _sModTypeDti, "Modifier"))
 
 
 # enddef
+
+
+############################################################################################
+# Test whether a modifier is enabled and applies in the given mode.
+# Values that are not yet resolved, e.g. strings with variable references,
+# are regarded as active, so that the modifier handler decides.
+def IsModifierActive(_dicMod: dict, _sMode: str, _lDefaultModes: list = ["INIT"]) -> bool:
+    if _dicMod.get("bEnabled", True) is False:
+        return False
+    # endif
+
+    lApplyModes = _dicMod.get("lApplyModes", _lDefaultModes)
+    if not isinstance(lApplyModes, list):
+        return True
+    # endif
+
+    for sApplyMode in lApplyModes:
+        if sApplyMode == "*" or sApplyMode == _sMode or (isinstance(sApplyMode, str) and "$" in sApplyMode):
+            return True
+        # endif
+    # endfor
+
+    return False
+
+
+# enddef
+
+
+############################################################################################
+# Create a copy of a modifier group dictionary of the form { [target id]: [modifier list] },
+# that only contains the modifiers that are active in the given mode.
+# Targets without active modifiers are removed. Elements whose keys start with '__',
+# like local and global variables, are copied as they are.
+# Returns None, if no target has an active modifier.
+def FilterModifierTargets(_dicGroup: dict, _sMode: str) -> Optional[dict]:
+    dicResult = {}
+    bHasMods = False
+    for sKey, xValue in _dicGroup.items():
+        if sKey.startswith("__"):
+            dicResult[sKey] = xValue
+            continue
+        # endif
+
+        if not isinstance(xValue, list):
+            # Let the modifier handler report the invalid configuration
+            dicResult[sKey] = xValue
+            bHasMods = True
+            continue
+        # endif
+
+        lMods = [dicMod for dicMod in xValue if not isinstance(dicMod, dict) or IsModifierActive(dicMod, _sMode)]
+        if len(lMods) > 0:
+            dicResult[sKey] = lMods
+            bHasMods = True
+        # endif
+    # endfor
+
+    if bHasMods is False:
+        return None
+    # endif
+
+    return dicResult
+
+
+# enddef
+
+
+############################################################################################
+# Returns the program modifier dictionary, if it is active in the given mode, otherwise None.
+def FilterProgram(_dicProgram: dict, _sMode: str) -> Optional[dict]:
+    if IsModifierActive(_dicProgram, _sMode, ["INIT", "FRAME_UPDATE"]) is False:
+        return None
+    # endif
+    return _dicProgram
+
+
+# enddef
+
+
+############################################################################################
+# Returns True if any key or string value in the data contains
+# a '$', i.e. may reference variables that are only known at runtime.
+def HasVarRefs(_xData) -> bool:
+    if isinstance(_xData, str):
+        return "$" in _xData
+    elif isinstance(_xData, dict):
+        return any(HasVarRefs(xKey) or HasVarRefs(xValue) for xKey, xValue in _xData.items())
+    elif isinstance(_xData, list):
+        return any(HasVarRefs(xValue) for xValue in _xData)
+    # endif
+    return False
+
+
+# enddef
+
+
+############################################################################################
+# A list of modifiers that is applied repeatedly with different iteration variables,
+# for example per object of a collection. Only the modifiers that reference variables
+# are parsed per iteration, all others are used as they are.
+# The modifiers are parsed together with the local and global variables of the
+# modifier '_dicMod' that contains the list as element 'lModifiers'.
+class CModifierTemplate:
+    ########################################################################################
+    def __init__(self, _dicMod: dict):
+        self.lModifiers: list = _dicMod["lModifiers"]
+        self.lDynamicIdx: list[int] = [
+            iIdx for iIdx, dicMod in enumerate(self.lModifiers) if isinstance(dicMod, dict) and HasVarRefs(dicMod)
+        ]
+        # The local and global variables of the modifier
+        self.dicVarDefs: dict = {sKey: _dicMod[sKey] for sKey in ["__locals__", "__globals__"] if sKey in _dicMod}
+
+    # enddef
+
+    ########################################################################################
+    # Get the modifier list with the given iteration variables substituted
+    def Instantiate(self, _dicIterVars: dict) -> list:
+        if len(self.lDynamicIdx) == 0:
+            return self.lModifiers
+        # endif
+
+        dicParse = dict(self.dicVarDefs)
+        dicParse["lModifiers"] = [self.lModifiers[iIdx] for iIdx in self.lDynamicIdx]
+
+        xParser = CAnyCML(dicConstVars=_dicIterVars)
+        lParsed = xParser.Process(dicParse, lProcessPaths=["lModifiers"])[0]["lModifiers"]
+
+        lModifiers = list(self.lModifiers)
+        for iIdx, dicMod in zip(self.lDynamicIdx, lParsed):
+            lModifiers[iIdx] = dicMod
+        # endfor
+
+        return lModifiers
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \run-blender-convert-assets.py
+# Created Date: Monday, October 19th 2026, 9:12:41 am
+# Author: Christian Perwass (CR/AEC5)
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+try:
+    import _bpy
+    import bpy
+except Exception:
+    print("Script has to be run from within blender.")
+# endtry
+
+import sys
+import json
+import argparse
+import traceback
+from pathlib import Path
+
+from catharsys.plugins.std.blender.generate.func import object_std
+from catharsys.plugins.std.blender.generate.func import collection_std
+
+
+################################################################################################################
+# Parse Arguments
+parseMain = argparse.ArgumentParser(
+    prog="cathy blender convert", description="Catharsys Blender asset conversion", exit_on_error=False
+)
+parseMain.add_argument("--mode", dest="mode", nargs=1, choices=["list", "convert"], required=True)
+parseMain.add_argument("--job", dest="job", nargs=1, required=True)
+parseMain.add_argument("--result", dest="result", nargs=1, required=True)
+
+if "--" not in sys.argv:
+    raise RuntimeError("No arguments given for asset conversion script")
+# endif
+
+argsMain = parseMain.parse_args(sys.argv[sys.argv.index("--") + 1 :])
+sMode: str = argsMain.mode[0]
+pathResult = Path(argsMain.result[0])
+
+with open(argsMain.job[0], "r") as xFile:
+    dicJob: dict = json.load(xFile)
+# endwith
+
+
+################################################################################################################
+def SaveResult(_dicResult: dict):
+    pathTemp = pathResult.with_suffix(".tmp")
+    with pathTemp.open("w") as xFile:
+        json.dump(_dicResult, xFile)
+    # endwith
+    pathTemp.replace(pathResult)
+
+
+# enddef
+
+
+################################################################################################################
+if sMode == "list":
+    lItems: list[dict] = []
+    for dicImport in dicJob["lImportConfigs"]:
+        for pathFile, dicCfg in collection_std.GetFolderTypeHierarchyImports(dicImport):
+            lItems.append({"sFilePath": pathFile.as_posix(), "mConfig": dicCfg})
+        # endfor
+    # endfor
+    SaveResult({"lItems": lItems})
+
+else:
+    # The result file is written after each file, so that the files converted
+    # before a crash of Blender are still reported.
+    lResults: list[dict] = []
+    for dicItem in dicJob["lItems"]:
+        sFilePath: str = dicItem["sFilePath"]
+        try:
+            bConverted = object_std.ConvertToAssetCache(Path(sFilePath), dicItem["mConfig"])
+            sStatus = "converted" if bConverted else "cached"
+            lResults.append({"sFilePath": sFilePath, "sStatus": sStatus, "sMessage": ""})
+        except Exception as xEx:
+            lResults.append(
+                {
+                    "sFilePath": sFilePath,
+                    "sStatus": "failed",
+                    "sMessage": "".join(traceback.format_exception_only(type(xEx), xEx)).strip(),
+                }
+            )
+        # endtry
+        SaveResult({"lResults": lResults})
+    # endfor
+# endif
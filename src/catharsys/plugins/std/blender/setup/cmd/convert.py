@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \setup\cmd\convert.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+
+g_sCmdDesc = "Converts OBJ, FBX and glTF assets in parallel Blender processes and stores them in an asset cache"
+
+
+####################################################################
+def AddArgParseArguments(_parseArgs):
+
+    _parseArgs.add_argument("import_config", nargs=1, help="Configuration file of the folder import generator")
+    _parseArgs.add_argument("-c", "--config", nargs=1, dest="config", default=[None])
+    _parseArgs.add_argument("-p", "--path", nargs=1, dest="workspace_path", default=[None])
+    _parseArgs.add_argument("-v", "--version", nargs=1, dest="version", default=[None])
+    _parseArgs.add_argument("-a", "--asset-path", nargs=1, dest="asset_path", default=[None])
+    _parseArgs.add_argument("-o", "--cache-path", nargs=1, dest="cache_path", default=[None])
+    _parseArgs.add_argument("-j", "--jobs", nargs=1, dest="jobs", default=["4"])
+    _parseArgs.add_argument("-n", "--files-per-process", nargs=1, dest="files_per_process", default=["20"])
+
+
+# enddef
+
+
+####################################################################
+def RunCmd(_argsCmd, _lArgs):
+    from pathlib import Path
+    from . import convert_impl as impl
+    from catharsys.setup import args
+
+    argsSubCmd = args.ParseCmdArgs(_argsCmd=_argsCmd, _lArgs=_lArgs, _funcAddArgs=AddArgParseArguments)
+
+    try:
+        iJobs = int(argsSubCmd.jobs[0])
+        iFilesPerProcess = int(argsSubCmd.files_per_process[0])
+    except Exception:
+        raise RuntimeError("The number of jobs and files per process have to be integers")
+    # endtry
+
+    dicArgs = {}
+
+    dicArgs["sPathImportConfig"] = argsSubCmd.import_config[0]
+    dicArgs["sPathProject"] = argsSubCmd.workspace_path[0]
+    dicArgs["sConfig"] = argsSubCmd.config[0]
+    dicArgs["sVersion"] = argsSubCmd.version[0]
+    dicArgs["sPathAssets"] = argsSubCmd.asset_path[0]
+    dicArgs["sPathCache"] = argsSubCmd.cache_path[0]
+    dicArgs["iJobs"] = max(1, iJobs)
+    dicArgs["iFilesPerProcess"] = max(1, iFilesPerProcess)
+
+    dicArgs["pathCwd"] = Path.cwd()
+
+    impl.Convert(dicArgs)
+
+
+# enddef
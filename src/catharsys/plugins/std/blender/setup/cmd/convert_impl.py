@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \setup\cmd\convert_impl.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import sys
+
+if sys.version_info < (3, 10):
+    import importlib_resources as res
+else:
+    from importlib import resources as res
+# endif
+
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tqdm import tqdm
+
+from catharsys.setup import conda
+from catharsys.plugins.std.blender.config.cls_blender import CBlenderConfig
+from catharsys.plugins.std.blender.config.cls_exec_blender import CConfigExecBlender
+from catharsys.config.cls_project import CProjectConfig
+from catharsys.config.cls_launch import CConfigLaunch
+import catharsys.plugins.std.blender
+
+from anybase import config
+from anybase.cls_anycml import CAnyCML
+from anybase.cls_any_error import CAnyError_Message
+
+g_sDtiImportFolder: str = "/catharsys/blender/generate/collection/import/folder-type-hierarchy:*"
+
+
+############################################################################
+# Get the Blender configuration of the first Blender execution file of the launch actions,
+# which has the given Blender version, or any version if none is given.
+def _GetBlenderConfig(_xPrjCfg: CProjectConfig, _sTrgVersion: Optional[str]) -> CBlenderConfig:
+    xLaunch = CConfigLaunch()
+    try:
+        xLaunch.LoadFile(_xPrjCfg)
+    except Exception as xEx:
+        raise CAnyError_Message(sMsg=f"Error loading 'launch.*' file at path: {_xPrjCfg.sLaunchPath}", xChildEx=xEx)
+    # endtry
+
+    xParser = CAnyCML()
+    dicActions = xLaunch.GetActionDict()
+    for sAct in dicActions:
+        sExecFile = dicActions[sAct]["mConfig"].get("sExecFile")
+        if sExecFile is None:
+            continue
+        # endif
+
+        pathCfg = _xPrjCfg.pathLaunch / sExecFile
+        try:
+            dicExecCfg = config.Load(pathCfg)
+        except Exception as xEx:
+            raise CAnyError_Message(
+                sMsg="Error loading launch arguments file '{}' at path: {}".format(sExecFile, pathCfg.as_posix()),
+                xChildEx=xEx,
+            )
+        # endtry
+
+        dicResult = config.CheckConfigType(dicExecCfg, "/catharsys/exec/blender/*:2.1")
+        if dicResult["bOK"] is False:
+            continue
+        # endif
+
+        xExecCfg = CConfigExecBlender(xParser.Process(dicExecCfg))
+        if isinstance(_sTrgVersion, str) and _sTrgVersion != xExecCfg.sBlenderVersion:
+            continue
+        # endif
+
+        return CBlenderConfig(
+            pathLA=_xPrjCfg.pathLaunch,
+            sBlenderPath=xExecCfg.sBlenderPath,
+            sBlenderVersion=xExecCfg.sBlenderVersion,
+            sCondaEnvName=conda.GetActiveEnvName(),
+        )
+    # endfor
+
+    raise RuntimeError(
+        "Blender version '{}' not found in launch configuration at path: {}".format(
+            _sTrgVersion, _xPrjCfg.pathLaunch.as_posix()
+        )
+    )
+
+
+# enddef
+
+
+############################################################################
+# Get the folder import configurations from a configuration file, which either contains
+# a single folder import configuration, or a generator configuration with a list of generators.
+def _GetImportConfigs(_pathCfg: Path) -> list[dict]:
+    dicCfg = CAnyCML().Process(config.Load(_pathCfg))
+
+    lGens = dicCfg.get("lGenerators")
+    if not isinstance(lGens, list):
+        return [dicCfg]
+    # endif
+
+    return [x for x in lGens if isinstance(x, dict) and config.IsDti(x.get("sDTI", ""), g_sDtiImportFolder)]
+
+
+# enddef
+
+
+############################################################################
+# Run the conversion script with the given job data in a background Blender process.
+# Returns the result data written by the script, or None if it wrote none.
+def _RunScript(
+    _xBlenderCfg: CBlenderConfig, _pathScript: Path, _sMode: str, _dicJob: dict, _pathCwd: Path
+) -> Optional[dict]:
+    iFd, sFpJob = tempfile.mkstemp(suffix=".json", prefix="cathy-convert-")
+    with os.fdopen(iFd, "w") as xFile:
+        json.dump(_dicJob, xFile)
+    # endwith
+    sFpResult = sFpJob[: -len(".json")] + "-result.json"
+
+    try:
+        _xBlenderCfg.ExecBlender(
+            sCwd=_pathCwd.as_posix(),
+            sPathScript=_pathScript.as_posix(),
+            lScriptArgs=["--mode", _sMode, "--job", sFpJob, "--result", sFpResult],
+            bBackground=True,
+            bDoPrint=False,
+            bDoPrintOnError=True,
+        )
+
+        dicResult = None
+        if os.path.exists(sFpResult):
+            with open(sFpResult, "r") as xFile:
+                dicResult = json.load(xFile)
+            # endwith
+        # endif
+    finally:
+        for sFp in [sFpJob, sFpResult]:
+            if os.path.exists(sFp):
+                os.remove(sFp)
+            # endif
+        # endfor
+    # endtry
+
+    return dicResult
+
+
+# enddef
+
+
+############################################################################
+# Convert a chunk of asset files in a background Blender process.
+# Returns the list of results with the elements 'sFilePath', 'sStatus' and 'sMessage'.
+def _ConvertChunk(_xBlenderCfg: CBlenderConfig, _pathScript: Path, _lItems: list[dict], _pathCwd: Path) -> list[dict]:
+    dicResult = _RunScript(_xBlenderCfg, _pathScript, "convert", {"lItems": _lItems}, _pathCwd)
+    lResults: list[dict] = [] if dicResult is None else dicResult["lResults"]
+
+    # Files the Blender process did not report on, e.g. because it crashed, have failed
+    setReported = set(x["sFilePath"] for x in lResults)
+    for dicItem in _lItems:
+        if dicItem["sFilePath"] not in setReported:
+            lResults.append(
+                {"sFilePath": dicItem["sFilePath"], "sStatus": "failed", "sMessage": "Blender process terminated"}
+            )
+        # endif
+    # endfor
+
+    return lResults
+
+
+# enddef
+
+
+############################################################################
+def Convert(_dicArgs: dict):
+    sPathProject = _dicArgs.get("sPathProject")
+    sConfig = _dicArgs.get("sConfig")
+    pathCwd: Path = _dicArgs["pathCwd"]
+
+    xPrjCfg = CProjectConfig()
+    if sPathProject is None and sConfig is None:
+        # Uses CWD as launch path
+        xPrjCfg.FromLaunchPath(None)
+    else:
+        # If project path is None, uses CWD as project path
+        xPrjCfg.FromConfigName(xPathMain=sPathProject, sConfigName=sConfig)
+    # endif
+
+    xBlenderCfg = _GetBlenderConfig(xPrjCfg, _dicArgs.get("sVersion"))
+
+    pathImportCfg = Path(_dicArgs["sPathImportConfig"])
+    if not pathImportCfg.is_absolute():
+        pathImportCfg = pathCwd / pathImportCfg
+    # endif
+
+    lImportCfgs = _GetImportConfigs(pathImportCfg)
+    if len(lImportCfgs) == 0:
+        raise RuntimeError(f"No folder import configuration found in file: {(pathImportCfg.as_posix())}")
+    # endif
+
+    for dicImport in lImportCfgs:
+        if _dicArgs.get("sPathAssets") is not None:
+            dicImport["sPath"] = _dicArgs["sPathAssets"]
+        # endif
+        dicImport["sPath"] = (pathCwd / dicImport["sPath"]).as_posix()
+
+        sPathCache = _dicArgs.get("sPathCache") or dicImport.get("sAssetCachePath")
+        if not isinstance(sPathCache, str):
+            raise RuntimeError("No asset cache path given in the import configuration or as command argument")
+        # endif
+        dicImport["sAssetCachePath"] = (pathCwd / sPathCache).as_posix()
+    # endfor
+
+    xScript = res.files(catharsys.plugins.std.blender).joinpath("scripts").joinpath("run-blender-convert-assets.py")
+    with res.as_file(xScript) as pathScript:
+        # The asset files and their import configurations are determined by the folder import generator itself,
+        # so that the cache keys are identical to the ones used when rendering.
+        print("Collecting asset files...")
+        dicList = _RunScript(xBlenderCfg, pathScript, "list", {"lImportConfigs": lImportCfgs}, pathCwd)
+        if dicList is None:
+            raise RuntimeError("Error collecting the asset files in Blender")
+        # endif
+        lItems: list[dict] = dicList["lItems"]
+
+        print(f"Converting {len(lItems)} asset files with {_dicArgs['iJobs']} Blender processes")
+
+        # Files that are already in the asset cache are skipped by the Blender processes,
+        # so an interrupted conversion can simply be started again.
+        iChunkSize: int = _dicArgs["iFilesPerProcess"]
+        lChunks = [lItems[i : i + iChunkSize] for i in range(0, len(lItems), iChunkSize)]
+        dicCounts = {"converted": 0, "cached": 0, "failed": 0}
+        lFailed: list[dict] = []
+
+        xPool = ThreadPoolExecutor(max_workers=_dicArgs["iJobs"])
+        with tqdm(total=len(lItems), unit="file") as xProgress, xPool:
+            lFutures = [xPool.submit(_ConvertChunk, xBlenderCfg, pathScript, x, pathCwd) for x in lChunks]
+            for xFuture in as_completed(lFutures):
+                lResults = xFuture.result()
+                for dicResult in lResults:
+                    dicCounts[dicResult["sStatus"]] += 1
+                    if dicResult["sStatus"] == "failed":
+                        lFailed.append(dicResult)
+                    # endif
+                # endfor
+                xProgress.update(len(lResults))
+                xProgress.set_postfix(dicCounts)
+            # endfor
+        # endwith
+    # endwith
+
+    for dicResult in lFailed:
+        print(f"FAILED: {dicResult['sFilePath']}\n    {dicResult['sMessage']}")
+    # endfor
+
+    print("Converted: {converted}, already cached: {cached}, failed: {failed}".format(**dicCounts))
+
+
+# enddef
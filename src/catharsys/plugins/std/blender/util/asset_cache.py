@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\asset_cache.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Cache of converted assets.
+# Importing OBJ, FBX and glTF files and post-processing the imported objects is slow.
+# The processed objects are therefore stored in a Blender file in a cache folder.
+# The name of the file is a hash of the source file content, the content of all files
+# in the same folder with the same stem, e.g. an OBJ material file, the import parameters
+# and the Blender version. A JSON file with the same name lists the stored objects.
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import bpy
+
+from . import log
+
+g_sCacheVersion: str = "1"
+
+# The environment variable with the default cache path
+g_sEnvCachePath: str = "CATHARSYS_BLENDER_ASSET_CACHE"
+
+# Dictionary of (file path, modification time, size) to file content hash
+g_dicFileHashes: dict[tuple[str, int, int], str] = {}
+
+
+############################################################################################
+# Get the asset cache path from the 'sAssetCachePath' element of an import configuration,
+# or from the environment variable CATHARSYS_BLENDER_ASSET_CACHE.
+# Returns None if no cache path is given.
+def GetCachePath(_dicCfg: dict) -> Optional[Path]:
+    sPath = _dicCfg.get("sAssetCachePath")
+    if not isinstance(sPath, str):
+        sPath = os.environ.get(g_sEnvCachePath)
+    # endif
+
+    if not isinstance(sPath, str) or len(sPath.strip()) == 0:
+        return None
+    # endif
+
+    return Path(sPath).absolute()
+
+
+# enddef
+
+
+############################################################################################
+def _GetFileHash(_pathFile: Path) -> str:
+    xStat = _pathFile.stat()
+    tKey = (_pathFile.as_posix(), xStat.st_mtime_ns, xStat.st_size)
+    sHash = g_dicFileHashes.get(tKey)
+    if sHash is None:
+        xHash = hashlib.sha256()
+        with _pathFile.open("rb") as xFile:
+            for xChunk in iter(lambda: xFile.read(1 << 20), b""):
+                xHash.update(xChunk)
+            # endfor
+        # endwith
+        sHash = g_dicFileHashes[tKey] = xHash.hexdigest()
+    # endif
+
+    return sHash
+
+
+# enddef
+
+
+############################################################################################
+# Get the cache key of a source file imported with the given parameters.
+# The parameters must be serializable to JSON.
+def GetKey(_pathFile: Path, _dicParams: dict) -> str:
+    lFiles = [_pathFile]
+    lFiles.extend(
+        sorted(x for x in _pathFile.parent.glob(f"{_pathFile.stem}.*") if x != _pathFile and x.is_file())
+    )
+
+    dicKey = {
+        "sVersion": g_sCacheVersion,
+        "sBlenderVersion": ".".join(str(x) for x in bpy.app.version[0:2]),
+        "lFiles": [(x.name, _GetFileHash(x)) for x in lFiles],
+        "mParams": _dicParams,
+    }
+
+    return hashlib.sha256(json.dumps(dicKey, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# enddef
+
+
+############################################################################################
+def _GetFilePaths(_pathCache: Path, _sKey: str) -> tuple[Path, Path]:
+    return (_pathCache / f"{_sKey}.blend", _pathCache / f"{_sKey}.json")
+
+
+# enddef
+
+
+############################################################################################
+def Exists(_pathCache: Path, _sKey: str) -> bool:
+    return all(x.is_file() for x in _GetFilePaths(_pathCache, _sKey))
+
+
+# enddef
+
+
+############################################################################################
+# Load the objects stored for the given key into the active collection.
+# Returns the names of the top-level objects, or None if the key is not in the cache.
+def Load(_pathCache: Path, _sKey: str) -> Optional[list[str]]:
+    pathBlend, pathInfo = _GetFilePaths(_pathCache, _sKey)
+    if not pathBlend.is_file() or not pathInfo.is_file():
+        return None
+    # endif
+
+    try:
+        with pathInfo.open("r") as xFile:
+            dicInfo = json.load(xFile)
+        # endwith
+        lAllObjects: list[str] = dicInfo["lAllObjects"]
+        lObjects: list[str] = dicInfo["lObjects"]
+    except Exception as xEx:
+        log.Warn("Invalid asset cache file '{}': {}", pathInfo.as_posix(), str(xEx))
+        return None
+    # endtry
+
+    with bpy.data.libraries.load(pathBlend.as_posix(), link=False) as (xFrom, xTo):
+        if any(x not in xFrom.objects for x in lAllObjects):
+            log.Warn("Asset cache file '{}' is incomplete", pathBlend.as_posix())
+            return None
+        # endif
+        xTo.objects = lAllObjects
+    # endwith
+
+    # Blender adds a suffix to the names of loaded objects, if the names are already in use
+    dicNames: dict[str, str] = {}
+    clnActive = bpy.context.view_layer.active_layer_collection.collection
+    for sName, objX in zip(lAllObjects, xTo.objects):
+        clnActive.objects.link(objX)
+        dicNames[sName] = objX.name
+    # endfor
+
+    log.Debug("Loaded asset from cache: {}", pathBlend.as_posix())
+    return [dicNames[x] for x in lObjects]
+
+
+# enddef
+
+
+############################################################################################
+# Store the given top-level objects and all their children for the given key.
+def Save(_pathCache: Path, _sKey: str, _lObjects: list[str], *, _sSource: Optional[str] = None):
+    pathBlend, pathInfo = _GetFilePaths(_pathCache, _sKey)
+    _pathCache.mkdir(parents=True, exist_ok=True)
+
+    lObjects = [bpy.data.objects[x] for x in _lObjects]
+    setAll: set = set(lObjects)
+    for objX in lObjects:
+        setAll.update(objX.children_recursive)
+    # endfor
+    lAllObjects = [x.name for x in setAll]
+
+    # Write to temporary files first, so that processes sharing the cache
+    # never see incomplete files.
+    iFd, sFpTemp = tempfile.mkstemp(suffix=".blend", dir=_pathCache)
+    os.close(iFd)
+    try:
+        # Make the paths of images and other external files absolute, as the file is stored in another folder
+        bpy.data.libraries.write(sFpTemp, setAll, path_remap="ABSOLUTE", compress=True)
+        os.replace(sFpTemp, pathBlend)
+    finally:
+        if os.path.exists(sFpTemp):
+            os.remove(sFpTemp)
+        # endif
+    # endtry
+
+    iFd, sFpTemp = tempfile.mkstemp(suffix=".json", dir=_pathCache)
+    with os.fdopen(iFd, "w") as xFile:
+        json.dump({"sSource": _sSource, "lObjects": _lObjects, "lAllObjects": lAllObjects}, xFile, indent=4)
+    # endwith
+    os.replace(sFpTemp, pathInfo)
+
+    log.Debug("Stored asset in cache: {}", pathBlend.as_posix())
+
+
+# enddef
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\entry_point.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Process-wide cache of loaded plugin entry points.
+# Modifiers, generators and animators are resolved from their DTI for every
+# object and every frame. Selecting and loading an entry point is expensive,
+# so the loaded functions are cached per (group, DTI).
+
+from typing import Any, Optional
+
+from anybase import plugin, config
+
+# Dictionary of (group, DTI) to loaded entry point
+g_dicEntryPoints: dict[tuple[str, str], Any] = {}
+
+# Dictionary of (DTI, DTI class) to DTI check result
+g_dicDtiChecks: dict[tuple[str, str], bool] = {}
+
+# Entry point groups that are pre-loaded for DTIs with the given prefix
+g_dicPreloadGroups: dict[str, list[tuple[str, str]]] = {
+    "/catharsys/blender/modify/": [("catharsys.blender.modify", "Modifier")],
+    "/catharsys/blender/generate/": [
+        ("catharsys.blender.generate_class", "Generator class"),
+        ("catharsys.blender.generate", "Generator"),
+    ],
+    "/catharsys/blender/animate/": [("catharsys.blender.animate", "Animator")],
+}
+
+
+############################################################################################
+# Cached version of config.CheckDti(...)["bOK"]
+def CheckDti(_sDti: str, _sDtiClass: str) -> bool:
+    tKey = (_sDti, _sDtiClass)
+    bOK = g_dicDtiChecks.get(tKey)
+    if bOK is None:
+        bOK = g_dicDtiChecks[tKey] = config.CheckDti(_sDti, _sDtiClass)["bOK"]
+    # endif
+    return bOK
+
+
+# enddef
+
+
+############################################################################################
+# Select and load the entry point of the given group that matches the DTI.
+# The loaded entry point is cached for subsequent calls.
+def LoadEntryPoint(_sGroup: str, _sTrgDti: str, _sTypeDesc: str) -> Any:
+    tKey = (_sGroup, _sTrgDti)
+    xFunc = g_dicEntryPoints.get(tKey)
+    if xFunc is None:
+        epFunc = plugin.SelectEntryPointFromDti(sGroup=_sGroup, sTrgDti=_sTrgDti, sTypeDesc=_sTypeDesc)
+        xFunc = g_dicEntryPoints[tKey] = epFunc.load()
+    # endif
+    return xFunc
+
+
+# enddef
+
+
+############################################################################################
+# Remove all cached entry points, or only those of the given group.
+# This has to be called if entry points are installed or removed while
+# the process is running.
+def InvalidateEntryPoints(_sGroup: Optional[str] = None):
+    global g_dicEntryPoints, g_dicDtiChecks
+
+    if _sGroup is None:
+        g_dicEntryPoints = {}
+        g_dicDtiChecks = {}
+    else:
+        g_dicEntryPoints = {tKey: xFunc for tKey, xFunc in g_dicEntryPoints.items() if tKey[0] != _sGroup}
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+def _CollectDtis(_xData: Any, _setDti: set[str]):
+    if isinstance(_xData, dict):
+        sDti = _xData.get("sDTI")
+        if isinstance(sDti, str) and "$" not in sDti:
+            _setDti.add(sDti)
+        # endif
+        for xValue in _xData.values():
+            _CollectDtis(xValue, _setDti)
+        # endfor
+    elif isinstance(_xData, list):
+        for xValue in _xData:
+            _CollectDtis(xValue, _setDti)
+        # endfor
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+# Load the entry points of all modifier, generator and animator DTIs
+# that appear anywhere in the given configuration data.
+# DTIs that do not resolve to an entry point are ignored here. They raise an error
+# when they are actually used.
+# Returns the number of entry points that are available in the cache.
+def PreloadEntryPoints(_xData: Any) -> int:
+    setDti: set[str] = set()
+    _CollectDtis(_xData, setDti)
+
+    for sDti in setDti:
+        for sPrefix, lGroups in g_dicPreloadGroups.items():
+            if not sDti.startswith(sPrefix):
+                continue
+            # endif
+            for sGroup, sTypeDesc in lGroups:
+                try:
+                    LoadEntryPoint(sGroup, sDti, sTypeDesc)
+                except Exception:
+                    pass
+                # endtry
+            # endfor
+        # endfor
+    # endfor
+
+    return len(g_dicEntryPoints)
+
+
+# enddef
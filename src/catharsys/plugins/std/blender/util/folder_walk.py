@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\folder_walk.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Cache of folder hierarchy walks.
+# Walking a large asset folder hierarchy, e.g. on a network drive, evaluating the include
+# and exclude expressions and loading the per-folder configurations for each folder is slow.
+# The result of a walk is therefore stored in a JSON file together with the state of the
+# folder hierarchy, i.e. the modification times of all folders and the content hashes of
+# all per-folder configuration files. The folder state is scanned in parallel, which is
+# much faster than the original walk, and the stored result is used if the state is unchanged.
+# Adding, removing or renaming a file changes the modification time of its folder.
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from . import log
+
+g_sCacheVersion: str = "1"
+
+# The environment variable with the default cache path
+g_sEnvCachePath: str = "CATHARSYS_BLENDER_FOLDER_CACHE"
+
+# The number of threads used to scan a folder hierarchy
+g_iScanThreadCount: int = 16
+
+
+############################################################################################
+# Get the folder walk cache path from the 'sFolderCachePath' element of a configuration,
+# or from the environment variable CATHARSYS_BLENDER_FOLDER_CACHE. Otherwise, the folder
+# 'folders' in the asset cache path is used, if an asset cache path is given.
+# Returns None if no cache path is given.
+def GetCachePath(_dicCfg: dict) -> Optional[Path]:
+    sPath = _dicCfg.get("sFolderCachePath")
+    if not isinstance(sPath, str):
+        sPath = os.environ.get(g_sEnvCachePath)
+    # endif
+
+    if isinstance(sPath, str) and len(sPath.strip()) > 0:
+        return Path(sPath).absolute()
+    # endif
+
+    # Import here, as the asset cache needs Blender
+    from . import asset_cache
+
+    pathAssetCache: Optional[Path] = asset_cache.GetCachePath(_dicCfg)
+    if pathAssetCache is None:
+        return None
+    # endif
+
+    return pathAssetCache / "folders"
+
+
+# enddef
+
+
+############################################################################################
+# Get the cache key of a walk of the given folder with the given parameters.
+# The parameters must be serializable to JSON.
+def GetKey(_pathTop: Path, _dicParams: dict) -> str:
+    dicKey = {"sVersion": g_sCacheVersion, "sPathTop": _pathTop.as_posix(), "mParams": _dicParams}
+    return hashlib.sha256(json.dumps(dicKey, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# enddef
+
+
+############################################################################################
+# Scan a single folder. Returns the folder modification time, the content hashes of
+# the configuration files and the paths of the sub-folders.
+def _ScanFolder(_sPath: str, _sConfigFilename: Optional[str]) -> tuple[int, dict[str, str], list[str]]:
+    dicCfgHashes: dict[str, str] = {}
+    lFolders: list[str] = []
+
+    with os.scandir(_sPath) as xIter:
+        for xEntry in xIter:
+            if xEntry.is_dir():
+                lFolders.append(xEntry.path)
+
+            elif _sConfigFilename is not None and (
+                xEntry.name == _sConfigFilename or xEntry.name.startswith(_sConfigFilename + ".")
+            ):
+                with open(xEntry.path, "rb") as xFile:
+                    dicCfgHashes[xEntry.name] = hashlib.sha256(xFile.read()).hexdigest()
+                # endwith
+            # endif
+        # endfor
+    # endwith
+
+    return os.stat(_sPath).st_mtime_ns, dicCfgHashes, lFolders
+
+
+# enddef
+
+
+############################################################################################
+# Get the state of a folder hierarchy, as dictionary of relative folder path
+# to folder modification time and configuration file hashes.
+# The configuration files are all files with the given name, with any suffix.
+def GetState(_pathTop: Path, _sConfigFilename: Optional[str] = None) -> dict[str, list]:
+    dicState: dict[str, list] = {}
+    sPathTop: str = _pathTop.as_posix()
+
+    with ThreadPoolExecutor(max_workers=g_iScanThreadCount) as xPool:
+        dicRunning = {xPool.submit(_ScanFolder, sPathTop, _sConfigFilename): sPathTop}
+        while len(dicRunning) > 0:
+            setDone, _ = wait(dicRunning.keys(), return_when=FIRST_COMPLETED)
+            for xFuture in setDone:
+                sPath: str = dicRunning.pop(xFuture)
+                iMTime, dicCfgHashes, lFolders = xFuture.result()
+                dicState[Path(sPath).relative_to(_pathTop).as_posix()] = [iMTime, dicCfgHashes]
+                for sPathSub in lFolders:
+                    dicRunning[xPool.submit(_ScanFolder, sPathSub, _sConfigFilename)] = sPathSub
+                # endfor
+            # endfor
+        # endwhile
+    # endwith
+
+    return dicState
+
+
+# enddef
+
+
+############################################################################################
+# Load the walk result stored for the given key.
+# Returns None if no result is stored, or if the folder state differs from the stored one.
+def Load(_pathCache: Path, _sKey: str, _dicState: dict[str, list]) -> Optional[dict]:
+    pathFile = _pathCache / f"{_sKey}.json"
+    if not pathFile.is_file():
+        return None
+    # endif
+
+    try:
+        with pathFile.open("r") as xFile:
+            dicData = json.load(xFile)
+        # endwith
+    except Exception as xEx:
+        log.Warn(f"Error reading folder walk cache file '{(pathFile.as_posix())}': {(str(xEx))}")
+        return None
+    # endtry
+
+    if dicData.get("mState") != _dicState:
+        return None
+    # endif
+
+    return dicData.get("mResult")
+
+
+# enddef
+
+
+############################################################################################
+# Store the walk result for the given key and folder state.
+# The result must be serializable to JSON.
+def Save(_pathCache: Path, _sKey: str, _dicState: dict[str, list], _dicResult: dict):
+    _pathCache.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so that parallel processes never read a partial file
+    iFd, sFpTemp = tempfile.mkstemp(suffix=".json", dir=_pathCache)
+    try:
+        with os.fdopen(iFd, "w") as xFile:
+            json.dump({"mState": _dicState, "mResult": _dicResult}, xFile)
+        # endwith
+        os.replace(sFpTemp, _pathCache / f"{_sKey}.json")
+    except Exception:
+        if os.path.exists(sFpTemp):
+            os.remove(sFpTemp)
+        # endif
+        raise
+    # endtry
+
+
+# enddef
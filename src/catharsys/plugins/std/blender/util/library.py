@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\library.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Broker for appending data blocks from Blender files.
+# Generators first register the data blocks they will need with Request().
+# LoadRequested() then opens each Blender file only once and appends all data blocks
+# requested from it. The generators obtain their data blocks with Load(), which only
+# opens a Blender file, if some of the data blocks have not been loaded before.
+# Data blocks that have been loaded but were not obtained with Load(),
+# are removed again with ReleaseUnused().
+# Note that data blocks appended in a single load operation share their dependencies,
+# like materials, node groups and meshes. Data blocks that are not requested
+# are appended separately per Load() call, with their own copies of their dependencies.
+
+import os
+import bpy
+from typing import Optional, Union
+
+from . import log
+
+# Dictionary of file path to dictionary of data type, e.g. "collections" or "materials",
+# to requested data block names
+g_dicRequests: dict[str, dict[str, list[str]]] = {}
+
+# Dictionary of file path to dictionary of (data type, name) to loaded data blocks,
+# that have not been obtained with Load() yet
+g_dicLoaded: dict[str, dict[tuple[str, str], bpy.types.ID]] = {}
+
+
+############################################################################################
+def _GetFileKey(_sFilename: str) -> str:
+    return os.path.normcase(os.path.abspath(_sFilename))
+
+
+# enddef
+
+
+############################################################################################
+# Register data blocks that will be loaded with Load() later on.
+def Request(_sFilename: str, _sDataType: str, _lNames: list[str]):
+    dicTypes = g_dicRequests.setdefault(_GetFileKey(_sFilename), {})
+    lNames = dicTypes.setdefault(_sDataType, [])
+    for sName in _lNames:
+        if isinstance(sName, str) and sName not in lNames:
+            lNames.append(sName)
+        # endif
+    # endfor
+
+
+# enddef
+
+
+############################################################################################
+# Append data blocks from a Blender file in a single load operation.
+# The dictionary '_dicNames' maps data types to the list of data block names.
+# Returns a dictionary of (data type, name) to the appended data block.
+# Names that are not available in the file are ignored.
+def _Append(_sFilePath: str, _dicNames: dict[str, list[str]]) -> dict[tuple[str, str], bpy.types.ID]:
+    dicAppend: dict[str, list[str]] = {}
+    with bpy.data.libraries.load(_sFilePath, link=False) as (xFrom, xTo):
+        for sDataType, lNames in _dicNames.items():
+            setAvailable = set(getattr(xFrom, sDataType))
+            lAppend = [x for x in lNames if x in setAvailable]
+            setattr(xTo, sDataType, lAppend)
+            dicAppend[sDataType] = lAppend
+        # endfor
+    # endwith
+
+    dicResult = {}
+    for sDataType, lAppend in dicAppend.items():
+        for sName, xId in zip(lAppend, getattr(xTo, sDataType)):
+            if xId is not None:
+                dicResult[(sDataType, sName)] = xId
+            # endif
+        # endfor
+    # endfor
+
+    return dicResult
+
+
+# enddef
+
+
+############################################################################################
+# Load all data blocks registered with Request(), opening each Blender file only once.
+def LoadRequested():
+    for sFilePath, dicNames in g_dicRequests.items():
+        log.Debug("Loading {} data blocks from library: {}", sum(len(x) for x in dicNames.values()), sFilePath)
+        dicAppended = _Append(sFilePath, dicNames)
+
+        # Data blocks get temporary names until they are obtained with Load(),
+        # so that they do not clash with data blocks created in the meantime.
+        for (sDataType, sName), xId in dicAppended.items():
+            xId.name = f"_cathy_library_{sName}"
+        # endfor
+        g_dicLoaded.setdefault(sFilePath, {}).update(dicAppended)
+    # endfor
+
+    g_dicRequests.clear()
+
+
+# enddef
+
+
+############################################################################################
+# Get data blocks of the given type from a Blender file. Each returned data block is
+# a new copy in the current file. Data blocks loaded by LoadRequested() are returned
+# directly, all others are appended with a single load operation.
+# The returned list contains None for names that are not available in the file.
+# If '_bAllowIndex' is true, names that are not available in the file, but can be
+# converted to an integer, are used as index into the list of available data blocks.
+def Load(
+    _sFilename: str, _sDataType: str, _lNames: list[Union[str, int]], *, _bAllowIndex: bool = False
+) -> list[Optional[bpy.types.ID]]:
+    sFilePath = _GetFileKey(_sFilename)
+    dicLoaded = g_dicLoaded.setdefault(sFilePath, {})
+
+    lResult: list[Optional[bpy.types.ID]] = [None] * len(_lNames)
+    lMissingIdx = []
+    for iIdx, xName in enumerate(_lNames):
+        xId = dicLoaded.pop((_sDataType, xName), None) if isinstance(xName, str) else None
+        if xId is not None:
+            try:
+                # Raises a ReferenceError, if the data block has been removed in the meantime.
+                # If the name is already used, Blender adds a suffix, as for a newly appended data block.
+                xId.name = xName
+                lResult[iIdx] = xId
+                continue
+            except ReferenceError:
+                pass
+            # endtry
+        # endif
+        lMissingIdx.append(iIdx)
+    # endfor
+
+    if len(lMissingIdx) == 0:
+        return lResult
+    # endif
+
+    # Names that are not available are only known after the file has been opened.
+    # So, indices are resolved within the load operation.
+    dicIdxName: dict[int, str] = {}
+    with bpy.data.libraries.load(sFilePath, link=False) as (xFrom, xTo):
+        lAvailable = list(getattr(xFrom, _sDataType))
+
+        for iIdx in lMissingIdx:
+            xName = _lNames[iIdx]
+            if isinstance(xName, str) and xName in lAvailable:
+                dicIdxName[iIdx] = xName
+            elif _bAllowIndex is True:
+                try:
+                    dicIdxName[iIdx] = lAvailable[int(xName)]
+                except (ValueError, TypeError, IndexError):
+                    pass
+                # endtry
+            # endif
+        # endfor
+
+        # Each name can only be appended once per load operation
+        lAppend = list(dict.fromkeys(dicIdxName.values()))
+        setattr(xTo, _sDataType, lAppend)
+    # endwith
+
+    dicAppended = {sName: xId for sName, xId in zip(lAppend, getattr(xTo, _sDataType))}
+    for iIdx, sName in dicIdxName.items():
+        # A data block is only returned once, further requests for the same name are loaded again
+        xId = dicAppended.pop(sName, None)
+        if xId is None:
+            xId = Load(sFilePath, _sDataType, [sName])[0]
+        # endif
+        lResult[iIdx] = xId
+    # endfor
+
+    return lResult
+
+
+# enddef
+
+
+############################################################################################
+# Remove all data blocks loaded by LoadRequested(), which have not been obtained with Load().
+def ReleaseUnused():
+    lRemove = []
+    for dicLoaded in g_dicLoaded.values():
+        for (sDataType, sName), xId in dicLoaded.items():
+            try:
+                if sDataType == "collections":
+                    lRemove.extend(xId.all_objects)
+                # endif
+                lRemove.append(xId)
+            except ReferenceError:
+                pass
+            # endtry
+        # endfor
+        dicLoaded.clear()
+    # endfor
+
+    if len(lRemove) > 0:
+        log.Debug("Removing {} unused library data blocks", len(lRemove))
+        bpy.data.batch_remove(lRemove)
+    # endif
+
+
+# enddef
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\log.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Level-gated logging for the modifier and generator hot paths.
+# Messages are only formatted if their level is enabled, so pass the arguments
+# separately instead of using f-strings, e.g. log.Debug("Object: {}", objX.name).
+# The log level is read from the environment variable CATHARSYS_BLENDER_LOG_LEVEL
+# and can be changed with SetLevel().
+
+import os
+import enum
+from timeit import default_timer as timer
+from typing import Union
+
+from catharsys.decs.decorator_log import logFunctionCall
+
+
+class ELogLevel(enum.IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    NONE = 100
+
+
+# endclass
+
+
+############################################################################################
+def _ToLevel(_xLevel: Union[ELogLevel, str, int]) -> ELogLevel:
+    if isinstance(_xLevel, str):
+        try:
+            return ELogLevel[_xLevel.strip().upper()]
+        except KeyError:
+            raise RuntimeError(
+                "Invalid log level '{}'. Available levels are: {}".format(_xLevel, ", ".join(x.name for x in ELogLevel))
+            )
+        # endtry
+    # endif
+    return ELogLevel(_xLevel)
+
+
+# enddef
+
+
+############################################################################################
+# Get the log level from the environment. An invalid level only gives a warning,
+# so that importing this module never fails.
+def _GetLevelFromEnv() -> ELogLevel:
+    try:
+        return _ToLevel(os.environ.get("CATHARSYS_BLENDER_LOG_LEVEL", "INFO"))
+    except Exception as xEx:
+        print(f"WARNING: {xEx}\n> Using log level INFO instead of the one in CATHARSYS_BLENDER_LOG_LEVEL")
+        return ELogLevel.INFO
+    # endtry
+
+
+# enddef
+
+
+g_eLevelByEnv: ELogLevel = _GetLevelFromEnv()
+g_eLevel: ELogLevel = g_eLevelByEnv
+
+# Dictionary of message key to number of times the message was logged
+g_dicLimitCounts: dict[str, int] = {}
+
+
+############################################################################################
+def SetLevel(_xLevel: Union[ELogLevel, str, int]):
+    global g_eLevel
+    g_eLevel = _ToLevel(_xLevel)
+
+
+# enddef
+
+
+############################################################################################
+def GetLevel() -> ELogLevel:
+    return g_eLevel
+
+
+# enddef
+
+
+############################################################################################
+# The log level given by the environment, or INFO if not given
+def GetLevelByEnv() -> ELogLevel:
+    return g_eLevelByEnv
+
+
+# enddef
+
+
+############################################################################################
+def IsEnabled(_eLevel: ELogLevel) -> bool:
+    return _eLevel >= g_eLevel
+
+
+# enddef
+
+
+############################################################################################
+def Log(_eLevel: ELogLevel, _sMsg: str, *_lArgs):
+    if _eLevel < g_eLevel:
+        return
+    # endif
+
+    sText = _sMsg.format(*_lArgs) if len(_lArgs) > 0 else _sMsg
+    print(sText)
+    logFunctionCall.PrintLog(sText)
+
+
+# enddef
+
+
+############################################################################################
+def Debug(_sMsg: str, *_lArgs):
+    Log(ELogLevel.DEBUG, _sMsg, *_lArgs)
+
+
+# enddef
+
+
+############################################################################################
+def Info(_sMsg: str, *_lArgs):
+    Log(ELogLevel.INFO, _sMsg, *_lArgs)
+
+
+# enddef
+
+
+############################################################################################
+def Warn(_sMsg: str, *_lArgs):
+    Log(ELogLevel.WARNING, "WARNING: " + _sMsg, *_lArgs)
+
+
+# enddef
+
+
+############################################################################################
+# Log a message at most '_iMaxCount' times per process for the given key.
+# The last logged message notes that further messages are suppressed.
+def LogLimited(_sKey: str, _eLevel: ELogLevel, _sMsg: str, *_lArgs, _iMaxCount: int = 5):
+    if _eLevel < g_eLevel:
+        return
+    # endif
+
+    iCount = g_dicLimitCounts.get(_sKey, 0) + 1
+    g_dicLimitCounts[_sKey] = iCount
+    if iCount < _iMaxCount:
+        Log(_eLevel, _sMsg, *_lArgs)
+    elif iCount == _iMaxCount:
+        Log(_eLevel, _sMsg + " (further messages of this kind are suppressed)", *_lArgs)
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+# Collects the number of applied and skipped elements of a processing step,
+# and logs a single summary line at the end of the step, for example:
+#   "FRAME_UPDATE: applied 3 of 5 object modifiers to 5000 objects in 0.80 s"
+# Use it as context manager.
+class CLogSummary:
+    ############################################################################################
+    def __init__(self, _sMode: str, _sElements: str, _sTargets: str, *, eLevel: ELogLevel = ELogLevel.INFO):
+        self.sMode: str = _sMode
+        self.sElements: str = _sElements
+        self.sTargets: str = _sTargets
+        self.eLevel: ELogLevel = eLevel
+        self.iApplied: int = 0
+        self.iTotal: int = 0
+        self.iTargets: int = 0
+        self.dTimeStart: float = 0.0
+
+    # enddef
+
+    ############################################################################################
+    def __enter__(self):
+        self.dTimeStart = timer()
+        return self
+
+    # enddef
+
+    ############################################################################################
+    def __exit__(self, _xType, _xValue, _xTraceback):
+        if _xType is None and self.iTargets > 0:
+            Log(
+                self.eLevel,
+                "{}: applied {} of {} {} to {} {} in {:.2f} s",
+                self.sMode,
+                self.iApplied,
+                self.iTotal,
+                self.sElements,
+                self.iTargets,
+                self.sTargets,
+                timer() - self.dTimeStart,
+            )
+        # endif
+        return False
+
+    # enddef
+
+    ############################################################################################
+    def AddTarget(self, *, iApplied: int, iTotal: int):
+        self.iTargets += 1
+        self.iApplied += iApplied
+        self.iTotal += iTotal
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\path.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+from typing import Union
+from pathlib import Path
+
+
+############################################################################################
+# Get the names of all files in a folder with a single directory scan.
+# This is much faster on network file systems than testing each file separately.
+# Returns an empty set if the folder does not exist.
+def GetFileNames(_xPath: Union[str, Path]) -> set[str]:
+    try:
+        with os.scandir(_xPath) as xIter:
+            return set(xEntry.name for xEntry in xIter if xEntry.is_file())
+        # endwith
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    # endtry
+
+
+# enddef
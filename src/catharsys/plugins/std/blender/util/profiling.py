@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\profiling.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Profiling of modifier, evaluator and generator calls.
+# The call count, total and maximal time is recorded per element kind, DTI and apply mode.
+# Profiling is disabled by default. It is enabled by setting the environment variable
+# CATHARSYS_BLENDER_PROFILE to 1, or by calling Enable().
+
+import os
+import json
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from timeit import default_timer as timer
+from typing import Optional
+
+from . import log
+
+
+@dataclass
+class CProfileEntry:
+    sKind: str
+    sDti: str
+    sMode: str
+    iCount: int = 0
+    dTotalTime: float = 0.0
+    dMaxTime: float = 0.0
+
+
+# endclass
+
+
+# Profiling is enabled by default, if the environment variable CATHARSYS_BLENDER_PROFILE is set
+g_bEnabledByEnv: bool = os.environ.get("CATHARSYS_BLENDER_PROFILE", "0").strip().lower() in ["1", "true", "yes"]
+g_bEnabled: bool = g_bEnabledByEnv
+
+# Dictionary of (kind, DTI, mode) to profile entry
+g_dicEntries: dict[tuple[str, str, str], CProfileEntry] = {}
+
+
+############################################################################################
+def Enable(_bEnable: bool = True):
+    global g_bEnabled
+    g_bEnabled = _bEnable
+
+
+# enddef
+
+
+############################################################################################
+def IsEnabledByEnv() -> bool:
+    return g_bEnabledByEnv
+
+
+# enddef
+
+
+############################################################################################
+def IsEnabled() -> bool:
+    return g_bEnabled
+
+
+# enddef
+
+
+############################################################################################
+def Reset():
+    g_dicEntries.clear()
+
+
+# enddef
+
+
+############################################################################################
+def Add(_sKind: str, _sDti: str, _sMode: str, _dTime: float):
+    tKey = (_sKind, _sDti, _sMode)
+    xEntry = g_dicEntries.get(tKey)
+    if xEntry is None:
+        xEntry = g_dicEntries[tKey] = CProfileEntry(sKind=_sKind, sDti=_sDti, sMode=_sMode)
+    # endif
+
+    xEntry.iCount += 1
+    xEntry.dTotalTime += _dTime
+    xEntry.dMaxTime = max(xEntry.dMaxTime, _dTime)
+
+
+# enddef
+
+
+############################################################################################
+# Context manager that measures the time of a modifier, evaluator or generator call,
+# e.g. with profiling.CMeasure("object", sModType, sMode): ...
+class CMeasure:
+    __slots__ = ("sKind", "sDti", "sMode", "dStart")
+
+    def __init__(self, _sKind: str, _sDti: str, _sMode: str):
+        self.sKind = _sKind
+        self.sDti = _sDti
+        self.sMode = _sMode
+        self.dStart: Optional[float] = None
+
+    # enddef
+
+    def __enter__(self):
+        if g_bEnabled is True:
+            self.dStart = timer()
+        # endif
+        return self
+
+    # enddef
+
+    def __exit__(self, _xType, _xValue, _xTraceback):
+        if self.dStart is not None:
+            Add(self.sKind, self.sDti, self.sMode, timer() - self.dStart)
+        # endif
+        return False
+
+    # enddef
+
+
+# endclass
+
+
+############################################################################################
+# Get the profile entries sorted by decreasing total time
+def GetEntries() -> list[CProfileEntry]:
+    return sorted(g_dicEntries.values(), key=lambda x: x.dTotalTime, reverse=True)
+
+
+# enddef
+
+
+############################################################################################
+def GetTable() -> str:
+    lEntries = GetEntries()
+    iDtiLen = max([len("DTI")] + [len(x.sDti) for x in lEntries])
+    iModeLen = max([len("Mode")] + [len(x.sMode) for x in lEntries])
+    iKindLen = max([len("Kind")] + [len(x.sKind) for x in lEntries])
+
+    sFormat = (
+        "{:<" + str(iKindLen) + "s} {:<" + str(iDtiLen) + "s} {:<" + str(iModeLen) + "s} {:>8s} {:>10s} {:>10s} {:>10s}"
+    )
+    lLines = [sFormat.format("Kind", "DTI", "Mode", "Calls", "Total [s]", "Mean [ms]", "Max [ms]")]
+    for xEntry in lEntries:
+        lLines.append(
+            sFormat.format(
+                xEntry.sKind,
+                xEntry.sDti,
+                xEntry.sMode,
+                str(xEntry.iCount),
+                "{:.3f}".format(xEntry.dTotalTime),
+                "{:.3f}".format(1e3 * xEntry.dTotalTime / xEntry.iCount),
+                "{:.3f}".format(1e3 * xEntry.dMaxTime),
+            )
+        )
+    # endfor
+
+    return "\n".join(lLines)
+
+
+# enddef
+
+
+############################################################################################
+# Print the profile table and save it as JSON file in the given folder.
+# Does nothing if profiling is disabled or nothing has been recorded.
+def Report(_sPath: Optional[str], _sName: str):
+    if g_bEnabled is False or len(g_dicEntries) == 0:
+        return
+    # endif
+
+    log.Info("\n>>> Modifier profile:\n{}\n", GetTable())
+
+    if _sPath is not None:
+        pathFile = Path(_sPath) / f"modifier-profile_{_sName}.json"
+        pathFile.parent.mkdir(parents=True, exist_ok=True)
+        with pathFile.open("w") as xFile:
+            json.dump({"lEntries": [asdict(x) for x in GetEntries()]}, xFile, indent=4)
+        # endwith
+        log.Info("Modifier profile saved to: {}", pathFile.as_posix())
+    # endif
+
+
+# enddef
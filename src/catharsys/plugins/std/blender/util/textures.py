@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\textures.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Texture images by file path.
+# Images are identified by their absolute, normalized file path instead of their name,
+# so that textures with the same file name in different folders do not collide, and
+# the same file is only loaded once. Images loaded by this module are removed again,
+# as soon as they are replaced and not used anymore, so that the memory usage stays
+# bounded when textures are changed for every frame.
+
+import os
+from typing import Optional
+
+import bpy
+
+from . import log
+
+# Dictionary of normalized file path to image name
+g_dicPathImages: dict[str, str] = {}
+
+# Names of the images loaded by this module
+g_setLoadedImages: set[str] = set()
+
+# Names of the unused images that are kept for reuse per pool, from least to most recently used
+g_dicUnusedPools: dict[str, dict[str, None]] = {}
+
+# Dictionary of (normalized file path, maximal size) to the file path of the downscaled image
+g_dicDownscaledFiles: dict[tuple[str, int], str] = {}
+
+
+############################################################################################
+# Forget all images loaded by this module. This has to be called when a new Blender file
+# is loaded, as the image names refer to the images of the previous file.
+# The downscaled image files are kept, as they do not depend on the Blender file.
+def Reset():
+    g_dicPathImages.clear()
+    g_setLoadedImages.clear()
+    g_dicUnusedPools.clear()
+
+
+# enddef
+
+
+############################################################################################
+def _NormPath(_sFilePath: str, _libX: Optional[bpy.types.Library] = None) -> str:
+    sFilePath = bpy.path.abspath(_sFilePath, library=_libX)
+    return os.path.normcase(os.path.normpath(os.path.abspath(sFilePath)))
+
+
+# enddef
+
+
+############################################################################################
+# Find an image with the given normalized file path in the Blender file.
+def _FindImage(_sNormPath: str) -> Optional[bpy.types.Image]:
+    sImgName = g_dicPathImages.get(_sNormPath)
+    if sImgName is not None:
+        imgX = bpy.data.images.get(sImgName)
+        if imgX is not None and _NormPath(imgX.filepath, imgX.library) == _sNormPath:
+            return imgX
+        # endif
+        del g_dicPathImages[_sNormPath]
+    # endif
+
+    # The image may have been loaded with the Blender file or by another module
+    for imgX in bpy.data.images:
+        if imgX.source != "FILE" or len(imgX.filepath) == 0:
+            continue
+        # endif
+
+        sNormPath = _NormPath(imgX.filepath, imgX.library)
+        g_dicPathImages[sNormPath] = imgX.name
+        if sNormPath == _sNormPath:
+            return imgX
+        # endif
+    # endfor
+
+    return None
+
+
+# enddef
+
+
+############################################################################################
+# Get the image of the given file path. The image is only loaded, if no image with
+# the same file path is available in the Blender file.
+# If the file does not exist, the image with the name '_sFallbackName' is returned, if given.
+def Get(_sFilePath: str, *, _sFallbackName: Optional[str] = None) -> bpy.types.Image:
+    sNormPath = _NormPath(_sFilePath)
+    imgX = _FindImage(sNormPath)
+    if imgX is not None:
+        for dicUnusedImages in g_dicUnusedPools.values():
+            dicUnusedImages.pop(imgX.name, None)
+        # endfor
+        return imgX
+    # endif
+
+    if _sFallbackName is not None and not os.path.exists(sNormPath):
+        imgX = bpy.data.images.get(_sFallbackName)
+        if imgX is not None:
+            return imgX
+        # endif
+    # endif
+
+    imgX = bpy.data.images.load(filepath=_sFilePath)
+    g_dicPathImages[sNormPath] = imgX.name
+    g_setLoadedImages.add(imgX.name)
+    log.Debug("Loaded image '{}' from: {}", imgX.name, sNormPath)
+
+    return imgX
+
+
+# enddef
+
+
+############################################################################################
+# Remove the given image, if it was loaded by this module and is not used anymore.
+# If '_iKeepUnusedCount' is larger than zero, the image is kept for reuse instead, and only
+# the least recently used images beyond that number of kept unused images are removed.
+# Unused images are kept per pool '_sPool', so that each cache only trims its own images.
+# Returns True if the given image was removed.
+def Release(_imgX: Optional[bpy.types.Image], *, _iKeepUnusedCount: int = 0, _sPool: str = "") -> bool:
+    if _imgX is None or _imgX.name not in g_setLoadedImages or _imgX.users > 0:
+        return False
+    # endif
+
+    for dicUnusedImages in g_dicUnusedPools.values():
+        dicUnusedImages.pop(_imgX.name, None)
+    # endfor
+    dicUnusedImages = g_dicUnusedPools.setdefault(_sPool, {})
+    dicUnusedImages[_imgX.name] = None
+
+    bRemoved: bool = False
+    while len(dicUnusedImages) > max(_iKeepUnusedCount, 0):
+        sImgName = next(iter(dicUnusedImages))
+        del dicUnusedImages[sImgName]
+
+        imgX = bpy.data.images.get(sImgName)
+        if imgX is None or imgX.users > 0:
+            continue
+        # endif
+
+        bRemoved = bRemoved or sImgName == _imgX.name
+        g_setLoadedImages.discard(sImgName)
+        log.Debug("Removing unused image '{}'", sImgName)
+        bpy.data.images.remove(imgX)
+    # endwhile
+
+    return bRemoved
+
+
+# enddef
+
+
+############################################################################################
+# Get the file path of a version of the given image, whose width and height are at most
+# '_iMaxSize' pixels. The downscaled image is created once and stored in the folder
+# '_sPathTrg', or in the folder of the image if not given. Returns the given file path,
+# if the image is not larger than '_iMaxSize'.
+def GetDownscaledFile(_sFilePath: str, _iMaxSize: int, *, _sPathTrg: Optional[str] = None) -> str:
+    sNormPath = _NormPath(_sFilePath)
+    tKey = (sNormPath, _iMaxSize)
+    sFpTrg = g_dicDownscaledFiles.get(tKey)
+    if sFpTrg is not None:
+        return sFpTrg
+    # endif
+
+    sFolder, sFileName = os.path.split(sNormPath)
+    sStem, sSuffix = os.path.splitext(sFileName)
+    sFpTrg = os.path.join(_sPathTrg or sFolder, f"{sStem}_max{_iMaxSize}px{sSuffix}")
+
+    if not os.path.exists(sFpTrg) or os.path.getmtime(sFpTrg) < os.path.getmtime(sNormPath):
+        imgX = bpy.data.images.load(filepath=sNormPath, check_existing=False)
+        try:
+            iWidth, iHeight = imgX.size
+            if max(iWidth, iHeight) <= _iMaxSize:
+                sFpTrg = _sFilePath
+            else:
+                fScale = _iMaxSize / max(iWidth, iHeight)
+                imgX.scale(max(1, round(iWidth * fScale)), max(1, round(iHeight * fScale)))
+                os.makedirs(os.path.dirname(sFpTrg), exist_ok=True)
+                imgX.filepath_raw = sFpTrg
+                imgX.save()
+                log.Info("Saved downscaled image: {}", sFpTrg)
+            # endif
+        finally:
+            bpy.data.images.remove(imgX)
+        # endtry
+    # endif
+
+    g_dicDownscaledFiles[tKey] = sFpTrg
+    return sFpTrg
+
+
+# enddef
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: \util\viewlayer.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+# Deferred view layer updates.
+# Modifiers update the view layer after changing an object, so that the world
+# matrices are valid for following modifiers. When a modifier is applied to
+# many objects, this results in one depsgraph evaluation per object.
+# Within a DeferredUpdates() block, calls to Update() are coalesced into a
+# single update at the end of the block. Pending updates are performed before
+# every modifier, except for modifiers marked with WritesOnly(), which only set
+# transforms and never read evaluated world matrices or bounding boxes.
+
+import functools
+from contextlib import contextmanager
+
+from anyblend import viewlayer as anyvl
+
+g_iBatchDepth: int = 0
+g_bUpdatePending: bool = False
+
+# Dictionary of modifier function to the function that performs pending updates before calling it
+g_dicFlushingFunctions: dict = {}
+
+
+############################################################################################
+# Update the view layer now, or at the end of the current batch.
+def Update():
+    global g_bUpdatePending
+
+    if g_iBatchDepth > 0:
+        g_bUpdatePending = True
+    else:
+        anyvl.Update()
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+# Perform a pending view layer update immediately.
+def Flush():
+    global g_bUpdatePending
+
+    if g_bUpdatePending is True:
+        g_bUpdatePending = False
+        anyvl.Update()
+    # endif
+
+
+# enddef
+
+
+############################################################################################
+# Context in which view layer updates are deferred. Blocks can be nested;
+# the pending update is performed when the outermost block is left.
+@contextmanager
+def DeferredUpdates():
+    global g_iBatchDepth
+
+    g_iBatchDepth += 1
+    try:
+        yield
+    finally:
+        g_iBatchDepth -= 1
+        if g_iBatchDepth == 0:
+            Flush()
+        # endif
+    # endtry
+
+
+# enddef
+
+
+############################################################################################
+# Decorator that marks a modifier, which only sets transforms and requests view layer
+# updates with Update(), but never reads evaluated world matrices or bounding boxes.
+# Consecutive calls of such modifiers share a single view layer update.
+def WritesOnly(_funcX):
+    _funcX.bViewLayerWritesOnly = True
+    return _funcX
+
+
+# enddef
+
+
+############################################################################################
+# Get a function that performs a pending view layer update and then calls the given
+# modifier function, so that the modifier sees the current world matrices.
+# Modifiers marked with WritesOnly() are returned unchanged.
+def GetFlushingFunction(_funcX):
+    if getattr(_funcX, "bViewLayerWritesOnly", False) is True:
+        return _funcX
+    # endif
+
+    funcFlushing = g_dicFlushingFunctions.get(_funcX)
+    if funcFlushing is None:
+
+        @functools.wraps(_funcX)
+        def funcFlushing(*args, **kwargs):
+            Flush()
+            return _funcX(*args, **kwargs)
+
+        # enddef
+
+        g_dicFlushingFunctions[_funcX] = funcFlushing
+    # endif
+
+    return funcFlushing
+
+
+# enddef
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_render_result_index.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import os
+import re
+import pytest
+
+from src.catharsys.plugins.std.blender.actions.lib.cls_render_result_index import CRenderResultIndex
+
+
+@pytest.fixture
+def render_result_folder(tmp_path):
+    for iFrame in range(3):
+        pathExp = tmp_path / "Frame_{0:04d}".format(iFrame) / "Image"
+        pathExp.mkdir(parents=True)
+        for iExp in range(2):
+            (pathExp / "Exp_{0:02d}.exr".format(iExp)).touch()
+        # endfor
+        (pathExp / "readme.txt").touch()
+    # endfor
+    (tmp_path / "_log").mkdir()
+    return tmp_path
+
+
+def _TouchFolder(_pathFolder):
+    # Ensure that the modification time changes, also on file systems with a coarse time resolution
+    iMTime = os.stat(_pathFolder).st_mtime_ns + 1000000000
+    os.utime(_pathFolder, ns=(iMTime, iMTime))
+
+
+def test_frame_folders(render_result_folder):
+    xIndex = CRenderResultIndex()
+
+    assert xIndex.GetFrameFolders(render_result_folder) == {0: "Frame_0000", 1: "Frame_0001", 2: "Frame_0002"}
+    assert xIndex.GetFrameFolders(render_result_folder, iFrameFirst=1) == {1: "Frame_0001", 2: "Frame_0002"}
+    assert xIndex.GetFrameFolders(render_result_folder, iFrameLast=1, iFrameStep=1) == {
+        0: "Frame_0000",
+        1: "Frame_0001",
+    }
+    assert xIndex.GetFrameFolders(render_result_folder, iFrameStep=2) == {0: "Frame_0000", 2: "Frame_0002"}
+
+
+def test_frame_sub_folder_files(render_result_folder):
+    xIndex = CRenderResultIndex(iMaxWorkers=2)
+
+    dicFiles = xIndex.GetFrameSubFolderFiles(render_result_folder, "Image", re.compile(r"Exp_(\d+)\.exr"))
+    assert sorted(dicFiles) == [0, 1, 2]
+    for iFrame, lFiles in dicFiles.items():
+        assert [os.path.basename(x) for x in lFiles] == ["Exp_00.exr", "Exp_01.exr"]
+    # endfor
+
+    assert xIndex.GetFrameSubFolderFiles(render_result_folder, "Missing", re.compile(r".*")) == {0: [], 1: [], 2: []}
+
+
+def test_cached_folder_is_reused(render_result_folder):
+    xIndex = CRenderResultIndex()
+    pathFolder = render_result_folder / "Frame_0000" / "Image"
+
+    xEntry = xIndex.GetFolder(pathFolder)
+    assert xIndex.GetFolder(pathFolder) is xEntry
+
+
+def test_changed_folder_is_rescanned(render_result_folder):
+    xIndex = CRenderResultIndex()
+    pathFolder = render_result_folder / "Frame_0000" / "Image"
+
+    xEntry = xIndex.GetFolder(pathFolder)
+    (pathFolder / "Exp_02.exr").touch()
+    _TouchFolder(pathFolder)
+
+    xNewEntry = xIndex.GetFolder(pathFolder)
+    assert xNewEntry is not xEntry
+    assert "Exp_02.exr" in xNewEntry.lFiles
+
+
+def test_invalidate(render_result_folder):
+    xIndex = CRenderResultIndex()
+    pathFrame0 = render_result_folder / "Frame_0000" / "Image"
+    pathFrame1 = render_result_folder / "Frame_0001" / "Image"
+
+    xEntry0 = xIndex.GetFolder(pathFrame0)
+    xEntry1 = xIndex.GetFolder(pathFrame1)
+
+    xIndex.Invalidate(render_result_folder / "Frame_0000")
+    assert xIndex.GetFolder(pathFrame0) is not xEntry0
+    assert xIndex.GetFolder(pathFrame1) is xEntry1
+
+    xIndex.Invalidate()
+    assert xIndex.GetFolder(pathFrame1) is not xEntry1
+
+
+def test_removed_folder(render_result_folder):
+    xIndex = CRenderResultIndex()
+    pathFolder = render_result_folder / "_log"
+
+    assert xIndex.GetFolder(pathFolder) is not None
+    pathFolder.rmdir()
+    assert xIndex.GetFolder(pathFolder) is None
+
+
+def test_least_recently_used_folders_are_removed(render_result_folder):
+    xIndex = CRenderResultIndex(iMaxFolderCount=2)
+    lPaths = [render_result_folder / "Frame_{0:04d}".format(iFrame) / "Image" for iFrame in range(3)]
+
+    xEntry0 = xIndex.GetFolder(lPaths[0])
+    xEntry1 = xIndex.GetFolder(lPaths[1])
+    # Use the first folder again, so that the second one is the least recently used
+    assert xIndex.GetFolder(lPaths[0]) is xEntry0
+    xIndex.GetFolder(lPaths[2])
+
+    assert xIndex.GetFolder(lPaths[0]) is xEntry0
+    assert xIndex.GetFolder(lPaths[1]) is not xEntry1
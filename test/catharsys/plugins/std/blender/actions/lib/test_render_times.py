@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_render_times.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import pytest
+
+from src.catharsys.plugins.std.blender.actions.lib.cls_render_times import CRenderTimes
+
+
+def test_empty():
+    xTimes = CRenderTimes()
+
+    assert xTimes.GetRenderCount() == 0
+    assert xTimes.GetTimePerRender() is None
+    assert xTimes.GetTimePerPixelSample() is None
+
+
+def test_averages():
+    xTimes = CRenderTimes()
+    xTimes.Add(_iSceneFrame=0, _iPixelCount=100, _iSamples=10, _dRenderTime=2.0)
+    xTimes.Add(_iSceneFrame=1, _iPixelCount=100, _iSamples=30, _dRenderTime=6.0)
+
+    assert xTimes.GetRenderCount() == 2
+    assert xTimes.GetTimePerRender() == pytest.approx(4.0)
+    assert xTimes.GetTimePerPixelSample() == pytest.approx(8.0 / 4000)
+
+
+def test_reused_renders_are_not_averaged():
+    xTimes = CRenderTimes()
+    xTimes.Add(_iSceneFrame=0, _iPixelCount=100, _iSamples=10, _dRenderTime=2.0)
+    xTimes.Add(_iSceneFrame=1, _iPixelCount=100, _iSamples=10, _dRenderTime=0.01, _bReused=True)
+
+    assert xTimes.GetRenderCount() == 2
+    assert xTimes.GetTimePerRender() == pytest.approx(2.0)
+    assert xTimes.GetTimePerPixelSample() == pytest.approx(2.0 / 1000)
+
+
+def test_renders_without_pixel_count():
+    xTimes = CRenderTimes()
+    xTimes.Add(_iSceneFrame=0, _iPixelCount=None, _iSamples=None, _dRenderTime=2.0)
+
+    assert xTimes.GetTimePerRender() == pytest.approx(2.0)
+    assert xTimes.GetTimePerPixelSample() is None
+
+
+def test_save_and_load_from_path(tmp_path):
+    pathLog = tmp_path / "Cfg" / CRenderTimes.sFolder
+
+    xTimes = CRenderTimes()
+    xTimes.Add(_iSceneFrame=0, _iPixelCount=100, _iSamples=10, _dRenderTime=2.0)
+    xTimes.Add(_iSceneFrame=1, _iPixelCount=100, _iSamples=10, _dRenderTime=0.01, _bReused=True)
+    xTimes.Save(pathLog.as_posix(), "job")
+
+    # Loading an existing file keeps the renders of the previous run
+    xContinued = CRenderTimes()
+    xContinued.Load(pathLog.as_posix(), "job")
+    xContinued.Add(_iSceneFrame=2, _iPixelCount=100, _iSamples=10, _dRenderTime=4.0)
+    xContinued.Save(pathLog.as_posix(), "job")
+
+    xLoaded = CRenderTimes.LoadFromPath(tmp_path)
+    assert xLoaded.GetRenderCount() == 3
+    assert xLoaded.GetTimePerRender() == pytest.approx(3.0)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_nodegroups.py
+# Created Date: Monday, October 19th 2026, 2:31:07 pm
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import bpy
+import pytest
+
+import src.catharsys.plugins.std.blender.modify.nodegroups as nodegroups
+
+
+@pytest.fixture
+def material_with_node_group():
+    ngX = bpy.data.node_groups.new("TestNodeGroup", "ShaderNodeTree")
+    matX = bpy.data.materials.new("TestNodeGroupMaterial")
+    matX.use_nodes = True
+    ndGroup = matX.node_tree.nodes.new("ShaderNodeGroup")
+    ndGroup.node_tree = ngX
+
+    yield ngX, matX, ndGroup
+
+    bpy.data.materials.remove(matX)
+    for ngY in [x for x in bpy.data.node_groups if x.name.startswith("TestNodeGroup")]:
+        bpy.data.node_groups.remove(ngY)
+    # endfor
+
+
+# Regression benchmark: modifying a node group every frame must not create a node group copy per frame
+def test_node_group_count_after_frame_updates(material_with_node_group):
+    ngX, matX, ndGroup = material_with_node_group
+    iFrameCount = 100
+    iNodeGroupCount = len(bpy.data.node_groups)
+
+    nodegroups.ModifyNodeGroup(ngX, [], sMode="INIT")
+    for iFrame in range(iFrameCount):
+        nodegroups.ModifyNodeGroup(ngX, [], sMode="FRAME_UPDATE")
+    # endfor
+
+    assert len(bpy.data.node_groups) == iNodeGroupCount + 1
+
+    # The material uses the working copy, and the original is kept unchanged
+    assert ndGroup.node_tree != ngX
+    assert ndGroup.node_tree.name == nodegroups.g_dicNodeGroupCopies[ngX.name]
+    assert ngX.use_fake_user is True
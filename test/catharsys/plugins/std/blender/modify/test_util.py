@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_util.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import src.catharsys.plugins.std.blender.modify.util as modutil
+
+
+def test_has_var_refs():
+    assert modutil.HasVarRefs("${frame}") is True
+    assert modutil.HasVarRefs({"sName": "Cube"}) is False
+    assert modutil.HasVarRefs({"lValues": [1, 2.0, None, "a"]}) is False
+    assert modutil.HasVarRefs({"lValues": [{"sName": "${name}"}]}) is True
+    assert modutil.HasVarRefs({"${key}": 1}) is True
+
+
+def test_filter_modifier_targets():
+    dicGroup = {
+        "__locals__": {"sName": "Cube"},
+        "Cube": [
+            {"sDTI": "/catharsys/blender/modify/object/location:1.0", "lApplyModes": ["INIT"]},
+            {"sDTI": "/catharsys/blender/modify/object/rotation:1.0", "lApplyModes": ["FRAME_UPDATE"]},
+        ],
+        "Sphere": [
+            {"sDTI": "/catharsys/blender/modify/object/location:1.0", "bEnabled": False},
+        ],
+    }
+
+    dicInit = modutil.FilterModifierTargets(dicGroup, "INIT")
+    assert dicInit["__locals__"] == {"sName": "Cube"}
+    assert [x["sDTI"] for x in dicInit["Cube"]] == ["/catharsys/blender/modify/object/location:1.0"]
+    assert "Sphere" not in dicInit
+
+    dicUpdate = modutil.FilterModifierTargets(dicGroup, "FRAME_UPDATE")
+    assert [x["sDTI"] for x in dicUpdate["Cube"]] == ["/catharsys/blender/modify/object/rotation:1.0"]
+
+    assert modutil.FilterModifierTargets(dicGroup, "RENDER") is None
+
+
+def test_filter_modifier_targets_keeps_unresolved_modes():
+    dicGroup = {"Cube": [{"sDTI": "/catharsys/blender/modify/object/location:1.0", "lApplyModes": ["${mode}"]}]}
+
+    assert modutil.FilterModifierTargets(dicGroup, "FRAME_UPDATE") == dicGroup
+
+
+def test_modifier_template_without_var_refs():
+    dicMod = {"lModifiers": [{"sDTI": "/catharsys/blender/modify/object/location:1.0", "lLocation": [0, 0, 1]}]}
+
+    xTemplate = modutil.CModifierTemplate(dicMod)
+    assert xTemplate.Instantiate({"for-each-object": {"idx": 0, "name": "Cube"}}) is dicMod["lModifiers"]
+
+
+def test_modifier_template_instantiate():
+    dicStatic = {"sDTI": "/catharsys/blender/modify/object/location:1.0", "lLocation": [0, 0, 1]}
+    dicMod = {
+        "__locals__": {"sPrefix": "Obj"},
+        "lModifiers": [
+            dicStatic,
+            {"sDTI": "/catharsys/blender/modify/object/rename:1.0", "sName": "${sPrefix}-${for-each-object:name}"},
+        ],
+    }
+
+    xTemplate = modutil.CModifierTemplate(dicMod)
+    for iIdx, sName in enumerate(["Cube", "Sphere"]):
+        lModifiers = xTemplate.Instantiate({"for-each-object": {"idx": iIdx, "name": sName}})
+        assert lModifiers[0] is dicStatic
+        assert lModifiers[1]["sName"] == f"Obj-{sName}"
+    # endfor
+
+    # The template itself is not changed
+    assert dicMod["lModifiers"][1]["sName"] == "${sPrefix}-${for-each-object:name}"
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_entry_point.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import pytest
+
+import src.catharsys.plugins.std.blender.util.entry_point as entry_point
+
+
+class CFakeEntryPoint:
+    def __init__(self, _sName: str, _dicLoadCounts: dict):
+        self.sName = _sName
+        self.dicLoadCounts = _dicLoadCounts
+
+    def load(self):
+        self.dicLoadCounts[self.sName] = self.dicLoadCounts.get(self.sName, 0) + 1
+        return lambda: self.sName
+
+
+@pytest.fixture
+def load_counts(monkeypatch):
+    dicLoadCounts = {}
+
+    def SelectEntryPointFromDti(*, sGroup, sTrgDti, sTypeDesc):
+        return CFakeEntryPoint(f"{sGroup}:{sTrgDti}", dicLoadCounts)
+
+    monkeypatch.setattr(entry_point.plugin, "SelectEntryPointFromDti", SelectEntryPointFromDti)
+    entry_point.InvalidateEntryPoints()
+    yield dicLoadCounts
+    entry_point.InvalidateEntryPoints()
+
+
+def test_entry_point_is_loaded_once(load_counts):
+    funcA = entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test")
+    assert entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test") is funcA
+    assert funcA() == "group.a:/test/a:1.0"
+    assert load_counts == {"group.a:/test/a:1.0": 1}
+
+    entry_point.LoadEntryPoint("group.a", "/test/b:1.0", "Test")
+    assert load_counts["group.a:/test/b:1.0"] == 1
+
+
+def test_invalidate_all(load_counts):
+    entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test")
+    entry_point.InvalidateEntryPoints()
+    entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test")
+
+    assert load_counts == {"group.a:/test/a:1.0": 2}
+
+
+def test_invalidate_group(load_counts):
+    entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test")
+    entry_point.LoadEntryPoint("group.b", "/test/a:1.0", "Test")
+
+    entry_point.InvalidateEntryPoints("group.a")
+    entry_point.LoadEntryPoint("group.a", "/test/a:1.0", "Test")
+    entry_point.LoadEntryPoint("group.b", "/test/a:1.0", "Test")
+
+    assert load_counts == {"group.a:/test/a:1.0": 2, "group.b:/test/a:1.0": 1}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+###
+# File: test_log.py
+# Created Date: Monday, October 19th 2026
+# <LICENSE id="GPL-3.0">
+#
+#   Image-Render standard Blender actions module
+#   Copyright (C) 2022 Robert Bosch GmbH and its subsidiaries
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# </LICENSE>
+###
+
+import pytest
+
+import src.catharsys.plugins.std.blender.util.log as log
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    lLogged = []
+
+    def Log(_eLevel, _sMsg, *_lArgs):
+        lLogged.append(_sMsg.format(*_lArgs))
+
+    monkeypatch.setattr(log, "Log", Log)
+    monkeypatch.setattr(log, "g_dicLimitCounts", {})
+    eLevel = log.GetLevel()
+    yield lLogged
+    log.SetLevel(eLevel)
+
+
+def test_set_level():
+    eLevel = log.GetLevel()
+    try:
+        log.SetLevel("debug")
+        assert log.GetLevel() == log.ELogLevel.DEBUG
+        assert log.IsEnabled(log.ELogLevel.DEBUG) is True
+
+        log.SetLevel(log.ELogLevel.WARNING)
+        assert log.IsEnabled(log.ELogLevel.INFO) is False
+        assert log.IsEnabled(log.ELogLevel.ERROR) is True
+
+        with pytest.raises(RuntimeError):
+            log.SetLevel("verbose")
+        # endwith
+        assert log.GetLevel() == log.ELogLevel.WARNING
+    finally:
+        log.SetLevel(eLevel)
+    # endtry
+
+
+def test_log_limited(logged):
+    log.SetLevel("INFO")
+    for iIdx in range(5):
+        log.LogLimited("test", log.ELogLevel.WARNING, "Message {}", iIdx, _iMaxCount=3)
+    # endfor
+
+    assert logged == ["Message 0", "Message 1", "Message 2 (further messages of this kind are suppressed)"]
+
+
+def test_log_limited_keys_are_separate(logged):
+    log.SetLevel("INFO")
+    log.LogLimited("a", log.ELogLevel.WARNING, "A", _iMaxCount=1)
+    log.LogLimited("a", log.ELogLevel.WARNING, "A", _iMaxCount=1)
+    log.LogLimited("b", log.ELogLevel.WARNING, "B", _iMaxCount=1)
+
+    assert len(logged) == 2
+
+
+def test_log_limited_below_level(logged):
+    log.SetLevel("ERROR")
+    log.LogLimited("test", log.ELogLevel.WARNING, "Message", _iMaxCount=1)
+    log.SetLevel("INFO")
+    log.LogLimited("test", log.ELogLevel.WARNING, "Message", _iMaxCount=1)
+
+    # Messages below the log level are not counted
+    assert logged == ["Message (further messages of this kind are suppressed)"]